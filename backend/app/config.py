@@ -213,6 +213,24 @@ class Settings(BaseModel):
         le=16384,
         description="Maximum tokens per LLM response"
     )
+
+    LLM_CONTEXT_CACHE_TTL: int = Field(
+        default_factory=lambda: _int_env("LLM_CONTEXT_CACHE_TTL", 3600, 0, 86400),
+        ge=0,
+        description="Seconds to keep the agent's system prompt and tools in Gemini's context cache (0 disables)"
+    )
+
+    LLM_TOOL_CACHE_PATH: str = Field(
+        default_factory=lambda: os.getenv("LLM_TOOL_CACHE_PATH", ""),
+        description="SQLite file caching the agent's FlavorDB/RecipeDB tool results "
+                    "(e.g. backend/data/tool_cache.sqlite; empty disables)"
+    )
+
+    LLM_TOOL_CACHE_DAYS: float = Field(
+        default_factory=lambda: _float_env("LLM_TOOL_CACHE_DAYS", 7.0, 0.0, 365.0),
+        ge=0,
+        description="Days a persisted tool result stays valid"
+    )
     
     # Caching Configuration (Optional)
     ENABLE_CACHE: bool = Field(
@@ -37,7 +37,7 @@ from app.services.recipedb_service import RecipeDBService
 from app.services.health_scorer import HealthScorer
 from app.services.allergen_detector import AllergenDetector
 from app.services.recommendation_engine import RecommendationEngine
-from app.services.ingredient_analyzer import IngredientAnalyzer
+from app.services.ingredient_analyzer import IngredientAnalyzer, RiskyIngredient
 from app.services.flavordb_service import FlavorDBService
 from app.services.flavordb_extended import FlavorDBExtendedService
 from app.services.swap_engine import SwapEngine
@@ -210,7 +210,7 @@ async def analyze_recipe(request: RecipeAnalysisRequest) -> RecipeAnalysisRespon
         logger.info(f"Analyzing recipe: {request.recipe_name}")
         
         # Step 1: Fetch recipe data from RecipeDB
-        recipe_data = recipedb_service.fetch_recipe_by_name(request.recipe_name)
+        recipe_data = await recipedb_service.afetch_recipe_by_name(request.recipe_name)
         if not recipe_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -222,8 +222,7 @@ async def analyze_recipe(request: RecipeAnalysisRequest) -> RecipeAnalysisRespon
         
         # Step 2: Fetch nutrition data
         logger.info(f"Fetching nutrition data for recipe ID: {recipe_id}")
-        nutrition_data = recipedb_service.fetch_nutrition_info(recipe_id)
-        micro_nutrition_data = recipedb_service.fetch_micro_nutrition_info(recipe_id)
+        nutrition_data, micro_nutrition_data = await recipedb_service.afetch_all_nutrition(recipe_id)
         
         # Step 3: Calculate health score using rule-based ML
         logger.info("Calculating health score")
@@ -330,15 +329,14 @@ async def analyze_full(request: FullAnalysisRequest) -> FullAnalysisResponse:
             logger.info(f"Custom input mode with {len(ingredients)} ingredients")
 
             # Try to find this recipe in RecipeDB anyway (for nutrition data)
-            recipe_data = recipedb_service.fetch_recipe_by_name(request.recipe_name)
+            recipe_data = await recipedb_service.afetch_recipe_by_name(request.recipe_name)
             if recipe_data:
                 recipe_id = recipe_data.get("id")
                 source = "recipedb"
                 logger.info(f"Found recipe in RecipeDB with ID: {recipe_id}, fetching nutrition data...")
                 try:
-                    nutrition_data = recipedb_service.fetch_nutrition_info(recipe_id)
+                    nutrition_data, micro_nutrition_data = await recipedb_service.afetch_all_nutrition(recipe_id)
                     logger.info(f"Successfully fetched nutrition data: {nutrition_data.get('calories', 0)} calories")
-                    micro_nutrition_data = recipedb_service.fetch_micro_nutrition_info(recipe_id)
                     logger.info(f"Successfully fetched micronutrient data")
                 except ValueError as e:
                     # ValueError is raised when API returns None (failed request)
@@ -369,7 +367,7 @@ async def analyze_full(request: FullAnalysisRequest) -> FullAnalysisResponse:
         else:
             # RecipeDB lookup mode
             logger.info(f"RecipeDB lookup mode: searching for '{request.recipe_name}'")
-            recipe_data = recipedb_service.fetch_recipe_by_name(request.recipe_name)
+            recipe_data = await recipedb_service.afetch_recipe_by_name(request.recipe_name)
             if not recipe_data:
                 logger.error(f"Recipe '{request.recipe_name}' not found in RecipeDB")
                 raise HTTPException(
@@ -384,9 +382,8 @@ async def analyze_full(request: FullAnalysisRequest) -> FullAnalysisResponse:
             ingredients = recipe_data.get("ingredients", [])
             logger.info(f"Found recipe with ID: {recipe_id}, fetching nutrition data...")
             try:
-                nutrition_data = recipedb_service.fetch_nutrition_info(recipe_id)
+                nutrition_data, micro_nutrition_data = await recipedb_service.afetch_all_nutrition(recipe_id)
                 logger.info(f"Successfully fetched nutrition data: {nutrition_data.get('calories', 0)} calories")
-                micro_nutrition_data = recipedb_service.fetch_micro_nutrition_info(recipe_id)
                 logger.info(f"Successfully fetched micronutrient data")
             except ValueError as e:
                 # ValueError is raised when API returns None (failed request)
@@ -557,7 +554,7 @@ async def analyze_full(request: FullAnalysisRequest) -> FullAnalysisResponse:
             # ── LLM Agent Path ─────────────────────────────────────────
             try:
                 logger.info("🚨 [LLM] Running LLM swap agent (Gemini) for ingredient analysis and swap generation")
-                agent_result = llm_swap_agent.run(
+                agent_result = await llm_swap_agent.arun(
                     recipe_name=request.recipe_name,
                     ingredients=ingredients,
                     nutrition_data=nutrition_data,
@@ -621,7 +618,7 @@ async def analyze_full(request: FullAnalysisRequest) -> FullAnalysisResponse:
                     ingredients,
                 )
                 risky_objs.extend(extra_risky)
-            risky_ingredients = [r.to_dict() for r in risky_objs]
+            risky_ingredients = RiskyIngredient.batch_to_dicts(risky_objs)
 
             # 7. Generate swap suggestions via FlavorDB
             # Now returns ALL ranked alternatives per risky ingredient, not just top-1
@@ -669,10 +666,8 @@ async def analyze_full(request: FullAnalysisRequest) -> FullAnalysisResponse:
 
             # 9. Generate explanation (use LLM if available, else template)
             use_llm_explain = bool(settings.GEMINI_API_KEY)
-            explainer = LLMExplainer(
-                use_templates=not use_llm_explain,
-                api_key=settings.GEMINI_API_KEY if use_llm_explain else None,
-            )
+            # Reuse the module-level Gemini explainer (and its pooled client)
+            explainer = _craving_llm if use_llm_explain else LLMExplainer(use_templates=True)
             if swap_objects_for_projection and improved_score:
                 if use_llm_explain:
                     explanation = explainer.generate_llm_swap_explanation(
@@ -750,8 +745,9 @@ async def swap_ingredients(request: IngredientSwapRequest) -> IngredientSwapResp
     try:
         logger.info(f"Processing swap request for recipe ID: {request.recipe_id}")
         
-        # Step 1: Fetch recipe data
-        recipe_data = recipedb_service.get_recipe_by_id(request.recipe_id)
+        # Step 1: Fetch recipe data (its nutrition is fetched in parallel)
+        full_recipe = await recipedb_service.afetch_full_recipe(request.recipe_id)
+        recipe_data = full_recipe["recipe"]
         if not recipe_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -760,9 +756,11 @@ async def swap_ingredients(request: IngredientSwapRequest) -> IngredientSwapResp
         
         ingredients = recipe_data.get("ingredients", [])
         
-        # Step 2: Fetch current nutrition data
-        nutrition_data = recipedb_service.fetch_nutrition_info(request.recipe_id)
-        micro_nutrition_data = recipedb_service.fetch_micro_nutrition_info(request.recipe_id)
+        # Step 2: Current nutrition data
+        nutrition_data = full_recipe["macro"]
+        micro_nutrition_data = full_recipe["micro"]
+        if nutrition_data is None:
+            raise ValueError(f"Failed to fetch nutrition info for recipe ID: {request.recipe_id}")
         
         # Step 3: Calculate original health score
         original_score = health_scorer.calculate_health_score(
@@ -897,7 +895,7 @@ async def get_recommendations(
         logger.info(f"Fetching recommendations for recipe ID: {recipe_id}")
         
         # Verify recipe exists
-        recipe_data = recipedb_service.get_recipe_by_id(recipe_id)
+        recipe_data = await recipedb_service.aget_recipe_by_id(recipe_id)
         if not recipe_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1029,11 +1027,12 @@ async def recalculate_score(request: RecalculateRequest) -> RecalculateResponse:
         nutrition_data = None
         micro_nutrition_data = None
         try:
-            recipe_data = recipedb_service.fetch_recipe_by_name(request.recipe_name)
+            recipe_data = await recipedb_service.afetch_recipe_by_name(request.recipe_name)
             if recipe_data:
                 recipe_id = recipe_data.get("id")
-                nutrition_data = recipedb_service.fetch_nutrition_info(recipe_id)
-                micro_nutrition_data = recipedb_service.fetch_micro_nutrition_info(recipe_id)
+                nutrition_data, micro_nutrition_data = await recipedb_service.afetch_all_nutrition(
+                    recipe_id
+                )
         except Exception as e:
             logger.warning(f"Could not fetch recipe from RecipeDB: {e}")
             logger.warning("[COSYLAB API FALLBACK] RecipeDB recipe fetch failed for /recalculate. Will use hardcoded fallback nutrition.")
@@ -1518,7 +1517,7 @@ async def craving_replace(request: CravingRequest) -> CravingReplacement:
     """
     try:
         logger.info(f"Craving replacement request: {request.craving_text}")
-        result = craving_service.process_craving(request)
+        result = await craving_service.aprocess_craving(request)
         return result
     except Exception as e:
         logger.error(f"Error processing craving: {str(e)}", exc_info=True)
@@ -1541,7 +1540,7 @@ async def craving_patterns(history: List[CravingHistoryEntry]) -> CravingPattern
         # Optionally enrich with LLM insights
         if _craving_llm and result.weekly_summary:
             try:
-                llm_patterns = _craving_llm.generate_craving_pattern_insights(
+                llm_patterns = await _craving_llm.agenerate_craving_pattern_insights(
                     result.weekly_summary
                 )
                 if llm_patterns:
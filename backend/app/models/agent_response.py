@@ -29,6 +29,31 @@ class AgentSubstitution(BaseModel):
     caveats: Optional[str] = Field(None, description="Any warnings or limitations")
 
 
+class ScientificBasis(BaseModel):
+    """Molecular evidence for a substitution (structured-output schema)."""
+
+    shared_molecules: List[str] = Field(default_factory=list)
+    shared_functional_groups: List[str] = Field(default_factory=list)
+    original_molecule_count: int = Field(0)
+    substitute_molecule_count: int = Field(0)
+    overlap_percentage: float = Field(0.0)
+
+
+class StructuredSubstitution(AgentSubstitution):
+    """AgentSubstitution with a typed scientific_basis, for Gemini's response_schema."""
+
+    scientific_basis: ScientificBasis = Field(default_factory=ScientificBasis)
+
+
+class AgentAnswer(BaseModel):
+    """The agent's final JSON answer (Phase 4 of the system prompt)."""
+
+    substitutions: List[StructuredSubstitution] = Field(default_factory=list)
+    no_substitute_ingredients: List[str] = Field(default_factory=list)
+    overall_confidence: float = Field(0.5, ge=0.0, le=1.0)
+    data_completeness: str = Field("partial", description="full / partial / minimal")
+
+
 class AgentSwapResult(BaseModel):
     """Complete result from the LLM swap agent."""
 
@@ -41,7 +66,12 @@ class AgentSwapResult(BaseModel):
     no_substitute_ingredients: List[str] = Field(
         default_factory=list, description="Ingredients the agent could not find subs for"
     )
-    apis_called: List[str] = Field(default_factory=list)
+    apis_called: List[str] = Field(
+        default_factory=list, description="Distinct tools called, in first-call order"
+    )
+    apis_called_counts: Dict[str, int] = Field(
+        default_factory=dict, description="Number of calls per tool"
+    )
     iterations: int = Field(0)
     raw_reasoning: Optional[str] = Field(None, description="Raw text if JSON parse failed")
 
@@ -158,7 +188,7 @@ class AgentSwapResult(BaseModel):
             )
 
         lines.append(f"\nData completeness: {self.data_completeness} | "
-                      f"APIs called: {len(self.apis_called)} | "
+                      f"APIs called: {sum(self.apis_called_counts.values())} | "
                       f"Agent iterations: {self.iterations}")
         return "\n".join(lines)
 
@@ -168,6 +198,7 @@ class AgentSwapResult(BaseModel):
             "overall_confidence": self.overall_confidence,
             "data_completeness": self.data_completeness,
             "apis_called": self.apis_called,
+            "apis_called_counts": self.apis_called_counts,
             "iterations": self.iterations,
             "substitution_count": len(self.substitutions),
             "no_substitute_count": len(self.no_substitute_ingredients),
@@ -5,13 +5,21 @@ This module defines data models for health score calculations and
 recipe analysis responses.
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
 from typing import Dict, List, Optional
 
 from app.models.recipe import RecipeBasic, RecipeRecommendation
 from app.models.nutrition import NutritionData
 
 
+def _round_scores(breakdown: Dict, precision: int) -> Dict:
+    """Round the float values at the top level of a score breakdown."""
+    return {
+        key: round(float(value), precision) if isinstance(value, float) else value
+        for key, value in breakdown.items()
+    }
+
+
 class HealthScore(BaseModel):
     """
     Health score model.
@@ -68,7 +76,39 @@ class HealthScore(BaseModel):
         
         return self
     
+    @field_serializer('score')
+    def serialize_score(self, score: float) -> float:
+        """Round the score only when the model is dumped."""
+        return round(score, 2)
+    
+    @field_serializer('breakdown')
+    def serialize_breakdown(self, breakdown: Dict) -> Dict:
+        """Round the top-level component scores only when the model is dumped."""
+        return _round_scores(breakdown, 2)
+    
+    def to_dict(self, precision: int = 2) -> Dict:
+        """
+        Convert to a dictionary with scores rounded to the given precision.
+        
+        HealthScorer keeps full precision in the model (useful for ranking
+        ties); rounding happens here and at model serialization.
+        
+        Args:
+            precision: Number of decimals to keep
+            
+        Returns:
+            Dict: score, rating and breakdown
+        """
+        return {
+            "score": round(self.score, precision),
+            "rating": self.rating,
+            "breakdown": _round_scores(self.breakdown, precision)
+        }
+    
     model_config = {
+        # HealthScorer's result cache hands out deep copies; frozen keeps
+        # the top-level fields fixed
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "score": 75.5,
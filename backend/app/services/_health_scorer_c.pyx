@@ -0,0 +1,81 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled macronutrient scoring kernel.
+
+Optional C build of health_scorer._macro_kernel for deployments that want
+the speed without Numba's JIT warm-up or install size. health_scorer
+imports it when present and falls back to Numba / pure Python otherwise.
+
+Build in place from the backend directory:
+    pip install cython
+    cythonize -i app/services/_health_scorer_c.pyx
+
+Do not build with -ffast-math: scores must stay bit-identical to the
+pure-Python kernel.
+"""
+
+# Builtin round (correctly rounded, half-to-even on exact ties), not C round()
+from builtins import round as _py_round
+
+
+cdef inline double _score_range(
+    double value,
+    double min_val,
+    double max_val,
+    double max_points
+) nogil:
+    """Kernel version of HealthScorer._score_nutrient_range."""
+    cdef double distance, tolerance
+    if min_val <= value <= max_val:
+        return max_points
+    if value < min_val:
+        distance = min_val - value
+        tolerance = min_val * 0.2
+    else:
+        distance = value - max_val
+        tolerance = max_val * 0.2
+    if distance <= tolerance:
+        return max_points * (1 - distance / tolerance)
+    return 0.0
+
+
+cpdef tuple macro_kernel(
+    double calories,
+    double protein,
+    double carbs,
+    double fat,
+    tuple macro_targets,
+    double calorie_threshold
+):
+    """
+    Macronutrient scoring arithmetic.
+
+    Returns (score, protein_pct, carbs_pct, fat_pct, protein_score,
+    carbs_score, fat_score, calorie_score); calories must be > 0.
+    """
+    cdef double protein_pct = _py_round((protein * 4.0 / calories) * 100, 2)
+    cdef double carbs_pct = _py_round((carbs * 4.0 / calories) * 100, 2)
+    cdef double fat_pct = _py_round((fat * 9.0 / calories) * 100, 2)
+    cdef double protein_min = macro_targets[0], protein_max = macro_targets[1]
+    cdef double carbs_min = macro_targets[2], carbs_max = macro_targets[3]
+    cdef double fat_min = macro_targets[4], fat_max = macro_targets[5]
+    cdef double protein_score, carbs_score, fat_score, calorie_score, score
+
+    with nogil:
+        protein_score = _score_range(protein_pct, protein_min, protein_max, 10.0)
+        carbs_score = _score_range(carbs_pct, carbs_min, carbs_max, 10.0)
+        fat_score = _score_range(fat_pct, fat_min, fat_max, 10.0)
+
+        if calories <= calorie_threshold:
+            calorie_score = 10.0
+        elif calories <= calorie_threshold * 1.5:
+            calorie_score = 10 * (1 - (calories - calorie_threshold) / (calorie_threshold * 0.5))
+        else:
+            calorie_score = 0.0
+
+        score = 0.0 + protein_score + carbs_score + fat_score + calorie_score
+
+    return (
+        score, protein_pct, carbs_pct, fat_pct,
+        protein_score, carbs_score, fat_score, calorie_score
+    )
@@ -0,0 +1,92 @@
+"""
+Numba kernels for batch ingredient scanning.
+
+Substring indicator matching over a whole ingredient list in one compiled
+call, used by IngredientAnalyzer for larger recipes. Strings are passed as
+flat UTF-8 byte buffers plus offsets because Numba's nopython mode has no
+regex support and handles plain arrays best; byte-level substring matching
+of valid UTF-8 gives the same answer as str.__contains__.
+
+Without Numba the kernel runs as ordinary Python (correct, but slower than
+the per-ingredient scan), so callers should check NUMBA_AVAILABLE.
+"""
+
+from typing import Iterable, Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+def _jit(func):
+    """Compile with numba.njit when Numba is installed, else keep pure Python."""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True, boundscheck=False)(func)
+    return func
+
+
+def pack_strings(strings: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate strings into a uint8 UTF-8 buffer with boundary offsets.
+
+    Args:
+        strings: Strings to pack
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (buffer, offsets) where string i is
+        buffer[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return buffer, offsets
+
+
+@_jit
+def scan_indicators(text_buf, text_offs, pat_buf, pat_offs):
+    """
+    For each text, the index of the first pattern (in pattern order) it contains.
+
+    Args:
+        text_buf, text_offs: Packed texts (see pack_strings)
+        pat_buf, pat_offs: Packed patterns (see pack_strings)
+
+    Returns:
+        np.ndarray: int32 pattern index per text, -1 when none matches
+    """
+    n_texts = len(text_offs) - 1
+    n_pats = len(pat_offs) - 1
+    result = np.full(n_texts, -1, dtype=np.int32)
+
+    for t in range(n_texts):
+        t_start = text_offs[t]
+        t_len = text_offs[t + 1] - t_start
+        for p in range(n_pats):
+            p_start = pat_offs[p]
+            p_len = pat_offs[p + 1] - p_start
+            found = False
+            # Plain two-pointer search: texts and patterns are a few bytes long
+            for i in range(t_len - p_len + 1):
+                j = 0
+                while j < p_len and text_buf[t_start + i + j] == pat_buf[p_start + j]:
+                    j += 1
+                if j == p_len:
+                    found = True
+                    break
+            if found:
+                result[t] = p
+                break
+
+    return result
+
+
+if NUMBA_AVAILABLE:
+    # Compile at import so the first large recipe doesn't pay the JIT cost
+    scan_indicators(*pack_strings(["salt"]), *pack_strings(["salt"]))
@@ -12,8 +12,9 @@ Uses the existing RecipeDB and FlavorDB service wrappers — no new
 external API endpoints are required.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from collections import Counter
 
 from app.models.craving import (
@@ -81,7 +82,31 @@ class CravingService:
             f"Processing craving: '{request.craving_text}' "
             f"flavor={request.flavor_type} mood={request.mood} time={request.time_of_day}"
         )
+        top_recipes, quick_combos = self._find_replacements(request)
+        insight = self._get_psychological_insight(request)
+        return self._build_replacement(request, top_recipes, quick_combos, insight)
+
+    async def aprocess_craving(self, request: CravingRequest) -> CravingReplacement:
+        """
+        Async version of process_craving for event-loop callers.
+
+        The blocking RecipeDB/FlavorDB steps run in a worker thread while the
+        LLM insight is awaited through Gemini's async API, concurrently.
+        """
+        logger.info(
+            f"Processing craving: '{request.craving_text}' "
+            f"flavor={request.flavor_type} mood={request.mood} time={request.time_of_day}"
+        )
+        (top_recipes, quick_combos), insight = await asyncio.gather(
+            asyncio.to_thread(self._find_replacements, request),
+            self._aget_psychological_insight(request),
+        )
+        return self._build_replacement(request, top_recipes, quick_combos, insight)
 
+    def _find_replacements(
+        self, request: CravingRequest
+    ) -> Tuple[List[CravingRecipe], List[QuickCombo]]:
+        """Steps 1-4 of process_craving: top scored recipes and quick combos."""
         # 1 — Fetch candidate recipes from RecipeDB
         recipes = self._fetch_candidate_recipes(request)
 
@@ -94,9 +119,17 @@ class CravingService:
 
         # 4 — Quick combos (FlavorDB + knowledge)
         quick_combos = self._build_quick_combos(request)
+        return top_recipes, quick_combos
 
-        # 5 — Insight + science
-        insight = self._get_psychological_insight(request)
+    def _build_replacement(
+        self,
+        request: CravingRequest,
+        top_recipes: List[CravingRecipe],
+        quick_combos: List[QuickCombo],
+        insight: str,
+    ) -> CravingReplacement:
+        """Steps 5-6 of process_craving: science text, encouragement, response."""
+        # 5 — Science (the insight is generated by the caller)
         science = CRAVING_SCIENCE_TEMPLATES.get(
             request.flavor_type.value,
             "Choosing nutrient-dense alternatives helps satisfy cravings while supporting your overall health goals.",
@@ -455,10 +488,28 @@ class CravingService:
                 if insight:
                     return insight
             except Exception as e:
-                logger.warning(f"LLM craving insight failed, using template: {e}")
-                logger.warning("[LLM FALLBACK] Gemini LLM craving insight generation failed. Falling back to template-based insight.")
+                self._insight_fallback_warning(e)
+        return self._template_insight(req)
+
+    async def _aget_psychological_insight(self, req: CravingRequest) -> str:
+        """Async version of _get_psychological_insight."""
+        if self.llm_explainer and hasattr(self.llm_explainer, "agenerate_craving_insight"):
+            try:
+                insight = await self.llm_explainer.agenerate_craving_insight(req)
+                if insight:
+                    return insight
+            except Exception as e:
+                self._insight_fallback_warning(e)
+        return self._template_insight(req)
+
+    @staticmethod
+    def _insight_fallback_warning(error: Exception) -> None:
+        logger.warning(f"LLM craving insight failed, using template: {error}")
+        logger.warning("[LLM FALLBACK] Gemini LLM craving insight generation failed. Falling back to template-based insight.")
 
-        # Template fallback
+    @staticmethod
+    def _template_insight(req: CravingRequest) -> str:
+        """Template psychological insight for the craving's flavor and mood."""
         flavor_templates = CRAVING_INSIGHT_TEMPLATES.get(req.flavor_type.value, {})
         mood_key = req.mood.value if req.mood else "_default"
         return flavor_templates.get(mood_key, flavor_templates.get("_default",
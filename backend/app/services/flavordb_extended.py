@@ -17,11 +17,24 @@ logger = logging.getLogger(__name__)
 class FlavorDBExtendedService(FlavorDBService):
     """Extended FlavorDB service with additional molecule query endpoints."""
 
+    def __init__(self):
+        """Initialize the service and precompute the extended endpoint URLs."""
+        super().__init__()
+        self._url_functional_group = f"{self.base_url}/molecules_by_functional_group"
+        self._url_weight_range = f"{self.base_url}/molecules_by_weight_range"
+        self._url_polar_surface_area = f"{self.base_url}/molecules_by_polar_surface_area"
+        self._url_hbd_hba = f"{self.base_url}/molecules_by_hbd_hba"
+        self._url_aroma_threshold = f"{self.base_url}/properties_by_aroma_threshold"
+        self._url_taste_threshold = f"{self.base_url}/properties_by_taste_threshold"
+        self._url_natural_occurrence = f"{self.base_url}/properties_natural_occurrence"
+        self._url_physicochemical = f"{self.base_url}/physicochemical_properties"
+        self._url_regulatory = f"{self.base_url}/regulatory_info"
+
     def get_molecules_by_functional_group(self, group: str) -> List[Dict]:
         """Get molecules containing a specific functional group (e.g., 'aldehyde', 'ester')."""
         logger.info(f"Fetching molecules by functional group: {group}")
         params = {"group": group.strip().lower()}
-        response = self._make_request("molecules_by_functional_group", params)
+        response = self._make_request(self._url_functional_group, params)
         if not response:
             return []
         molecules = response if isinstance(response, list) else response.get("molecules", [])
@@ -31,7 +44,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get molecules within a molecular weight range."""
         logger.info(f"Fetching molecules by weight range: {min_weight}-{max_weight}")
         params = {"min": min_weight, "max": max_weight}
-        response = self._make_request("molecules_by_weight_range", params)
+        response = self._make_request(self._url_weight_range, params)
         if not response:
             return []
         molecules = response if isinstance(response, list) else response.get("molecules", [])
@@ -41,7 +54,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get molecules within a polar surface area range."""
         logger.info(f"Fetching molecules by PSA range: {min_psa}-{max_psa}")
         params = {"min": min_psa, "max": max_psa}
-        response = self._make_request("molecules_by_polar_surface_area", params)
+        response = self._make_request(self._url_polar_surface_area, params)
         if not response:
             return []
         molecules = response if isinstance(response, list) else response.get("molecules", [])
@@ -53,7 +66,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get molecules by hydrogen bond donor/acceptor counts."""
         logger.info(f"Fetching molecules by HBD({min_hbd}-{max_hbd}), HBA({min_hba}-{max_hba})")
         params = {"min_hbd": min_hbd, "max_hbd": max_hbd, "min_hba": min_hba, "max_hba": max_hba}
-        response = self._make_request("molecules_by_hbd_hba", params)
+        response = self._make_request(self._url_hbd_hba, params)
         if not response:
             return []
         molecules = response if isinstance(response, list) else response.get("molecules", [])
@@ -63,7 +76,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get aroma threshold values for a molecule."""
         logger.info(f"Fetching aroma threshold for: {molecule_name}")
         params = {"name": molecule_name.strip().lower()}
-        response = self._make_request("properties_by_aroma_threshold", params)
+        response = self._make_request(self._url_aroma_threshold, params)
         if not response:
             return {"molecule": molecule_name, "aroma_threshold": None, "unit": "ppb"}
         data = response.get("molecule", response) if isinstance(response, dict) else {}
@@ -78,7 +91,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get taste threshold values for a molecule."""
         logger.info(f"Fetching taste threshold for: {molecule_name}")
         params = {"name": molecule_name.strip().lower()}
-        response = self._make_request("properties_by_taste_threshold", params)
+        response = self._make_request(self._url_taste_threshold, params)
         if not response:
             return {"molecule": molecule_name, "taste_threshold": None, "unit": "ppm"}
         data = response.get("molecule", response) if isinstance(response, dict) else {}
@@ -93,7 +106,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get natural food sources where a molecule is found."""
         logger.info(f"Fetching natural occurrence for: {molecule_name}")
         params = {"name": molecule_name.strip().lower()}
-        response = self._make_request("properties_natural_occurrence", params)
+        response = self._make_request(self._url_natural_occurrence, params)
         if not response:
             return {"molecule": molecule_name, "food_sources": []}
         data = response.get("molecule", response) if isinstance(response, dict) else {}
@@ -107,7 +120,7 @@ class FlavorDBExtendedService(FlavorDBService):
         logger.info(f"Fetching physicochemical properties for: {molecule_name}")
         params = {"name": molecule_name.strip().lower()}
         # Try combined endpoint first
-        response = self._make_request("physicochemical_properties", params)
+        response = self._make_request(self._url_physicochemical, params)
         if not response:
             return {
                 "molecule": molecule_name,
@@ -131,7 +144,7 @@ class FlavorDBExtendedService(FlavorDBService):
         """Get regulatory status: FEMA, JECFA, COE numbers."""
         logger.info(f"Fetching regulatory info for: {molecule_name}")
         params = {"name": molecule_name.strip().lower()}
-        response = self._make_request("regulatory_info", params)
+        response = self._make_request(self._url_regulatory, params)
         if not response:
             return {
                 "molecule": molecule_name,
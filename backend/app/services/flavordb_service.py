@@ -17,11 +17,33 @@ Available endpoints:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Dict, List, Optional, Set
+import random
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
 from functools import lru_cache
 import time
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
 from app.config import settings
 from app.utils.helpers import normalize_ingredient_name
 
@@ -29,6 +51,152 @@ from app.utils.helpers import normalize_ingredient_name
 logger = logging.getLogger(__name__)
 
 
+class MoleculeIndex(NamedTuple):
+    """
+    Array form of a molecule list used by the similarity kernel.
+    
+    Attributes:
+        names: Unique molecule name hashes (int64), one per named molecule
+        concs: Concentration for each entry in ``names`` (float64)
+        total_weight: Sum of all concentrations in the profile
+        name_set: The lower-cased molecule names themselves (interned)
+    """
+    names: np.ndarray
+    concs: np.ndarray
+    total_weight: float
+    name_set: FrozenSet[str]
+
+
+def _concentration_value(value) -> float:
+    """Coerce an API concentration value to float (0.0 if missing/invalid)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def build_molecule_index(molecules: List[Dict]) -> MoleculeIndex:
+    """
+    Convert a molecule list into a MoleculeIndex.
+    
+    Molecules are keyed by lower-cased common name (falling back to the
+    chemical name); a repeated name keeps its last concentration. Names are
+    hashed to int64 so set operations run as NumPy array operations.
+    
+    Args:
+        molecules: Molecule dicts as returned in a flavor profile
+        
+    Returns:
+        MoleculeIndex: Hashed names, concentrations, total weight and names
+    """
+    conc_map: Dict[str, float] = {}
+    for mol in molecules:
+        name = sys.intern((mol.get("common_name") or mol.get("name", "")).lower())
+        # Use concentration if available, otherwise assume equal weight
+        conc_map[name] = _concentration_value(mol.get("concentration", 1.0))
+    
+    # Unnamed molecules still count towards the total weight
+    total_weight = sum(conc_map.values())
+    conc_map.pop("", None)
+    
+    count = len(conc_map)
+    names = np.fromiter((hash(name) for name in conc_map), dtype=np.int64, count=count)
+    concs = np.fromiter(conc_map.values(), dtype=np.float64, count=count)
+    return MoleculeIndex(names, concs, total_weight, frozenset(conc_map))
+
+
+# Molecule fields read by _parse_flavor_profile_response; everything else is dropped while streaming
+_PROFILE_MOLECULE_FIELDS = (
+    "chemical_name", "name", "common_name", "concentration",
+    "odor_descriptors", "flavor_descriptors",
+)
+_PROFILE_MOLECULE_LISTS = ("molecules", "flavor_molecules")
+_PROFILE_SCALAR_FIELDS = ("category", "food_category")
+
+
+class _ChunkReader:
+    """Minimal file-like adapter so ijson can read from response.iter_content()."""
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+    
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; don't consume a chunk
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
+
+def stream_flavor_profile(stream) -> Dict:
+    """
+    Stream-parse an "Entities By Readable Name" response with ijson.
+    
+    Builds one molecule dict at a time and keeps only the fields the profile
+    parser uses, so the full JSON tree is never materialized. The result has
+    the same shape as the un-nested API response and can be passed straight
+    to _parse_flavor_profile_response.
+    
+    Args:
+        stream: File-like object yielding the raw response body
+        
+    Returns:
+        Dict: Trimmed response ({} if the body was not a non-empty object)
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    sections: Dict[str, Dict] = {"entity.": {}, "": {}}
+    top_level_keys = []
+    builder = None
+    builder_prefix = ""
+    builder_target: List[Dict] = []
+    
+    try:
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == builder_prefix and event == "end_map":
+                    molecule = builder.value
+                    builder_target.append(
+                        {k: molecule[k] for k in _PROFILE_MOLECULE_FIELDS if k in molecule}
+                    )
+                    builder = None
+                continue
+            
+            if prefix == "" and event == "map_key":
+                top_level_keys.append(value)
+                continue
+            
+            for root, section in sections.items():
+                if not prefix.startswith(root):
+                    continue
+                field = prefix[len(root):]
+                if field in _PROFILE_MOLECULE_LISTS and event == "start_array":
+                    section[field] = []
+                elif field.endswith(".item") and field[:-5] in _PROFILE_MOLECULE_LISTS:
+                    if event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        builder_prefix = prefix
+                        builder_target = section.setdefault(field[:-5], [])
+                elif field == "flavor_profile":
+                    if event == "start_array":
+                        section[field] = []
+                    elif event in ("string", "number", "boolean", "null"):
+                        section[field] = value
+                elif field == "flavor_profile.item" and event == "string":
+                    section.setdefault("flavor_profile", []).append(value)
+                elif field in _PROFILE_SCALAR_FIELDS and event in ("string", "number", "null"):
+                    section[field] = value
+                break
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON in flavor profile response: {e}") from e
+    
+    if not top_level_keys:
+        return {}
+    return sections["entity."] if "entity" in top_level_keys else sections[""]
+
+
 class FlavorDBService:
     """
     Service class for interacting with FlavorDB API.
@@ -49,25 +217,79 @@ class FlavorDBService:
         self.api_key = settings.COSYLAB_API_KEY
         self.max_retries = 3
         self.retry_delay = 1  # seconds
+        self.prefetch_workers = 16  # concurrent profile fetches in prefetch_profiles()
+        # Endpoint URLs, built once instead of formatting on every request
+        self._url_profile = f"{self.base_url}/entities_by_readable_name"
+        self._url_pairings = f"{self.base_url}/flavor_pairings"
+        self._url_molecules_by_flavor = f"{self.base_url}/molecules_by_flavor_profile"
+        self._url_molecules_by_name = f"{self.base_url}/molecules_by_common_name"
+        # Negative cache: (url, params) -> expiry epoch for known 4xx lookups,
+        # oldest entries first
+        self.negative_cache_ttl = 300  # seconds
+        self.negative_cache_max_size = 10_000
+        self._negative_cache: "OrderedDict[Tuple, float]" = OrderedDict()
+        self._negative_cache_lock = threading.Lock()
+        # Persistent session: keep-alive connections shared by all requests,
+        # pool sized so every prefetch worker can hold its own connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.prefetch_workers,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"Accept": "application/json"})
+        if self.api_key:
+            self._session.headers["x-api-key"] = self.api_key
 
         logger.info(f"FlavorDB service initialized with base URL: {self.base_url}")
     
+    @staticmethod
+    def _negative_cache_key(url: str, params: Optional[Dict]) -> Tuple:
+        """Build a hashable negative-cache key from endpoint URL and query params."""
+        return (url, tuple(sorted((params or {}).items())))
+    
+    def _is_negative_cached(self, key: Tuple) -> bool:
+        """Return True if this request recently failed with a 4xx and hasn't expired."""
+        return self._negative_cache.get(key, 0) > time.time()
+    
+    def _remember_negative(self, key: Tuple) -> None:
+        """
+        Record a 4xx result so identical requests are skipped for a while.
+        
+        Entries are kept in insertion order, which (with one TTL) is expiry
+        order: expired entries are dropped from the front, then the oldest
+        live ones too while the cache exceeds negative_cache_max_size.
+        """
+        now = time.time()
+        with self._negative_cache_lock:
+            self._negative_cache.pop(key, None)
+            self._negative_cache[key] = now + self.negative_cache_ttl
+            cache = self._negative_cache
+            while cache and (
+                len(cache) > self.negative_cache_max_size or next(iter(cache.values())) <= now
+            ):
+                cache.popitem(last=False)
+    
     def _make_request(
         self,
-        endpoint: str,
+        url: str,
         params: Optional[Dict] = None,
-        retry_count: int = 0
+        stream_parser: Optional[Callable] = None
     ) -> Optional[Dict]:
         """
         Make HTTP GET request to FlavorDB API with retry logic.
         
         Handles connection errors, timeouts, and HTTP errors with automatic
-        retry mechanism. Implements exponential backoff for retries.
+        retry mechanism. Retries run in a loop with full-jitter exponential
+        backoff; 4xx responses are never retried and go to the negative cache.
         
         Args:
-            endpoint: API endpoint path (e.g., "entities_by_readable_name")
+            url: Full endpoint URL (one of the precomputed self._url_* values)
             params: Query parameters as dictionary
-            retry_count: Current retry attempt number (for internal use)
+            stream_parser: Optional callable that parses the body from a
+                file-like stream (e.g. stream_flavor_profile) instead of
+                decoding the whole JSON document
             
         Returns:
             Dict: Parsed JSON response from API, or None if request fails
@@ -75,89 +297,102 @@ class FlavorDBService:
         Raises:
             No exceptions raised - errors are logged and None is returned
         """
-        url = f"{self.base_url}/{endpoint}"
+        negative_key = self._negative_cache_key(url, params)
+        if self._is_negative_cached(negative_key):
+            logger.debug(f"Skipping {url} with params {params}: recent 4xx (negative cache)")
+            return None
         
-        try:
-            logger.debug(f"Making request to {url} with params: {params}")
+        error_type = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                # Full-jitter exponential backoff
+                wait_time = random.uniform(0, self.retry_delay * (2 ** (attempt - 1)))
+                logger.info(
+                    f"Retrying request (attempt {attempt}/{self.max_retries}) "
+                    f"after {wait_time:.2f}s due to {error_type}"
+                )
+                time.sleep(wait_time)
             
-            headers = {"Accept": "application/json"}
-            if self.api_key:
-                headers["x-api-key"] = self.api_key
-
-            response = requests.get(
-                url,
-                params=params,
-                timeout=self.timeout,
-                headers=headers,
-            )
-            
-            # Check for HTTP errors
-            response.raise_for_status()
-            
-            # Parse JSON response
-            data = response.json()
-            logger.debug(f"Request successful. Response size: {len(str(data))} bytes")
-            
-            return data
-            
-        except requests.exceptions.Timeout:
-            logger.warning(f"Request timeout for {url}")
-            return self._handle_retry(endpoint, params, retry_count, "timeout")
-            
-        except requests.exceptions.ConnectionError:
-            logger.warning(f"Connection error for {url}")
-            return self._handle_retry(endpoint, params, retry_count, "connection_error")
-            
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error for {url}: {e.response.status_code}")
-            # Don't retry on 4xx errors (client errors)
-            if 400 <= e.response.status_code < 500:
+            try:
+                logger.debug(f"Making request to {url} with params: {params}")
+                
+                response = self._session.get(
+                    url,
+                    params=params,
+                    timeout=self.timeout,
+                    stream=stream_parser is not None,
+                )
+                
+                # Released on every path, error responses included: a streamed
+                # 4xx/5xx body is read first (closing an unread stream drops
+                # the connection instead of returning it to the pool)
+                with response:
+                    # Check for HTTP errors
+                    if stream_parser is not None and response.status_code >= 400:
+                        response.content
+                    response.raise_for_status()
+                    
+                    if stream_parser is not None:
+                        data = stream_parser(_ChunkReader(response.iter_content(chunk_size=65536)))
+                        logger.debug(f"Request successful. Streamed response from {url}")
+                        return data
+                    
+                    # Parse JSON response (orjson decodes the raw bytes directly)
+                    if ORJSON_AVAILABLE:
+                        data = orjson.loads(response.content)
+                    else:
+                        data = response.json()
+                    logger.debug(f"Request successful. Response size: {len(response.content)} bytes")
+                    
+                    return data
+                
+            except requests.exceptions.Timeout:
+                logger.warning(f"Request timeout for {url}")
+                error_type = "timeout"
+                
+            except requests.exceptions.ConnectionError:
+                logger.warning(f"Connection error for {url}")
+                error_type = "connection_error"
+                
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"HTTP error for {url}: {e.response.status_code}")
+                # Don't retry on 4xx errors (client errors); remember them instead
+                if 400 <= e.response.status_code < 500:
+                    self._remember_negative(negative_key)
+                    return None
+                error_type = "http_error"
+                
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request failed for {url}: {str(e)}")
+                error_type = "request_exception"
+                
+            except ValueError as e:
+                logger.error(f"Failed to parse JSON response from {url}: {str(e)}")
                 return None
-            return self._handle_retry(endpoint, params, retry_count, "http_error")
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {str(e)}")
-            return self._handle_retry(endpoint, params, retry_count, "request_exception")
-            
-        except ValueError as e:
-            logger.error(f"Failed to parse JSON response from {url}: {str(e)}")
-            return None
+        
+        logger.error(f"Max retries ({self.max_retries}) exceeded for {url}")
+        logger.warning(f"[COSYLAB API FALLBACK] FlavorDB endpoint '{url}' failed after {self.max_retries} retries ({error_type}). Returning empty result.")
+        return None
     
-    def _handle_retry(
-        self,
-        endpoint: str,
-        params: Optional[Dict],
-        retry_count: int,
-        error_type: str
-    ) -> Optional[Dict]:
+    @staticmethod
+    def _ingredient_cache_key(ingredient_name: str) -> str:
         """
-        Handle retry logic for failed requests.
+        Build the canonical cache key / query name for an ingredient.
         
-        Implements exponential backoff strategy for retries.
+        Extracts the core ingredient name (removes quantities, prep words, etc.)
+        and lower-cases it so "Butter", " butter" and "2 tbsp butter" share
+        one cache slot and one API call.
         
         Args:
-            endpoint: API endpoint path
-            params: Query parameters
-            retry_count: Current retry attempt
-            error_type: Type of error that occurred
+            ingredient_name: Raw ingredient name as supplied by the caller
             
         Returns:
-            Dict: Result of retry attempt, or None if max retries exceeded
+            str: Normalized, lower-cased ingredient name
         """
-        if retry_count < self.max_retries:
-            wait_time = self.retry_delay * (2 ** retry_count)  # Exponential backoff
-            logger.info(
-                f"Retrying request (attempt {retry_count + 1}/{self.max_retries}) "
-                f"after {wait_time}s due to {error_type}"
-            )
-            time.sleep(wait_time)
-            return self._make_request(endpoint, params, retry_count + 1)
-        else:
-            logger.error(f"Max retries ({self.max_retries}) exceeded for {endpoint}")
-            logger.warning(f"[COSYLAB API FALLBACK] FlavorDB endpoint '{endpoint}' failed after {self.max_retries} retries ({error_type}). Returning empty result.")
-            return None
+        # Already lower-cased and trimmed by normalize_ingredient_name
+        normalized_name = normalize_ingredient_name(ingredient_name)
+        return normalized_name or ingredient_name.strip().lower()
     
-    @lru_cache(maxsize=200)
     def get_flavor_profile_by_ingredient(self, ingredient_name: str) -> Dict:
         """
         Get flavor compounds and profile for an ingredient using "Entities By Readable Name".
@@ -189,33 +424,56 @@ class FlavorDBService:
             profile = service.get_flavor_profile_by_ingredient("vanilla")
             # Returns molecules like vanillin, etc.
         """
-        logger.info(f"Fetching flavor profile for ingredient: {ingredient_name}")
-        
-        # Extract core ingredient name (removes quantities, prep words, etc.)
-        normalized_name = normalize_ingredient_name(ingredient_name)
-        if not normalized_name:
-            normalized_name = ingredient_name.strip().lower()
+        normalized_name = self._ingredient_cache_key(ingredient_name)
         logger.debug(f"FlavorDB query name: '{normalized_name}' (from '{ingredient_name}')")
         
+        flavor_profile = self._cached_fetch_profile(normalized_name)
+        
+        # Cached profiles are keyed by normalized name; report the caller's name
+        if flavor_profile["ingredient"] != ingredient_name:
+            flavor_profile = {**flavor_profile, "ingredient": ingredient_name}
+        return flavor_profile
+    
+    @lru_cache(maxsize=200)
+    def _cached_fetch_profile(self, normalized_name: str) -> Dict:
+        """
+        Fetch and parse the flavor profile for an already-normalized name.
+        
+        Cached on the canonical name so different spellings of the same
+        ingredient share one entry. Use get_flavor_profile_by_ingredient()
+        instead of calling this directly.
+        
+        Args:
+            normalized_name: Output of _ingredient_cache_key()
+            
+        Returns:
+            Dict: Standardized flavor profile (see get_flavor_profile_by_ingredient)
+        """
+        logger.info(f"Fetching flavor profile for ingredient: {normalized_name}")
+        
         params = {"name": normalized_name}
-        response = self._make_request("entities_by_readable_name", params)
+        response = self._make_request(
+            self._url_profile,
+            params,
+            stream_parser=stream_flavor_profile if IJSON_AVAILABLE else None
+        )
         
         if not response:
-            logger.warning(f"No flavor profile found for ingredient: {ingredient_name}")
-            logger.warning(f"[COSYLAB API FALLBACK] FlavorDB returned no flavor profile for '{ingredient_name}'. Using empty profile fallback.")
+            logger.warning(f"No flavor profile found for ingredient: {normalized_name}")
+            logger.warning(f"[COSYLAB API FALLBACK] FlavorDB returned no flavor profile for '{normalized_name}'. Using empty profile fallback.")
             return {
-                "ingredient": ingredient_name,
+                "ingredient": normalized_name,
                 "molecules": [],
                 "primary_flavors": [],
                 "category": "unknown"
             }
         
         # Parse flavor profile response
-        flavor_profile = self._parse_flavor_profile_response(response, ingredient_name)
+        flavor_profile = self._parse_flavor_profile_response(response, normalized_name)
         
         logger.info(
             f"Found {len(flavor_profile.get('molecules', []))} molecules "
-            f"for ingredient: {ingredient_name}"
+            f"for ingredient: {normalized_name}"
         )
         return flavor_profile
     
@@ -268,7 +526,6 @@ class FlavorDBService:
             "category": category
         }
     
-    @lru_cache(maxsize=200)
     def get_flavor_pairings(self, ingredient_name: str) -> List[str]:
         """
         Find complementary ingredients using "Flavor Pairings by Ingredient" endpoint.
@@ -287,26 +544,36 @@ class FlavorDBService:
             pairings = service.get_flavor_pairings("tomato")
             # Returns: ["basil", "garlic", "olive oil", ...]
         """
-        logger.info(f"Fetching flavor pairings for ingredient: {ingredient_name}")
-        
-        # Extract core ingredient name
-        normalized_name = normalize_ingredient_name(ingredient_name)
-        if not normalized_name:
-            normalized_name = ingredient_name.strip().lower()
+        normalized_name = self._ingredient_cache_key(ingredient_name)
         logger.debug(f"FlavorDB pairings query: '{normalized_name}' (from '{ingredient_name}')")
         
+        return self._cached_fetch_pairings(normalized_name)
+    
+    @lru_cache(maxsize=200)
+    def _cached_fetch_pairings(self, normalized_name: str) -> List[str]:
+        """
+        Fetch flavor pairings for an already-normalized ingredient name.
+        
+        Args:
+            normalized_name: Output of _ingredient_cache_key()
+            
+        Returns:
+            List[str]: Paired ingredient names (empty if none found)
+        """
+        logger.info(f"Fetching flavor pairings for ingredient: {normalized_name}")
+        
         params = {"ingredient": normalized_name}
-        response = self._make_request("flavor_pairings", params)
+        response = self._make_request(self._url_pairings, params)
         
         if not response:
-            logger.warning(f"No flavor pairings found for ingredient: {ingredient_name}")
-            logger.warning(f"[COSYLAB API FALLBACK] FlavorDB returned no pairings for '{ingredient_name}'. Returning empty pairings list.")
+            logger.warning(f"No flavor pairings found for ingredient: {normalized_name}")
+            logger.warning(f"[COSYLAB API FALLBACK] FlavorDB returned no pairings for '{normalized_name}'. Returning empty pairings list.")
             return []
         
         # Parse pairings response
         pairings = self._parse_pairings_response(response)
         
-        logger.info(f"Found {len(pairings)} flavor pairings for ingredient: {ingredient_name}")
+        logger.info(f"Found {len(pairings)} flavor pairings for ingredient: {normalized_name}")
         return pairings
     
     def _parse_pairings_response(self, response: Dict) -> List[str]:
@@ -362,10 +629,23 @@ class FlavorDBService:
         Example:
             molecules = service.get_molecules_by_flavor("sweet")
         """
+        return self._cached_fetch_molecules_by_flavor(flavor_profile.strip().lower())
+    
+    @lru_cache(maxsize=200)
+    def _cached_fetch_molecules_by_flavor(self, flavor_profile: str) -> List[Dict]:
+        """
+        Fetch molecules for an already lower-cased flavor descriptor.
+        
+        Args:
+            flavor_profile: Lower-cased, stripped flavor descriptor
+            
+        Returns:
+            List[Dict]: Standardized molecule list (empty if none found)
+        """
         logger.info(f"Fetching molecules for flavor profile: {flavor_profile}")
         
-        params = {"flavor": flavor_profile.strip().lower()}
-        response = self._make_request("molecules_by_flavor_profile", params)
+        params = {"flavor": flavor_profile}
+        response = self._make_request(self._url_molecules_by_flavor, params)
         
         if not response:
             logger.warning(f"No molecules found for flavor profile: {flavor_profile}")
@@ -408,7 +688,6 @@ class FlavorDBService:
         
         return molecules
     
-    @lru_cache(maxsize=500)
     def get_molecules_by_name(self, common_name: str) -> Dict:
         """
         Get detailed molecule data using "Molecules By Common Name" endpoint.
@@ -436,10 +715,23 @@ class FlavorDBService:
         Example:
             molecule = service.get_molecules_by_name("vanillin")
         """
+        return self._cached_fetch_molecule(common_name.strip().lower())
+    
+    @lru_cache(maxsize=500)
+    def _cached_fetch_molecule(self, common_name: str) -> Dict:
+        """
+        Fetch molecule details for an already lower-cased common name.
+        
+        Args:
+            common_name: Lower-cased, stripped molecule common name
+            
+        Returns:
+            Dict: Standardized molecule data (empty if not found)
+        """
         logger.info(f"Fetching molecule data for: {common_name}")
         
-        params = {"name": common_name.strip().lower()}
-        response = self._make_request("molecules_by_common_name", params)
+        params = {"name": common_name}
+        response = self._make_request(self._url_molecules_by_name, params)
         
         if not response:
             logger.warning(f"No molecule data found for: {common_name}")
@@ -509,34 +801,125 @@ class FlavorDBService:
             similarity = service.calculate_flavor_similarity("butter", "garlic")
             # Returns: ~12.3 (low similarity)
         """
-        # Normalize names for display
-        norm1 = normalize_ingredient_name(ingredient1) or ingredient1
-        norm2 = normalize_ingredient_name(ingredient2) or ingredient2
+        # Normalize once; the same keys are used for display and cache lookups
+        norm1 = self._ingredient_cache_key(ingredient1)
+        norm2 = self._ingredient_cache_key(ingredient2)
         logger.info(f"Calculating flavor similarity between: {norm1} and {norm2}")
         
-        # Fetch flavor profiles (normalization happens inside)
-        profile1 = self.get_flavor_profile_by_ingredient(ingredient1)
-        profile2 = self.get_flavor_profile_by_ingredient(ingredient2)
-        
-        molecules1 = profile1.get("molecules", [])
-        molecules2 = profile2.get("molecules", [])
+        # Fetch flavor profiles as cached molecule indexes; skip the second
+        # fetch entirely when the first ingredient has no flavor data
+        index1 = self._cached_molecule_index(norm1)
+        if not index1.names.size:
+            logger.debug(f"Similarity short-circuit: missing flavor profile for {ingredient1}")
+            return 0.0
         
-        # Handle empty profiles
-        if not molecules1 or not molecules2:
-            logger.warning(
-                f"Cannot calculate similarity - missing flavor data for "
-                f"{ingredient1} or {ingredient2}"
-            )
+        index2 = self._cached_molecule_index(norm2)
+        if not index2.names.size:
+            logger.debug(f"Similarity short-circuit: missing flavor profile for {ingredient2}")
             return 0.0
         
         # Calculate similarity
-        similarity = self._compute_molecule_similarity(molecules1, molecules2)
+        similarity = self._compute_index_similarity(index1, index2)
         
         logger.info(
             f"Flavor similarity between {ingredient1} and {ingredient2}: {similarity:.2f}%"
         )
         return similarity
     
+    def get_shared_molecules(self, ingredient1: str, ingredient2: str) -> List[str]:
+        """
+        List the molecules two ingredients have in common.
+        
+        Reuses the cached per-ingredient name sets, so repeated comparisons
+        against the same ingredient don't rebuild its lower-cased names.
+        
+        Args:
+            ingredient1: First ingredient name
+            ingredient2: Second ingredient name
+            
+        Returns:
+            List[str]: Sorted lower-cased names of the shared molecules
+        """
+        index1 = self._cached_molecule_index(self._ingredient_cache_key(ingredient1))
+        index2 = self._cached_molecule_index(self._ingredient_cache_key(ingredient2))
+        return sorted(index1.name_set & index2.name_set)
+    
+    def prefetch_profiles(self, ingredient_names: List[str]) -> None:
+        """
+        Warm the flavor-profile cache for many ingredients concurrently.
+        
+        Profile fetches are I/O-bound, so issuing them from a thread pool turns
+        N sequential round-trips into roughly one. Names that normalize to the
+        same cache key are fetched once.
+        
+        Args:
+            ingredient_names: Ingredient names to fetch profiles for
+        """
+        keys = list(dict.fromkeys(
+            self._ingredient_cache_key(name) for name in ingredient_names if name
+        ))
+        if not keys:
+            return
+        
+        logger.info(f"Prefetching flavor profiles for {len(keys)} ingredients")
+        workers = min(self.prefetch_workers, len(keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._cached_fetch_profile, keys))
+    
+    def calculate_similarity_matrix(self, ingredient_names: List[str]) -> np.ndarray:
+        """
+        Calculate pairwise flavor similarity for a list of ingredients.
+        
+        Recommended entry point for batch use-cases: all profiles are
+        prefetched concurrently before any pair is compared, so the O(N²)
+        comparisons run against a warm cache.
+        
+        Args:
+            ingredient_names: Ingredient names (N)
+            
+        Returns:
+            np.ndarray: Symmetric N x N matrix of similarity percentages (0-100).
+                        Rows/columns of ingredients without flavor data are 0.
+        """
+        self.prefetch_profiles(ingredient_names)
+        
+        n = len(ingredient_names)
+        matrix = np.zeros((n, n), dtype=np.int32)
+        indexes = [
+            self._cached_molecule_index(self._ingredient_cache_key(name))
+            for name in ingredient_names
+        ]
+        
+        for i in range(n):
+            if not indexes[i].names.size:
+                continue
+            for j in range(i, n):
+                if not indexes[j].names.size:
+                    continue
+                similarity = self._compute_index_similarity_bp(indexes[i], indexes[j])
+                matrix[i, j] = similarity
+                matrix[j, i] = similarity
+        
+        # Basis points -> percentage
+        return matrix / 100
+    
+    @lru_cache(maxsize=200)
+    def _cached_molecule_index(self, normalized_name: str) -> MoleculeIndex:
+        """
+        Get the MoleculeIndex for an already-normalized ingredient name.
+        
+        Kept beside the profile cache (rather than inside the profile dict)
+        so profiles stay JSON-serializable for API and agent responses.
+        
+        Args:
+            normalized_name: Output of _ingredient_cache_key()
+            
+        Returns:
+            MoleculeIndex: Array form of the ingredient's molecules
+        """
+        profile = self._cached_fetch_profile(normalized_name)
+        return build_molecule_index(profile.get("molecules", []))
+    
     def _compute_molecule_similarity(
         self,
         molecules1: List[Dict],
@@ -555,45 +938,76 @@ class FlavorDBService:
         Returns:
             float: Similarity score (0-100)
         """
-        # Extract molecule names (use common_name if available, else chemical name)
-        def get_molecule_name(mol: Dict) -> str:
-            return mol.get("common_name") or mol.get("name", "")
+        return self._compute_index_similarity(
+            build_molecule_index(molecules1),
+            build_molecule_index(molecules2)
+        )
+    
+    def _compute_index_similarity(
+        self,
+        index1: MoleculeIndex,
+        index2: MoleculeIndex
+    ) -> float:
+        """
+        Compute similarity score between two molecule indexes.
+        
+        Args:
+            index1: MoleculeIndex for first ingredient
+            index2: MoleculeIndex for second ingredient
+            
+        Returns:
+            float: Similarity score (0-100, two decimals, truncated)
+        """
+        return self._compute_index_similarity_bp(index1, index2) / 100
+    
+    def _compute_index_similarity_bp(
+        self,
+        index1: MoleculeIndex,
+        index2: MoleculeIndex
+    ) -> int:
+        """
+        Compute similarity between two molecule indexes in basis points.
         
-        # Create sets of molecule names
-        set1 = {get_molecule_name(mol).lower() for mol in molecules1 if get_molecule_name(mol)}
-        set2 = {get_molecule_name(mol).lower() for mol in molecules2 if get_molecule_name(mol)}
+        Vectorized weighted Jaccard: the shared molecules are found with
+        np.intersect1d over the name hashes instead of Python set operations.
+        Integer basis points (0-10000) are used inside matrix builds and only
+        converted to a percentage at the boundary.
         
+        Args:
+            index1: MoleculeIndex for first ingredient
+            index2: MoleculeIndex for second ingredient
+            
+        Returns:
+            int: Similarity score in basis points (0-10000)
+        """
         # Handle empty sets
-        if not set1 or not set2:
-            return 0.0
+        if not index1.names.size or not index2.names.size:
+            return 0
         
         # Calculate Jaccard similarity (intersection / union)
-        intersection = set1.intersection(set2)
-        union = set1.union(set2)
-        
-        if not union:
-            return 0.0
-        
-        base_similarity = len(intersection) / len(union)
+        common, idx1, idx2 = np.intersect1d(
+            index1.names, index2.names, assume_unique=True, return_indices=True
+        )
+        union_size = index1.names.size + index2.names.size - common.size
+        base_similarity = common.size / union_size
         
         # Apply concentration weighting if available
         weighted_similarity = self._apply_concentration_weighting(
-            intersection,
-            molecules1,
-            molecules2
+            index1, idx1, index2, idx2
         )
         
         # Combine base and weighted similarities (70% weighted, 30% base)
         final_similarity = (weighted_similarity * 0.7) + (base_similarity * 0.3)
         
-        # Convert to percentage (0-100)
-        return round(final_similarity * 100, 2)
+        # Convert to basis points (0-10000)
+        return int(final_similarity * 10000)
     
     def _apply_concentration_weighting(
         self,
-        shared_molecules: Set[str],
-        molecules1: List[Dict],
-        molecules2: List[Dict]
+        index1: MoleculeIndex,
+        shared1: np.ndarray,
+        index2: MoleculeIndex,
+        shared2: np.ndarray
     ) -> float:
         """
         Apply concentration-based weighting to similarity calculation.
@@ -602,47 +1016,24 @@ class FlavorDBService:
         overall flavor similarity score.
         
         Args:
-            shared_molecules: Set of molecule names present in both ingredients
-            molecules1: Molecule list for first ingredient
-            molecules2: Molecule list for second ingredient
+            index1: MoleculeIndex for first ingredient
+            shared1: Positions of the shared molecules in index1
+            index2: MoleculeIndex for second ingredient
+            shared2: Positions of the shared molecules in index2
             
         Returns:
             float: Weighted similarity (0-1)
         """
-        if not shared_molecules:
+        if not shared1.size:
             return 0.0
         
-        # Create concentration maps
-        def create_concentration_map(molecules: List[Dict]) -> Dict[str, float]:
-            conc_map = {}
-            for mol in molecules:
-                name = (mol.get("common_name") or mol.get("name", "")).lower()
-                # Use concentration if available, otherwise assume equal weight
-                conc_map[name] = mol.get("concentration", 1.0)
-            return conc_map
-        
-        conc_map1 = create_concentration_map(molecules1)
-        conc_map2 = create_concentration_map(molecules2)
-        
-        # Calculate weighted similarity for shared molecules
-        total_weight = 0.0
-        matched_weight = 0.0
-        
-        for mol_name in shared_molecules:
-            # Get concentrations (default to 1.0 if not available)
-            c1 = conc_map1.get(mol_name, 1.0)
-            c2 = conc_map2.get(mol_name, 1.0)
-            
-            # Weight is the minimum of the two concentrations
-            weight = min(c1, c2)
-            matched_weight += weight
-        
         # Total weight is sum of all concentrations in both sets
-        total_weight = sum(conc_map1.values()) + sum(conc_map2.values())
-        
+        total_weight = index1.total_weight + index2.total_weight
         if total_weight == 0:
             return 0.0
         
+        # Weight of each shared molecule is the minimum of the two concentrations
+        matched_weight = float(np.minimum(index1.concs[shared1], index2.concs[shared2]).sum())
         return matched_weight / total_weight
     
     def check_availability(self) -> bool:
@@ -658,7 +1049,7 @@ class FlavorDBService:
         try:
             # Try a simple request to check availability
             response = self._make_request(
-                "entities_by_readable_name",
+                self._url_profile,
                 {"name": "water"}
             )
             return response is not None
@@ -668,13 +1059,18 @@ class FlavorDBService:
     
     def clear_cache(self):
         """
-        Clear all LRU caches for flavor profile and molecule methods.
+        Clear all LRU caches for flavor profile and molecule methods,
+        plus the negative cache of failed lookups.
         
         Call this method if you need to force refresh of cached data.
         """
-        self.get_flavor_profile_by_ingredient.cache_clear()
-        self.get_flavor_pairings.cache_clear()
-        self.get_molecules_by_name.cache_clear()
+        self._cached_fetch_profile.cache_clear()
+        self._cached_fetch_pairings.cache_clear()
+        self._cached_fetch_molecules_by_flavor.cache_clear()
+        self._cached_fetch_molecule.cache_clear()
+        self._cached_molecule_index.cache_clear()
+        with self._negative_cache_lock:
+            self._negative_cache.clear()
         logger.info("FlavorDB cache cleared")
     
     def get_cache_info(self) -> Dict[str, Dict]:
@@ -686,23 +1082,19 @@ class FlavorDBService:
         Returns:
             Dict: Cache statistics for each cached method
         """
-        return {
-            "flavor_profiles": {
-                "hits": self.get_flavor_profile_by_ingredient.cache_info().hits,
-                "misses": self.get_flavor_profile_by_ingredient.cache_info().misses,
-                "size": self.get_flavor_profile_by_ingredient.cache_info().currsize,
-                "maxsize": self.get_flavor_profile_by_ingredient.cache_info().maxsize
-            },
-            "flavor_pairings": {
-                "hits": self.get_flavor_pairings.cache_info().hits,
-                "misses": self.get_flavor_pairings.cache_info().misses,
-                "size": self.get_flavor_pairings.cache_info().currsize,
-                "maxsize": self.get_flavor_pairings.cache_info().maxsize
-            },
-            "molecules": {
-                "hits": self.get_molecules_by_name.cache_info().hits,
-                "misses": self.get_molecules_by_name.cache_info().misses,
-                "size": self.get_molecules_by_name.cache_info().currsize,
-                "maxsize": self.get_molecules_by_name.cache_info().maxsize
+        def _stats(cached_method) -> Dict:
+            info = cached_method.cache_info()
+            return {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "maxsize": info.maxsize
             }
-        }
\ No newline at end of file
+        
+        return {
+            "flavor_profiles": _stats(self._cached_fetch_profile),
+            "flavor_pairings": _stats(self._cached_fetch_pairings),
+            "molecules_by_flavor": _stats(self._cached_fetch_molecules_by_flavor),
+            "molecules": _stats(self._cached_fetch_molecule),
+            "molecule_indexes": _stats(self._cached_molecule_index)
+        }
@@ -19,7 +19,29 @@ Total possible score: 100 points
 """
 
 import logging
-from typing import Dict, List, Tuple
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+try:
+    # Optional Cython build of _macro_kernel (see _health_scorer_c.pyx)
+    from app.services._health_scorer_c import macro_kernel as _macro_kernel_c
+    CYTHON_KERNEL_AVAILABLE = True
+except ImportError:
+    _macro_kernel_c = None
+    CYTHON_KERNEL_AVAILABLE = False
 
 from app.models.health_score import HealthScore
 from app.utils.constants import (
@@ -28,12 +50,248 @@ from app.utils.constants import (
     RDA_VALUES,
     NEGATIVE_FACTOR_THRESHOLDS
 )
-from app.utils.helpers import calculate_percentage_of_calories
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# ==============================================================================
+# BATCH (STRUCTURE-OF-ARRAYS) LAYOUT
+# ==============================================================================
+
+# Column order of the structured nutrition array used by the batch scorer
+NUTRITION_FIELDS: Tuple[str, ...] = (
+    "calories", "protein", "carbs", "fat", "saturated_fat",
+    "trans_fat", "sodium", "sugar", "cholesterol", "fiber"
+)
+# float64 (not float32) so batch scores match the scalar path exactly
+NUTRITION_DTYPE = np.dtype([(field, np.float64) for field in NUTRITION_FIELDS])
+
+# Column order of the micronutrient matrix: one column per nutrient with an RDA
+MICRO_FIELDS: Tuple[str, ...] = tuple(
+    name for name, rda in RDA_VALUES.items() if rda and rda > 0
+)
+_MICRO_INDEX: Dict[str, int] = {name: i for i, name in enumerate(MICRO_FIELDS)}
+_MICRO_RDA = np.array([RDA_VALUES[name] for name in MICRO_FIELDS], dtype=np.float64)
+
+_NEGATIVE_FIELDS: Tuple[str, ...] = (
+    "sodium", "sugar", "saturated_fat", "trans_fat", "cholesterol"
+)
+_NEGATIVE_THRESHOLDS = np.array(
+    [NEGATIVE_FACTOR_THRESHOLDS[field] for field in _NEGATIVE_FIELDS], dtype=np.float64
+)
+_NEGATIVE_PENALTIES = np.array([-5.0, -5.0, -5.0, -10.0, -5.0], dtype=np.float64)
+# Unit and per-factor penalty reported in the breakdown, in _NEGATIVE_FIELDS order
+_NEGATIVE_UNITS: Tuple[str, ...] = ("mg", "g", "g", "g", "mg")
+_NEGATIVE_DETAIL_PENALTIES: Tuple[int, ...] = (-5, -5, -5, -10, -5)
+
+# Ratings ordered by ascending threshold, for np.searchsorted
+_RATING_LABELS = np.array(["Poor", "Bad", "Decent", "Good", "Excellent"])
+_RATING_CUTS = np.array(
+    [RATING_THRESHOLDS[label] for label in ("Bad", "Decent", "Good", "Excellent")],
+    dtype=np.float64
+)
+# Builtin-typed copies for scoring a single value with bisect
+_RATING_LABELS_TUPLE: Tuple[str, ...] = tuple(str(label) for label in _RATING_LABELS)
+_RATING_CUTS_TUPLE: Tuple[float, ...] = tuple(float(cut) for cut in _RATING_CUTS)
+
+
+# ==============================================================================
+# SCALAR SCORING KERNEL (Cython or Numba-compiled when available)
+# ==============================================================================
+
+# Plain float tuples rather than arrays: Numba types them as homogeneous
+# tuples, and the pure-Python fallback keeps returning builtin floats
+_MACRO_TARGETS_FLAT = tuple(
+    float(bound)
+    for key in ("protein_percent", "carbs_percent", "fat_percent")
+    for bound in MACRO_TARGETS[key]
+)
+_CALORIE_THRESHOLD = 500.0
+
+# Atwater factors, inlined instead of calling calculate_percentage_of_calories
+_KCAL_PER_G_PROTEIN = 4.0
+_KCAL_PER_G_CARBS = 4.0
+_KCAL_PER_G_FAT = 9.0
+
+
+def _jit(func):
+    """
+    Compile with numba.njit when Numba is installed, else keep pure Python.
+    
+    fastmath is left off so scores stay deterministic; compiled round()
+    follows NumPy semantics and may differ from the builtin by 0.01 on
+    exact half-way values.
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True, boundscheck=False)(func)
+    return func
+
+
+@_jit
+def _score_range_kernel(value, min_val, max_val, max_points):
+    """Kernel version of HealthScorer._score_nutrient_range."""
+    if min_val <= value <= max_val:
+        return max_points
+    if value < min_val:
+        distance = min_val - value
+        tolerance = min_val * 0.2
+    else:
+        distance = value - max_val
+        tolerance = max_val * 0.2
+    if distance <= tolerance:
+        return max_points * (1 - distance / tolerance)
+    return 0.0
+
+
+@_jit
+def _macro_kernel(calories, protein, carbs, fat, macro_targets, calorie_threshold):
+    """
+    Macronutrient scoring arithmetic.
+    
+    Returns (score, protein_pct, carbs_pct, fat_pct, protein_score,
+    carbs_score, fat_score, calorie_score); calories must be > 0.
+    """
+    protein_pct = round((protein * _KCAL_PER_G_PROTEIN / calories) * 100, 2)
+    carbs_pct = round((carbs * _KCAL_PER_G_CARBS / calories) * 100, 2)
+    fat_pct = round((fat * _KCAL_PER_G_FAT / calories) * 100, 2)
+    
+    protein_score = _score_range_kernel(protein_pct, macro_targets[0], macro_targets[1], 10.0)
+    carbs_score = _score_range_kernel(carbs_pct, macro_targets[2], macro_targets[3], 10.0)
+    fat_score = _score_range_kernel(fat_pct, macro_targets[4], macro_targets[5], 10.0)
+    
+    if calories <= calorie_threshold:
+        calorie_score = 10.0
+    elif calories <= calorie_threshold * 1.5:
+        calorie_score = 10 * (1 - (calories - calorie_threshold) / (calorie_threshold * 0.5))
+    else:
+        calorie_score = 0.0
+    
+    score = 0.0 + protein_score + carbs_score + fat_score + calorie_score
+    return (
+        score, protein_pct, carbs_pct, fat_pct,
+        protein_score, carbs_score, fat_score, calorie_score
+    )
+
+
+if CYTHON_KERNEL_AVAILABLE:
+    # Prebuilt extension: no JIT warm-up needed
+    _macro_kernel = _macro_kernel_c
+elif NUMBA_AVAILABLE:
+    # Compile at import so the first request doesn't pay the JIT cost
+    _macro_kernel(1.0, 0.0, 0.0, 0.0, _MACRO_TARGETS_FLAT, _CALORIE_THRESHOLD)
+
+
+def nutrition_to_array(nutrition_rows: Iterable[Dict]) -> np.ndarray:
+    """
+    Pack per-recipe nutrition dicts into a structured NUTRITION_DTYPE array.
+    
+    Missing or null fields become 0, matching the scalar scorer's defaults.
+    
+    Args:
+        nutrition_rows: Nutrition dicts (same shape as calculate_health_score input)
+        
+    Returns:
+        np.ndarray: Structured array with one row per recipe
+    """
+    rows = [
+        tuple(float(row.get(field) or 0) for field in NUTRITION_FIELDS)
+        for row in nutrition_rows
+    ]
+    return np.array(rows, dtype=NUTRITION_DTYPE)
+
+
+def _iter_micronutrients(micro_data: Dict) -> Iterator[Tuple[str, float]]:
+    """
+    Iterate (name, value) over vitamins then minerals without merging the dicts.
+    
+    Writing the pairs in this order into an indexed array reproduces the
+    {**vitamins, **minerals} precedence (minerals win on a name clash).
+    """
+    return chain(
+        micro_data.get("vitamins", {}).items(),
+        micro_data.get("minerals", {}).items()
+    )
+
+
+def micro_to_array(micro_rows: Iterable[Dict]) -> np.ndarray:
+    """
+    Pack per-recipe micronutrient dicts into an (N, len(MICRO_FIELDS)) matrix.
+    
+    Vitamins are written first and minerals second (see _iter_micronutrients),
+    so a mineral overrides a vitamin with the same name. Nutrients
+    without an RDA are dropped; missing nutrients are 0 (no points).
+    
+    Args:
+        micro_rows: Micronutrient dicts ({"vitamins": {...}, "minerals": {...}})
+        
+    Returns:
+        np.ndarray: float64 matrix with one row per recipe
+    """
+    micro_rows = list(micro_rows)
+    values = np.zeros((len(micro_rows), len(MICRO_FIELDS)), dtype=np.float64)
+    for row_idx, micro_data in enumerate(micro_rows):
+        for name, value in _iter_micronutrients(micro_data):
+            col = _MICRO_INDEX.get(name)
+            if col is not None:
+                values[row_idx, col] = value
+    return values
+
+
+def _micro_percent_rda(micro_data: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentage of RDA for every MICRO_FIELDS nutrient of a single recipe.
+    
+    Args:
+        micro_data: Micronutrient dict ({"vitamins": {...}, "minerals": {...}})
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (percent_rda, present) where present
+        marks the nutrients the recipe actually reported; missing ones are 0%
+    """
+    values = np.zeros(len(MICRO_FIELDS), dtype=np.float64)
+    present = np.zeros(len(MICRO_FIELDS), dtype=bool)
+    for name, value in _iter_micronutrients(micro_data):
+        col = _MICRO_INDEX.get(name)
+        if col is not None:
+            values[col] = value
+            present[col] = True
+    return (values / _MICRO_RDA) * 100, present
+
+
+def _score_range_batch(
+    values: np.ndarray,
+    target_range: Tuple[float, float],
+    max_points: float
+) -> np.ndarray:
+    """Vectorized HealthScorer._score_nutrient_range over an array of values."""
+    min_val, max_val = target_range
+    below = values < min_val
+    above = values > max_val
+    distance = np.where(below, min_val - values, values - max_val)
+    tolerance = np.where(below, min_val * 0.2, max_val * 0.2)
+    partial = np.where(distance <= tolerance, max_points * (1 - distance / tolerance), 0.0)
+    return np.where(below | above, partial, float(max_points))
+
+
+@dataclass
+class MacroPercentages:
+    """Percent of calories from each macronutrient, shared by scoring and breakdown."""
+    __slots__ = ("protein", "carbs", "fat")
+    
+    protein: float
+    carbs: float
+    fat: float
+
+
+# (breakdown key, MACRO_TARGETS key, MacroPercentages attribute, calories-unknown target label)
+_MACRO_BALANCE_COMPONENTS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("protein_balance", "protein_percent", "protein", "10-35%"),
+    ("carb_balance", "carbs_percent", "carbs", "45-65%"),
+    ("fat_balance", "fat_percent", "fat", "20-35%"),
+)
+
+
 class HealthScorer:
     """
     Rule-based health scoring engine for recipes.
@@ -54,6 +312,40 @@ class HealthScorer:
         self.micro_weight = 30
         self.negative_weight = -30
         
+        # Bind the constant tables once so the per-recipe methods read tuples
+        # instead of doing string-keyed lookups into the constants dicts
+        self._macro_balance_specs = tuple(
+            (key, nutrient, *MACRO_TARGETS[target_key],
+             f"{MACRO_TARGETS[target_key][0]}-{MACRO_TARGETS[target_key][1]}%")
+            for key, target_key, nutrient, _ in _MACRO_BALANCE_COMPONENTS
+        )
+        self._negative_specs = tuple(
+            (field, NEGATIVE_FACTOR_THRESHOLDS[field], unit, penalty)
+            for field, unit, penalty in zip(
+                _NEGATIVE_FIELDS, _NEGATIVE_UNITS, _NEGATIVE_DETAIL_PENALTIES
+            )
+        )
+        # Capped penalty for every combination of triggered factors, indexed by
+        # the bitmask _evaluate_negatives builds (bit i = _NEGATIVE_FIELDS[i])
+        self._negative_penalty_lut = tuple(
+            round(max(
+                sum(
+                    (penalty for bit, penalty in enumerate(_NEGATIVE_DETAIL_PENALTIES)
+                     if mask & (1 << bit)),
+                    0.0
+                ),
+                self.negative_weight
+            ), 2)
+            for mask in range(1 << len(_NEGATIVE_FIELDS))
+        )
+        # Memoized scores: nutrition fingerprint -> HealthScore, least
+        # recently used first. Per instance (a method lru_cache would keep
+        # the scorer alive), and never handed out directly (see
+        # _cached_health_score)
+        self.score_cache_max_size = 4096
+        self._score_cache: "OrderedDict[Tuple, HealthScore]" = OrderedDict()
+        self._score_cache_lock = threading.Lock()
+        
         logger.info(
             f"HealthScorer initialized with weights: "
             f"macro={self.macro_weight}, micro={self.micro_weight}, "
@@ -109,6 +401,71 @@ class HealthScorer:
             scorer = HealthScorer()
             score = scorer.calculate_health_score(nutrition, micro_nutrition)
             print(f"Score: {score.score}, Rating: {score.rating}")
+        
+        Note:
+            Results are memoized per nutrition fingerprint; every call gets
+            its own copy, so callers may modify the breakdown.
+        """
+        try:
+            nutrition_key = tuple(sorted(nutrition_data.items()))
+            micro_key = (
+                tuple(sorted(micro_nutrition.get("vitamins", {}).items())),
+                tuple(sorted(micro_nutrition.get("minerals", {}).items()))
+            )
+            return self._cached_health_score(nutrition_key, micro_key)
+        except TypeError:
+            # Unhashable or unorderable values: score without the cache
+            return self._compute_health_score(nutrition_data, micro_nutrition)
+    
+    def _cached_health_score(
+        self,
+        nutrition_key: Tuple[Tuple[str, float], ...],
+        micro_key: Tuple[Tuple[Tuple[str, float], ...], Tuple[Tuple[str, float], ...]]
+    ) -> HealthScore:
+        """
+        Score a recipe from its hashable nutrition fingerprint.
+        
+        The cache keeps its own instance and returns a deep copy, since
+        frozen=True doesn't stop callers mutating the nested breakdown.
+        
+        Args:
+            nutrition_key: Sorted (name, value) pairs of the nutrition dict
+            micro_key: Sorted (name, value) pairs of the vitamins and minerals
+            
+        Returns:
+            HealthScore: Copy of the cached result of _compute_health_score
+        """
+        key = (nutrition_key, micro_key)
+        with self._score_cache_lock:
+            cached = self._score_cache.get(key)
+            if cached is not None:
+                self._score_cache.move_to_end(key)
+        if cached is None:
+            vitamins, minerals = micro_key
+            cached = self._compute_health_score(
+                dict(nutrition_key),
+                {"vitamins": dict(vitamins), "minerals": dict(minerals)}
+            )
+            with self._score_cache_lock:
+                self._score_cache[key] = cached
+                while len(self._score_cache) > self.score_cache_max_size:
+                    self._score_cache.popitem(last=False)
+        return cached.model_copy(deep=True)
+    
+    def _compute_health_score(
+        self,
+        nutrition_data: Dict,
+        micro_nutrition: Dict
+    ) -> HealthScore:
+        """
+        Uncached body of calculate_health_score.
+        
+        Args:
+            nutrition_data: Macronutrient dictionary
+            micro_nutrition: Micronutrient dictionary
+            
+        Returns:
+            HealthScore: Score, rating and breakdown
         """
         logger.info("Calculating health score")
         
@@ -119,16 +476,19 @@ class HealthScorer:
         fat = nutrition_data.get("fat", 0)
         
         # Step 1: Score macronutrients
-        macro_score = self.score_macronutrients(calories, protein, carbs, fat)
-        logger.debug(f"Macronutrient score: {macro_score}/{self.macro_weight}")
+        macro_score, macro_percentages = self._score_macronutrients_detailed(
+            calories, protein, carbs, fat
+        )
+        logger.debug("Macronutrient score: %s/%s", macro_score, self.macro_weight)
         
-        # Step 2: Score micronutrients
-        micro_score = self.score_micronutrients(micro_nutrition)
-        logger.debug(f"Micronutrient score: {micro_score}/{self.micro_weight}")
+        # Step 2: Score micronutrients (RDA percentages are shared with the breakdown)
+        rda_percentages = _micro_percent_rda(micro_nutrition)
+        micro_score = self.score_micronutrients(micro_nutrition, rda_percentages)
+        logger.debug("Micronutrient score: %s/%s", micro_score, self.micro_weight)
         
         # Step 3: Apply negative factor penalties
-        negative_score = self.score_negative_factors(nutrition_data)
-        logger.debug(f"Negative factors penalty: {negative_score}")
+        negative_score, _, negative_details = self._evaluate_negatives(nutrition_data)
+        logger.debug("Negative factors penalty: %s", negative_score)
         
         # Step 4: Calculate total score
         # Note: negative_score is already negative, so we add it
@@ -152,29 +512,141 @@ class HealthScorer:
         
         # Build detailed breakdown
         breakdown = {
-            "macronutrient_score": round(macro_score, 2),
-            "micronutrient_score": round(micro_score, 2),
-            "negative_factors_penalty": round(negative_score, 2),
-            "raw_total": round(raw_score, 2),
-            "normalized_score": round(final_score, 2),
+            "macronutrient_score": macro_score,
+            "micronutrient_score": micro_score,
+            "negative_factors_penalty": negative_score,
+            "raw_total": raw_score,
+            "normalized_score": final_score,
             "components": {
-                "protein_balance": self._check_protein_balance(calories, protein),
-                "carb_balance": self._check_carb_balance(calories, carbs),
-                "fat_balance": self._check_fat_balance(calories, fat),
+                **self._check_macro_balances(calories, protein, carbs, fat, macro_percentages),
                 "calorie_density": self._check_calorie_density(calories),
-                "micronutrient_adequacy": self._calculate_micronutrient_adequacy(micro_nutrition),
-                "negative_factors": self._get_negative_factor_details(nutrition_data)
+                "micronutrient_adequacy": self._calculate_micronutrient_adequacy(
+                    micro_nutrition, rda_percentages
+                ),
+                "negative_factors": negative_details
             }
         }
         
-        logger.info(f"Final health score: {final_score:.2f} ({rating})")
+        logger.info("Final health score: %.2f (%s)", final_score, rating)
         
         return HealthScore(
-            score=round(final_score, 2),
+            score=final_score,
             rating=rating,
             breakdown=breakdown
         )
     
+    def clear_cache(self):
+        """Drop all memoized health scores."""
+        with self._score_cache_lock:
+            self._score_cache.clear()
+        logger.info("Health score cache cleared")
+    
+    def calculate_health_scores_batch(
+        self,
+        nutrition_arr: np.ndarray,
+        micro_arr: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score many recipes at once with vectorized NumPy arithmetic.
+        
+        Applies the same rules as calculate_health_score, but over whole
+        columns instead of one recipe at a time (np.round of the macro
+        percentages may differ from round() by 0.01 on half-way values).
+        Use it when ranking or filtering many recipes and only the
+        score/rating are needed; the per-component breakdown is only
+        produced by calculate_health_score.
+        
+        Args:
+            nutrition_arr: Structured NUTRITION_DTYPE array (see nutrition_to_array)
+            micro_arr: (N, len(MICRO_FIELDS)) matrix (see micro_to_array)
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Unrounded final scores (0-100) and
+            rating labels, one per recipe
+        """
+        calories = nutrition_arr["calories"]
+        has_calories = calories > 0
+        safe_calories = np.where(has_calories, calories, 1.0)
+        
+        # Macronutrients (0-40): same operation order as the scalar path
+        protein_kcal = nutrition_arr["protein"] * _KCAL_PER_G_PROTEIN
+        carbs_kcal = nutrition_arr["carbs"] * _KCAL_PER_G_CARBS
+        fat_kcal = nutrition_arr["fat"] * _KCAL_PER_G_FAT
+        protein_pct = np.round((protein_kcal / safe_calories) * 100, 2)
+        carbs_pct = np.round((carbs_kcal / safe_calories) * 100, 2)
+        fat_pct = np.round((fat_kcal / safe_calories) * 100, 2)
+        
+        calorie_threshold = 500
+        calorie_score = np.where(
+            calories <= calorie_threshold,
+            10.0,
+            np.where(
+                calories <= calorie_threshold * 1.5,
+                10 * (1 - (calories - calorie_threshold) / (calorie_threshold * 0.5)),
+                0.0
+            )
+        )
+        macro_score = (
+            _score_range_batch(protein_pct, MACRO_TARGETS["protein_percent"], 10)
+            + _score_range_batch(carbs_pct, MACRO_TARGETS["carbs_percent"], 10)
+            + _score_range_batch(fat_pct, MACRO_TARGETS["fat_percent"], 10)
+            + calorie_score
+        )
+        macro_score = np.where(has_calories, macro_score, 0.0)
+        
+        # Micronutrients (0-30): +2 at >=100% RDA, +1 at 50-99% RDA
+        percent_rda = (micro_arr / _MICRO_RDA) * 100
+        micro_points = np.where(percent_rda >= 100, 2.0, np.where(percent_rda >= 50, 1.0, 0.0))
+        micro_score = np.minimum(micro_points.sum(axis=1), self.micro_weight)
+        
+        # Negative factors (0 to -30)
+        negative_values = np.column_stack([nutrition_arr[field] for field in _NEGATIVE_FIELDS])
+        penalty = ((negative_values > _NEGATIVE_THRESHOLDS) * _NEGATIVE_PENALTIES).sum(axis=1)
+        negative_score = np.maximum(penalty, self.negative_weight)
+        
+        # Normalize -30..70 to 0..100 and clamp
+        raw_score = macro_score + micro_score + negative_score
+        max_possible = self.macro_weight + self.micro_weight
+        min_possible = self.negative_weight
+        normalized = ((raw_score - min_possible) / (max_possible - min_possible)) * 100
+        final_score = np.clip(normalized, 0.0, 100.0)
+        
+        ratings = _RATING_LABELS[np.searchsorted(_RATING_CUTS, final_score, side="right")]
+        return final_score, ratings
+    
+    def score_stream(
+        self,
+        recipes: Iterable[Tuple[Dict, Dict]],
+        chunk_size: int = 64
+    ) -> Iterator[HealthScore]:
+        """
+        Lazily score (nutrition, micro_nutrition) pairs, one HealthScore at a time.
+        
+        Recipes are pulled from the iterable in chunks of chunk_size and
+        scored with calculate_health_scores_batch, so memory stays bounded by
+        the chunk and the first result is available before the input is
+        exhausted (e.g. for an NDJSON StreamingResponse).
+        
+        Args:
+            recipes: Iterable of (nutrition_data, micro_nutrition) pairs
+            chunk_size: Number of recipes scored per vectorized block
+            
+        Yields:
+            HealthScore: Score and rating in input order; breakdown is left
+            empty (use calculate_health_score when it is needed)
+        """
+        iterator = iter(recipes)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            scores, ratings = self.calculate_health_scores_batch(
+                nutrition_to_array(nutrition for nutrition, _ in chunk),
+                micro_to_array(micro for _, micro in chunk)
+            )
+            for score, rating in zip(scores, ratings):
+                yield HealthScore(score=float(score), rating=str(rating))
+    
     def score_macronutrients(
         self,
         calories: float,
@@ -205,69 +677,47 @@ class HealthScorer:
         Returns:
             float: Macronutrient score (0-40 points)
         """
-        score = 0.0
+        return self._score_macronutrients_detailed(calories, protein, carbs, fat)[0]
+    
+    def _score_macronutrients_detailed(
+        self,
+        calories: float,
+        protein: float,
+        carbs: float,
+        fat: float
+    ) -> Tuple[float, Optional[MacroPercentages]]:
+        """
+        score_macronutrients that also returns the calorie percentages it computed.
         
+        Returns:
+            Tuple[float, Optional[MacroPercentages]]: (score, percentages), where
+            percentages is None when calories <= 0
+        """
         # Avoid division by zero
         if calories <= 0:
             logger.warning("Calories is 0 or negative, cannot score macronutrients")
-            return 0.0
-        
-        # Calculate macronutrient percentages
-        protein_percent = calculate_percentage_of_calories(protein, "protein", calories)
-        carbs_percent = calculate_percentage_of_calories(carbs, "carbs", calories)
-        fat_percent = calculate_percentage_of_calories(fat, "fat", calories)
-        
-        logger.debug(
-            f"Macro percentages - Protein: {protein_percent:.1f}%, "
-            f"Carbs: {carbs_percent:.1f}%, Fat: {fat_percent:.1f}%"
-        )
-        
-        # Score protein balance (0-10 points)
-        protein_score = self._score_nutrient_range(
-            protein_percent,
-            MACRO_TARGETS["protein_percent"],
-            max_points=10
-        )
-        score += protein_score
-        
-        # Score carb balance (0-10 points)
-        carbs_score = self._score_nutrient_range(
-            carbs_percent,
-            MACRO_TARGETS["carbs_percent"],
-            max_points=10
-        )
-        score += carbs_score
-        
-        # Score fat balance (0-10 points)
-        fat_score = self._score_nutrient_range(
-            fat_percent,
-            MACRO_TARGETS["fat_percent"],
-            max_points=10
-        )
-        score += fat_score
-        
-        # Score calorie density (0-10 points)
-        # Lower calorie density is better (more volume, fewer calories)
-        calorie_threshold = 500
-        if calories <= calorie_threshold:
-            # Full points if below threshold
-            calorie_score = 10
-        elif calories <= calorie_threshold * 1.5:
-            # Partial credit for moderately high calories
-            calorie_score = 10 * (1 - (calories - calorie_threshold) / (calorie_threshold * 0.5))
-        else:
-            # No points for very high calorie recipes
-            calorie_score = 0
-        
-        score += calorie_score
-        
-        logger.debug(
-            f"Macro component scores - Protein: {protein_score:.1f}, "
-            f"Carbs: {carbs_score:.1f}, Fat: {fat_score:.1f}, "
-            f"Calorie density: {calorie_score:.1f}"
+            return 0.0, None
+        
+        (
+            score, protein_percent, carbs_percent, fat_percent,
+            protein_score, carbs_score, fat_score, calorie_score
+        ) = _macro_kernel(
+            float(calories), float(protein), float(carbs), float(fat),
+            _MACRO_TARGETS_FLAT, _CALORIE_THRESHOLD
         )
         
-        return round(score, 2)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Macro percentages - Protein: %.1f%%, Carbs: %.1f%%, Fat: %.1f%%",
+                protein_percent, carbs_percent, fat_percent
+            )
+            logger.debug(
+                "Macro component scores - Protein: %.1f, Carbs: %.1f, Fat: %.1f, "
+                "Calorie density: %.1f",
+                protein_score, carbs_score, fat_score, calorie_score
+            )
+        
+        return score, MacroPercentages(protein_percent, carbs_percent, fat_percent)
     
     def _score_nutrient_range(
         self,
@@ -311,7 +761,11 @@ class HealthScorer:
         # Too far outside range - no points
         return 0.0
     
-    def score_micronutrients(self, micro_data: Dict) -> float:
+    def score_micronutrients(
+        self,
+        micro_data: Dict,
+        rda_percentages: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> float:
         """
         Score recipe based on vitamin and mineral content.
         
@@ -329,52 +783,29 @@ class HealthScorer:
                     "vitamins": {"vitamin_c": 90, "vitamin_d": 20, ...},
                     "minerals": {"calcium": 1000, "iron": 18, ...}
                 }
+            rda_percentages: Precomputed _micro_percent_rda(micro_data) result,
+                shared with the adequacy breakdown to avoid a second pass
                 
         Returns:
             float: Micronutrient score (0-30 points)
         """
-        score = 0.0
-        nutrients_evaluated = 0
-        nutrients_adequate = 0
+        if rda_percentages is None:
+            rda_percentages = _micro_percent_rda(micro_data)
+        percent_rda, present = rda_percentages
         
-        vitamins = micro_data.get("vitamins", {})
-        minerals = micro_data.get("minerals", {})
+        nutrients_adequate = int(np.count_nonzero(percent_rda >= 100))
+        nutrients_partial = int(np.count_nonzero((percent_rda >= 50) & (percent_rda < 100)))
         
-        # Combine all micronutrients
-        all_nutrients = {**vitamins, **minerals}
+        # +2 per nutrient at >=100% RDA, +1 at 50-99%, capped at maximum points
+        score = min(float(nutrients_adequate * 2 + nutrients_partial), self.micro_weight)
         
-        for nutrient_name, nutrient_value in all_nutrients.items():
-            # Get RDA for this nutrient
-            rda = RDA_VALUES.get(nutrient_name)
-            
-            if rda is None or rda <= 0:
-                # Skip nutrients without defined RDA
-                continue
-            
-            nutrients_evaluated += 1
-            
-            # Calculate percentage of RDA
-            percent_rda = (nutrient_value / rda) * 100
-            
-            # Score based on RDA percentage
-            if percent_rda >= 100:
-                # Meets or exceeds RDA - full points
-                score += 2
-                nutrients_adequate += 1
-            elif percent_rda >= 50:
-                # Meets 50-99% of RDA - partial points
-                score += 1
-            # else: Below 50% RDA - no points
-        
-        # Cap at maximum points
-        score = min(score, self.micro_weight)
-        
-        logger.debug(
-            f"Micronutrient scoring: {nutrients_adequate}/{nutrients_evaluated} "
-            f"nutrients adequate, score: {score:.1f}/{self.micro_weight}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Micronutrient scoring: %d/%d nutrients adequate, score: %.1f/%s",
+                nutrients_adequate, np.count_nonzero(present), score, self.micro_weight
+            )
         
-        return round(score, 2)
+        return score
     
     def score_negative_factors(self, nutrition_data: Dict) -> float:
         """
@@ -398,44 +829,15 @@ class HealthScorer:
         Returns:
             float: Penalty score (0 to -30 points)
         """
-        penalty = 0.0
-        
-        # Check sodium
-        sodium = nutrition_data.get("sodium", 0)
-        if sodium > NEGATIVE_FACTOR_THRESHOLDS["sodium"]:
-            penalty -= 5
-            logger.debug(f"Sodium penalty applied: {sodium}mg > threshold")
-        
-        # Check sugar
-        sugar = nutrition_data.get("sugar", 0)
-        if sugar > NEGATIVE_FACTOR_THRESHOLDS["sugar"]:
-            penalty -= 5
-            logger.debug(f"Sugar penalty applied: {sugar}g > threshold")
-        
-        # Check saturated fat
-        saturated_fat = nutrition_data.get("saturated_fat", 0)
-        if saturated_fat > NEGATIVE_FACTOR_THRESHOLDS["saturated_fat"]:
-            penalty -= 5
-            logger.debug(f"Saturated fat penalty applied: {saturated_fat}g > threshold")
-        
-        # Check trans fat (severe penalty)
-        trans_fat = nutrition_data.get("trans_fat", 0)
-        if trans_fat > NEGATIVE_FACTOR_THRESHOLDS["trans_fat"]:
-            penalty -= 10
-            logger.debug(f"Trans fat penalty applied: {trans_fat}g > threshold (severe)")
-        
-        # Check cholesterol
-        cholesterol = nutrition_data.get("cholesterol", 0)
-        if cholesterol > NEGATIVE_FACTOR_THRESHOLDS["cholesterol"]:
-            penalty -= 5
-            logger.debug(f"Cholesterol penalty applied: {cholesterol}mg > threshold")
-        
-        # Cap penalty at minimum (most negative allowed)
-        penalty = max(penalty, self.negative_weight)
-        
-        logger.debug(f"Total negative factors penalty: {penalty}")
-        
-        return round(penalty, 2)
+        penalty, mask, _ = self._evaluate_negatives(nutrition_data)
+        
+        # Most recipes trip none of the thresholds: nothing worth logging
+        if not mask:
+            return penalty
+        
+        logger.debug("Total negative factors penalty: %s", penalty)
+        
+        return penalty
     
     def assign_rating(self, score: float) -> str:
         """
@@ -456,109 +858,64 @@ class HealthScorer:
         Returns:
             str: Rating category
         """
-        if score >= RATING_THRESHOLDS["Excellent"]:
-            return "Excellent"
-        elif score >= RATING_THRESHOLDS["Good"]:
-            return "Good"
-        elif score >= RATING_THRESHOLDS["Decent"]:
-            return "Decent"
-        elif score >= RATING_THRESHOLDS["Bad"]:
-            return "Bad"
-        else:
-            return "Poor"
+        return _RATING_LABELS_TUPLE[bisect_right(_RATING_CUTS_TUPLE, score)]
     
-    def _check_protein_balance(self, calories: float, protein: float) -> Dict:
+    def _check_macro_balances(
+        self,
+        calories: float,
+        protein: float,
+        carbs: float,
+        fat: float,
+        percentages: Optional[MacroPercentages] = None
+    ) -> Dict[str, Dict]:
         """
-        Get detailed protein balance information.
+        Get detailed protein, carbohydrate and fat balance information.
         
         Args:
             calories: Total calories
             protein: Protein in grams
-            
-        Returns:
-            Dict: Protein balance details
-        """
-        if calories <= 0:
-            return {"status": "unknown", "percentage": 0, "target": "10-35%"}
-        
-        percent = calculate_percentage_of_calories(protein, "protein", calories)
-        min_target, max_target = MACRO_TARGETS["protein_percent"]
-        
-        if min_target <= percent <= max_target:
-            status = "optimal"
-        elif percent < min_target:
-            status = "low"
-        else:
-            status = "high"
-        
-        return {
-            "status": status,
-            "percentage": round(percent, 1),
-            "target": f"{min_target}-{max_target}%",
-            "actual_grams": protein
-        }
-    
-    def _check_carb_balance(self, calories: float, carbs: float) -> Dict:
-        """
-        Get detailed carbohydrate balance information.
-        
-        Args:
-            calories: Total calories
             carbs: Carbohydrates in grams
-            
-        Returns:
-            Dict: Carbohydrate balance details
-        """
-        if calories <= 0:
-            return {"status": "unknown", "percentage": 0, "target": "45-65%"}
-        
-        percent = calculate_percentage_of_calories(carbs, "carbs", calories)
-        min_target, max_target = MACRO_TARGETS["carbs_percent"]
-        
-        if min_target <= percent <= max_target:
-            status = "optimal"
-        elif percent < min_target:
-            status = "low"
-        else:
-            status = "high"
-        
-        return {
-            "status": status,
-            "percentage": round(percent, 1),
-            "target": f"{min_target}-{max_target}%",
-            "actual_grams": carbs
-        }
-    
-    def _check_fat_balance(self, calories: float, fat: float) -> Dict:
-        """
-        Get detailed fat balance information.
-        
-        Args:
-            calories: Total calories
             fat: Fat in grams
+            percentages: Percentages already computed by score_macronutrients;
+                recomputed when not given
             
         Returns:
-            Dict: Fat balance details
+            Dict[str, Dict]: Balance details keyed by protein_balance,
+            carb_balance and fat_balance
         """
         if calories <= 0:
-            return {"status": "unknown", "percentage": 0, "target": "20-35%"}
-        
-        percent = calculate_percentage_of_calories(fat, "fat", calories)
-        min_target, max_target = MACRO_TARGETS["fat_percent"]
+            return {
+                key: {"status": "unknown", "percentage": 0, "target": unknown_target}
+                for key, _, _, unknown_target in _MACRO_BALANCE_COMPONENTS
+            }
         
-        if min_target <= percent <= max_target:
-            status = "optimal"
-        elif percent < min_target:
-            status = "low"
-        else:
-            status = "high"
+        if percentages is None:
+            percentages = MacroPercentages(
+                round((protein * _KCAL_PER_G_PROTEIN / calories) * 100, 2),
+                round((carbs * _KCAL_PER_G_CARBS / calories) * 100, 2),
+                round((fat * _KCAL_PER_G_FAT / calories) * 100, 2)
+            )
+        grams = {"protein": protein, "carbs": carbs, "fat": fat}
+        
+        balances = {}
+        for key, nutrient, min_target, max_target, target_label in self._macro_balance_specs:
+            percent = getattr(percentages, nutrient)
+            
+            if min_target <= percent <= max_target:
+                status = "optimal"
+            elif percent < min_target:
+                status = "low"
+            else:
+                status = "high"
+            
+            balances[key] = {
+                "status": status,
+                "percentage": round(percent, 1),
+                "target": target_label,
+                "actual_grams": grams[nutrient]
+            }
         
-        return {
-            "status": status,
-            "percentage": round(percent, 1),
-            "target": f"{min_target}-{max_target}%",
-            "actual_grams": fat
-        }
+        return balances
     
     def _check_calorie_density(self, calories: float) -> Dict:
         """
@@ -585,31 +942,27 @@ class HealthScorer:
             "threshold": threshold
         }
     
-    def _calculate_micronutrient_adequacy(self, micro_data: Dict) -> Dict:
+    def _calculate_micronutrient_adequacy(
+        self,
+        micro_data: Dict,
+        rda_percentages: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Dict:
         """
         Calculate overall micronutrient adequacy.
         
         Args:
             micro_data: Micronutrient dictionary
+            rda_percentages: Precomputed _micro_percent_rda(micro_data) result
             
         Returns:
             Dict: Adequacy summary
         """
-        vitamins = micro_data.get("vitamins", {})
-        minerals = micro_data.get("minerals", {})
-        
-        all_nutrients = {**vitamins, **minerals}
-        
-        total_count = 0
-        adequate_count = 0
+        if rda_percentages is None:
+            rda_percentages = _micro_percent_rda(micro_data)
+        percent_rda, present = rda_percentages
         
-        for nutrient_name, nutrient_value in all_nutrients.items():
-            rda = RDA_VALUES.get(nutrient_name)
-            if rda and rda > 0:
-                total_count += 1
-                percent_rda = (nutrient_value / rda) * 100
-                if percent_rda >= 100:
-                    adequate_count += 1
+        total_count = int(np.count_nonzero(present))
+        adequate_count = int(np.count_nonzero(percent_rda >= 100))
         
         adequacy_percent = (adequate_count / total_count * 100) if total_count > 0 else 0
         
@@ -619,66 +972,31 @@ class HealthScorer:
             "adequacy_percentage": round(adequacy_percent, 1)
         }
     
-    def _get_negative_factor_details(self, nutrition_data: Dict) -> List[Dict]:
+    def _evaluate_negatives(self, nutrition_data: Dict) -> Tuple[float, int, List[Dict]]:
         """
-        Get detailed information about triggered negative factors.
+        Evaluate every negative factor in a single pass.
         
         Args:
             nutrition_data: Nutrition dictionary
             
         Returns:
-            List[Dict]: List of triggered negative factors
+            Tuple[float, int, List[Dict]]: (penalty, mask, details) where mask
+            has bit i set when _NEGATIVE_FIELDS[i] exceeded its threshold and
+            details lists the triggered factors
         """
+        mask = 0
         factors = []
         
-        sodium = nutrition_data.get("sodium", 0)
-        if sodium > NEGATIVE_FACTOR_THRESHOLDS["sodium"]:
-            factors.append({
-                "factor": "sodium",
-                "value": sodium,
-                "threshold": NEGATIVE_FACTOR_THRESHOLDS["sodium"],
-                "unit": "mg",
-                "penalty": -5
-            })
-        
-        sugar = nutrition_data.get("sugar", 0)
-        if sugar > NEGATIVE_FACTOR_THRESHOLDS["sugar"]:
-            factors.append({
-                "factor": "sugar",
-                "value": sugar,
-                "threshold": NEGATIVE_FACTOR_THRESHOLDS["sugar"],
-                "unit": "g",
-                "penalty": -5
-            })
-        
-        saturated_fat = nutrition_data.get("saturated_fat", 0)
-        if saturated_fat > NEGATIVE_FACTOR_THRESHOLDS["saturated_fat"]:
-            factors.append({
-                "factor": "saturated_fat",
-                "value": saturated_fat,
-                "threshold": NEGATIVE_FACTOR_THRESHOLDS["saturated_fat"],
-                "unit": "g",
-                "penalty": -5
-            })
-        
-        trans_fat = nutrition_data.get("trans_fat", 0)
-        if trans_fat > NEGATIVE_FACTOR_THRESHOLDS["trans_fat"]:
-            factors.append({
-                "factor": "trans_fat",
-                "value": trans_fat,
-                "threshold": NEGATIVE_FACTOR_THRESHOLDS["trans_fat"],
-                "unit": "g",
-                "penalty": -10
-            })
-        
-        cholesterol = nutrition_data.get("cholesterol", 0)
-        if cholesterol > NEGATIVE_FACTOR_THRESHOLDS["cholesterol"]:
-            factors.append({
-                "factor": "cholesterol",
-                "value": cholesterol,
-                "threshold": NEGATIVE_FACTOR_THRESHOLDS["cholesterol"],
-                "unit": "mg",
-                "penalty": -5
-            })
-        
-        return factors
\ No newline at end of file
+        for bit, (field, threshold, unit, penalty) in enumerate(self._negative_specs):
+            value = nutrition_data.get(field, 0)
+            if value > threshold:
+                mask |= 1 << bit
+                factors.append({
+                    "factor": field,
+                    "value": value,
+                    "threshold": threshold,
+                    "unit": unit,
+                    "penalty": penalty
+                })
+        
+        return self._negative_penalty_lut[mask], mask, factors
@@ -17,27 +17,67 @@ The analyzer uses both nutrition data and keyword matching to provide
 comprehensive ingredient risk assessment.
 """
 
+import heapq
 import logging
 import re
-from typing import List, Dict, Optional, Tuple
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 from app.utils.constants import (
     UNHEALTHY_KEYWORDS,
     NEGATIVE_FACTOR_THRESHOLDS,
     RISKY_INGREDIENT_CATEGORIES
 )
 from app.utils.helpers import normalize_ingredient_name, categorize_ingredient
+from app.services._ingredient_kernels import NUMBA_AVAILABLE, pack_strings, scan_indicators
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Minimum health impact for priority levels 2-5 (below the first cut: 1)
+_PRIORITY_IMPACT_CUTS_TUPLE = (3.0, 5.0, 7.0, 9.0)
+_PRIORITY_IMPACT_CUTS = np.array(_PRIORITY_IMPACT_CUTS_TUPLE, dtype=np.float64)
+# RiskyIngredient fields in to_dict order, read in one C-level call
+_DICT_KEYS = (
+    "name", "reason", "priority", "category",
+    "health_impact", "alternatives_available"
+)
+_DICT_FIELDS = attrgetter(*_DICT_KEYS)
+# Sort key for swap priority (see prioritize_swaps)
+_HEALTH_IMPACT_KEY = attrgetter("health_impact")
+# Below this many ingredients NumPy setup costs more than the Python loop
+_VECTORIZE_MIN_INGREDIENTS = 8
+# Ingredient categories with healthy substitutes (most of them)
+_CATEGORIES_WITH_ALTERNATIVES = frozenset((
+    "oil", "sweetener", "dairy", "grain", "protein",
+    "spice", "vegetable", "fruit"
+))
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for regex \\b boundaries."""
+    return char.isalnum() or char == "_"
 
-@dataclass
+
+@dataclass(slots=True)
 class RiskyIngredient:
     """
     Data class representing a risky or unhealthy ingredient.
     
+    Slotted (no per-instance __dict__): analyses create one per flagged
+    ingredient, and only the fields below are ever set.
+    
     Attributes:
         name: Ingredient name as it appears in recipe
         reason: Explanation of why this ingredient is risky
@@ -68,6 +108,22 @@ class RiskyIngredient:
             "health_impact": self.health_impact,
             "alternatives_available": self.alternatives_available
         }
+    
+    @classmethod
+    def batch_to_dicts(cls, items: Iterable["RiskyIngredient"]) -> List[Dict]:
+        """
+        Convert many risky ingredients to dictionaries at once.
+        
+        Same output as [item.to_dict() for item in items], without a
+        Python-level attribute lookup per field.
+        
+        Args:
+            items: RiskyIngredient objects
+            
+        Returns:
+            List[Dict]: One to_dict()-style dictionary per item
+        """
+        return [dict(zip(_DICT_KEYS, _DICT_FIELDS(item))) for item in items]
 
 
 class IngredientAnalyzer:
@@ -100,13 +156,98 @@ class IngredientAnalyzer:
             "processed": 4.0,        # Medium-low risk
             "preservative": 3.0      # Low-medium risk
         }
+        # Human-readable reason per risk category, formatted with the keyword
+        self._reason_templates = {
+            "trans_fat": "Contains trans fats ({kw}) which increase heart disease risk",
+            "refined": "Highly refined product ({kw}) with reduced nutritional value",
+            "artificial": "Contains artificial additives ({kw}) with potential health concerns",
+            "high_sodium": "High sodium ingredient ({kw}) may contribute to hypertension",
+            "processed": "Highly processed ingredient ({kw}) with lower nutrient density",
+            "preservative": "Contains preservatives ({kw}) that may cause sensitivities",
+            "high_fat": "High in saturated fat ({kw}) which may raise cholesterol levels",
+            "high_sugar": "High in added sugars ({kw}) which may spike blood glucose"
+        }
+        
+        # Categories in descending risk weight (ties keep table order): an
+        # ingredient matching several categories is reported under the most
+        # harmful one, and the regex scan can stop at the first hit
+        self._ordered_keywords: List[Tuple[str, List[str]]] = sorted(
+            self.unhealthy_keywords.items(),
+            key=lambda kv: -self.risk_weights.get(kv[0], 0.0)
+        )
+        
+        # Precompile keyword regexes once: per category, a single alternation
+        # to reject non-matching ingredients in one scan, plus the individual
+        # keyword patterns (in list order) to report the same keyword as before
+        self._category_patterns: List[Tuple[str, Pattern, Tuple[Tuple[str, Pattern], ...]]] = [
+            (
+                risk_category,
+                re.compile(
+                    r'\b(?:' + '|'.join(re.escape(k.lower()) for k in keywords) + r')\b'
+                ),
+                tuple(
+                    (keyword, re.compile(r'\b' + re.escape(keyword.lower()) + r'\b'))
+                    for keyword in keywords
+                )
+            )
+            for risk_category, keywords in self._ordered_keywords
+            if keywords
+        ]
+        self._keyword_automaton = self._build_keyword_automaton()
+        # Every keyword match contains that keyword's leading bigram, so an
+        # ingredient sharing none of them can skip the regex scan entirely
+        # (disabled if a single-character keyword ever shows up)
+        all_keywords = [k.lower() for kws in self.unhealthy_keywords.values() for k in kws]
+        self._keyword_bigrams: Optional[frozenset] = (
+            frozenset(keyword[:2] for keyword in all_keywords)
+            if all(len(keyword) >= 2 for keyword in all_keywords) else None
+        )
+        # Health impact of a keyword match by risk category. Preservatives keep
+        # the medium default (5.0) they have always been scored with.
+        self._keyword_impacts: Dict[str, float] = {
+            category: self.risk_weights[category]
+            for category in (
+                "trans_fat", "high_fat", "artificial", "refined",
+                "high_sodium", "high_sugar", "processed"
+            )
+        }
+        
+        # Ingredients likely responsible for a high recipe-level nutrient:
+        # (nutrient key, reason template, risk weight key, substring indicators)
+        nutrient_indicators = [
+            ("sodium", "High sodium content ({})", "high_sodium", (
+                "salt", "soy sauce", "teriyaki", "broth", "stock",
+                "bouillon", "pickle", "olive", "caper", "bacon",
+                "ham", "sausage", "cheese", "miso"
+            )),
+            ("sugar", "High sugar content ({})", "high_sugar", (
+                "sugar", "honey", "syrup", "molasses", "agave",
+                "corn syrup", "fructose", "glucose", "dextrose",
+                "maltose", "sucrose", "cane juice"
+            )),
+            ("saturated_fat", "High saturated fat content ({})", "refined", (
+                "butter", "cream", "lard", "shortening",
+                "coconut oil", "palm oil", "cheese", "bacon"
+            )),
+        ]
+        # Same entries plus a prebuilt automaton over the indicators (or None)
+        self._nutrient_indicators: List[Tuple[str, str, str, Tuple[str, ...], object]] = [
+            (*group, self._build_indicator_automaton(group[3]))
+            for group in nutrient_indicators
+        ]
+        # Packed indicator bytes for the Numba batch scan, keyed by nutrient
+        self._indicator_packs: Dict[str, Tuple[np.ndarray, np.ndarray]] = (
+            {group[0]: pack_strings(group[3]) for group in nutrient_indicators}
+            if NUMBA_AVAILABLE else {}
+        )
         
         logger.info("IngredientAnalyzer initialized")
     
     def identify_risky_ingredients(
         self,
         ingredients: List[str],
-        nutrition_data: Dict
+        nutrition_data: Dict,
+        top_k: Optional[int] = None
     ) -> List[RiskyIngredient]:
         """
         Identify ingredients that need swapping based on health risks.
@@ -134,6 +275,8 @@ class IngredientAnalyzer:
                     "trans_fat": float,
                     ...
                 }
+            top_k: Only return the top_k highest-priority ingredients
+                (default: all of them)
                 
         Returns:
             List[RiskyIngredient]: Sorted list of risky ingredients
@@ -152,45 +295,54 @@ class IngredientAnalyzer:
         risky_ingredients = []
         detected_names = set()  # Avoid duplicates
         
-        # Step 1: Keyword-based detection
-        for ingredient in ingredients:
-            normalized = normalize_ingredient_name(ingredient)
-            
-            # Check for unhealthy keywords
-            risk_reason = self.check_for_unhealthy_keywords(normalized)
-            
-            if risk_reason:
-                # Get ingredient category
+        # Recipes often repeat an ingredient (e.g. butter in two steps): scan
+        # each distinct normalized name once, keeping its first spelling
+        normalized_list = [normalize_ingredient_name(ingredient) for ingredient in ingredients]
+        unique: Dict[str, str] = {}
+        for ingredient, normalized in zip(ingredients, normalized_list):
+            unique.setdefault(normalized, ingredient)
+        
+        # Step 1: Keyword-based detection. Reason, category and impact are
+        # worked out once per distinct flagged name; objects are only built
+        # at the end, one per occurrence
+        flagged: Dict[str, Tuple[str, str, float, bool]] = {}
+        for normalized in unique:
+            keyword_match = self.check_for_unhealthy_keywords(normalized)
+            if keyword_match:
+                risk_category, keyword = keyword_match
                 category = categorize_ingredient(normalized)
-                
-                # Calculate health impact
-                health_impact = self._calculate_health_impact(
-                    normalized,
-                    risk_reason,
-                    nutrition_data
-                )
-                
-                # Create RiskyIngredient object
-                risky_ing = RiskyIngredient(
-                    name=ingredient,
-                    reason=risk_reason,
-                    priority=0,  # Will be assigned later
-                    category=category,
-                    health_impact=health_impact,
-                    alternatives_available=self._check_alternatives_available(category)
+                flagged[normalized] = (
+                    self._generate_risk_reason(risk_category, keyword),
+                    category,
+                    self._calculate_health_impact(risk_category),
+                    self._check_alternatives_available(category)
                 )
-                
-                risky_ingredients.append(risky_ing)
-                detected_names.add(normalized)
-                
+        
+        for ingredient, normalized in zip(ingredients, normalized_list):
+            if normalized not in flagged:
+                continue
+            risk_reason, category, health_impact, alternatives_available = flagged[normalized]
+            risky_ingredients.append(RiskyIngredient(
+                name=ingredient,
+                reason=risk_reason,
+                priority=0,  # Will be assigned later
+                category=category,
+                health_impact=health_impact,
+                alternatives_available=alternatives_available
+            ))
+            
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"Detected risky ingredient: {ingredient} "
-                    f"(reason: {risk_reason}, impact: {health_impact:.1f})"
+                    "Detected risky ingredient: %s (reason: %s, impact: %.1f)",
+                    ingredient, risk_reason, health_impact
                 )
+        detected_names.update(flagged)
         
         # Step 2: Nutrition-based detection
+        # Only a name's first occurrence can be claimed here, so the distinct
+        # ingredients give the same result
         nutrition_risky = self._identify_risky_by_nutrition(
-            ingredients,
+            [(ingredient, normalized) for normalized, ingredient in unique.items()],
             nutrition_data,
             detected_names
         )
@@ -199,7 +351,7 @@ class IngredientAnalyzer:
         
         # Step 3: Prioritize swaps
         if risky_ingredients:
-            risky_ingredients = self.prioritize_swaps(risky_ingredients)
+            risky_ingredients = self.prioritize_swaps(risky_ingredients, top_k=top_k)
         
         logger.info(
             f"Identified {len(risky_ingredients)} risky ingredient(s) "
@@ -208,7 +360,7 @@ class IngredientAnalyzer:
         
         return risky_ingredients
     
-    def check_for_unhealthy_keywords(self, ingredient: str) -> Optional[str]:
+    def check_for_unhealthy_keywords(self, ingredient: str) -> Optional[Tuple[str, str]]:
         """
         Detect unhealthy ingredients by keyword matching.
         
@@ -220,8 +372,10 @@ class IngredientAnalyzer:
                 Example: "partially hydrogenated soybean oil"
                 
         Returns:
-            str: Risk reason if unhealthy keywords found, None otherwise
-                 Example: "Contains trans fats (hydrogenated oil)"
+            Optional[Tuple[str, str]]: (risk_category, keyword) if unhealthy
+                 keywords found, None otherwise; pass it to
+                 _generate_risk_reason for the human-readable reason
+                 Example: ("trans_fat", "hydrogenated")
                  
         Keywords checked:
         - Trans fats: "hydrogenated", "partially hydrogenated"
@@ -232,22 +386,100 @@ class IngredientAnalyzer:
         """
         ingredient_lower = ingredient.lower()
         
-        # Check each category of unhealthy keywords
-        for risk_category, keywords in self.unhealthy_keywords.items():
-            for keyword in keywords:
-                # Use word boundary matching to avoid false positives
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                
-                if re.search(pattern, ingredient_lower):
-                    # Generate appropriate reason message
-                    reason = self._generate_risk_reason(risk_category, keyword)
-                    
-                    logger.debug(
-                        f"Keyword match: '{keyword}' in '{ingredient}' "
-                        f"(category: {risk_category})"
-                    )
-                    
-                    return reason
+        if self._keyword_automaton is not None:
+            match = self._match_keyword_automaton(ingredient_lower)
+        else:
+            match = self._match_keyword_regex(ingredient_lower)
+        
+        if match is None:
+            return None
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            risk_category, keyword = match
+            logger.debug(
+                "Keyword match: '%s' in '%s' (category: %s)",
+                keyword, ingredient, risk_category
+            )
+        
+        return match
+    
+    def _build_keyword_automaton(self):
+        """
+        Build an Aho-Corasick automaton over every unhealthy keyword.
+        
+        Each keyword maps to the (category index, keyword index, category,
+        keyword) entries it appears under, so matches can be ranked in the
+        same category/keyword order as the regex scan.
+        
+        Returns:
+            ahocorasick.Automaton, or None when pyahocorasick is not installed
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        entries: Dict[str, List[Tuple[int, int, str, str]]] = {}
+        for category_idx, (risk_category, keywords) in enumerate(self._ordered_keywords):
+            for keyword_idx, keyword in enumerate(keywords):
+                entries.setdefault(keyword.lower(), []).append(
+                    (category_idx, keyword_idx, risk_category, keyword)
+                )
+        
+        automaton = ahocorasick.Automaton()
+        for keyword_lower, keyword_entries in entries.items():
+            automaton.add_word(keyword_lower, (len(keyword_lower), keyword_entries))
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_keyword_automaton(self, ingredient_lower: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the first matching (risk_category, keyword) with one automaton pass.
+        
+        Args:
+            ingredient_lower: Lower-cased ingredient string
+            
+        Returns:
+            Optional[Tuple[str, str]]: Category and keyword, or None
+        """
+        best = None
+        for end, (length, keyword_entries) in self._keyword_automaton.iter(ingredient_lower):
+            start = end - length + 1
+            # Same word boundaries as the regex path's \b...\b
+            if start > 0 and _is_word_char(ingredient_lower[start - 1]):
+                continue
+            if end + 1 < len(ingredient_lower) and _is_word_char(ingredient_lower[end + 1]):
+                continue
+            for entry in keyword_entries:
+                if best is None or entry < best:
+                    best = entry
+        
+        if best is None:
+            return None
+        return best[2], best[3]
+    
+    def _match_keyword_regex(self, ingredient_lower: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the first matching (risk_category, keyword) with precompiled regexes.
+        
+        Args:
+            ingredient_lower: Lower-cased ingredient string
+            
+        Returns:
+            Optional[Tuple[str, str]]: Category and keyword, or None
+        """
+        if self._keyword_bigrams is not None and self._keyword_bigrams.isdisjoint(
+            ingredient_lower[i:i + 2] for i in range(len(ingredient_lower) - 1)
+        ):
+            return None
+        
+        # Check each category of unhealthy keywords, most harmful first
+        for risk_category, category_pattern, keyword_patterns in self._category_patterns:
+            # Word-boundary alternation of the whole category: one scan when nothing matches
+            if not category_pattern.search(ingredient_lower):
+                continue
+            
+            for keyword, pattern in keyword_patterns:
+                if pattern.search(ingredient_lower):
+                    return risk_category, keyword
         
         return None
     
@@ -262,25 +494,14 @@ class IngredientAnalyzer:
         Returns:
             str: Formatted risk reason
         """
-        reason_templates = {
-            "trans_fat": f"Contains trans fats ({keyword}) which increase heart disease risk",
-            "refined": f"Highly refined product ({keyword}) with reduced nutritional value",
-            "artificial": f"Contains artificial additives ({keyword}) with potential health concerns",
-            "high_sodium": f"High sodium ingredient ({keyword}) may contribute to hypertension",
-            "processed": f"Highly processed ingredient ({keyword}) with lower nutrient density",
-            "preservative": f"Contains preservatives ({keyword}) that may cause sensitivities",
-            "high_fat": f"High in saturated fat ({keyword}) which may raise cholesterol levels",
-            "high_sugar": f"High in added sugars ({keyword}) which may spike blood glucose"
-        }
-        
-        return reason_templates.get(
+        return self._reason_templates.get(
             risk_category,
-            f"Contains {keyword} which may pose health concerns"
-        )
+            "Contains {kw} which may pose health concerns"
+        ).format(kw=keyword)
     
     def _identify_risky_by_nutrition(
         self,
-        ingredients: List[str],
+        normalized_ingredients: List[Tuple[str, str]],
         nutrition_data: Dict,
         already_detected: set
     ) -> List[RiskyIngredient]:
@@ -291,208 +512,149 @@ class IngredientAnalyzer:
         identify which specific ingredients are likely contributors.
         
         Args:
-            ingredients: List of ingredient strings
+            normalized_ingredients: (ingredient string, normalized name) pairs
             nutrition_data: Nutritional data for the recipe
             already_detected: Set of ingredients already flagged
             
         Returns:
             List[RiskyIngredient]: Additional risky ingredients identified
         """
-        additional_risky = []
-        
-        # Check for high sodium
-        if nutrition_data.get("sodium", 0) > NEGATIVE_FACTOR_THRESHOLDS["sodium"]:
-            sodium_sources = self._find_sodium_sources(ingredients, already_detected)
-            additional_risky.extend(sodium_sources)
-        
-        # Check for high sugar
-        if nutrition_data.get("sugar", 0) > NEGATIVE_FACTOR_THRESHOLDS["sugar"]:
-            sugar_sources = self._find_sugar_sources(ingredients, already_detected)
-            additional_risky.extend(sugar_sources)
+        # Nutrient groups whose recipe-level value is above threshold
+        active_groups = [
+            group for group in self._nutrient_indicators
+            if nutrition_data.get(group[0], 0) > NEGATIVE_FACTOR_THRESHOLDS[group[0]]
+        ]
         
-        # Check for high saturated fat
-        if nutrition_data.get("saturated_fat", 0) > NEGATIVE_FACTOR_THRESHOLDS["saturated_fat"]:
-            fat_sources = self._find_fat_sources(ingredients, already_detected)
-            additional_risky.extend(fat_sources)
+        if not active_groups:
+            return []
         
-        return additional_risky
+        return self._find_nutrient_sources(normalized_ingredients, active_groups, already_detected)
     
-    def _find_sodium_sources(
+    def _find_nutrient_sources(
         self,
-        ingredients: List[str],
+        normalized_ingredients: List[Tuple[str, str]],
+        active_groups: List[Tuple[str, str, str, Tuple[str, ...], object]],
         already_detected: set
     ) -> List[RiskyIngredient]:
         """
-        Identify ingredients likely to be high in sodium.
+        Identify ingredients likely to contribute to high sodium, sugar or fat.
+        
+        Each ingredient's normalized name (computed by the caller) is tested
+        against every active group in order (sodium, sugar, saturated fat); the first group with a
+        matching indicator claims it.
         
         Args:
-            ingredients: List of ingredient strings
+            normalized_ingredients: (ingredient string, normalized name) pairs
+            active_groups: Entries of self._nutrient_indicators above threshold
             already_detected: Set of ingredients already flagged
             
         Returns:
-            List[RiskyIngredient]: Sodium-rich ingredients
+            List[RiskyIngredient]: Likely contributors, grouped by nutrient
         """
-        high_sodium_indicators = [
-            "salt", "soy sauce", "teriyaki", "broth", "stock",
-            "bouillon", "pickle", "olive", "caper", "bacon",
-            "ham", "sausage", "cheese", "miso"
-        ]
-        
-        risky = []
-        
-        for ingredient in ingredients:
-            normalized = normalize_ingredient_name(ingredient)
-            
+        # One bucket per group keeps the sodium, sugar, fat output order
+        risky_by_group: List[List[RiskyIngredient]] = [[] for _ in active_groups]
+        
+        # Large lists: one compiled scan per group over every ingredient at once
+        # (normalized names are already lower-case, no .lower() needed)
+        group_hits = None
+        if NUMBA_AVAILABLE and len(normalized_ingredients) >= _VECTORIZE_MIN_INGREDIENTS:
+            text_buf, text_offs = pack_strings(normalized for _, normalized in normalized_ingredients)
+            group_hits = [
+                scan_indicators(text_buf, text_offs, *self._indicator_packs[group[0]]).tolist()
+                for group in active_groups
+            ]
+        
+        for position, (ingredient, normalized) in enumerate(normalized_ingredients):
             if normalized in already_detected:
                 continue
             
-            # Check if ingredient is likely high in sodium
-            for indicator in high_sodium_indicators:
-                if indicator in normalized.lower():
-                    risky.append(RiskyIngredient(
-                        name=ingredient,
-                        reason=f"High sodium content ({indicator})",
-                        priority=0,
-                        category=categorize_ingredient(normalized),
-                        health_impact=self.risk_weights["high_sodium"],
-                        alternatives_available=True
-                    ))
-                    already_detected.add(normalized)
-                    break
-        
-        return risky
+            for group_idx, (bucket, (_, reason_template, weight_key, indicators, automaton)) in enumerate(
+                zip(risky_by_group, active_groups)
+            ):
+                if group_hits is not None:
+                    hit = group_hits[group_idx][position]
+                    indicator = indicators[hit] if hit >= 0 else None
+                else:
+                    indicator = self._first_indicator(normalized, indicators, automaton)
+                if indicator is None:
+                    continue
+                
+                bucket.append(RiskyIngredient(
+                    name=ingredient,
+                    reason=reason_template.format(indicator),
+                    priority=0,
+                    category=categorize_ingredient(normalized),
+                    health_impact=self.risk_weights[weight_key],
+                    alternatives_available=True
+                ))
+                already_detected.add(normalized)
+                break
+        
+        return [risky for bucket in risky_by_group for risky in bucket]
     
-    def _find_sugar_sources(
-        self,
-        ingredients: List[str],
-        already_detected: set
-    ) -> List[RiskyIngredient]:
+    @staticmethod
+    def _build_indicator_automaton(indicators: Tuple[str, ...]):
         """
-        Identify ingredients likely to be high in sugar.
+        Build an Aho-Corasick automaton mapping each indicator to its list index.
         
         Args:
-            ingredients: List of ingredient strings
-            already_detected: Set of ingredients already flagged
+            indicators: Lower-case substring indicators
             
         Returns:
-            List[RiskyIngredient]: Sugar-rich ingredients
+            ahocorasick.Automaton, or None when pyahocorasick is not installed
         """
-        high_sugar_indicators = [
-            "sugar", "honey", "syrup", "molasses", "agave",
-            "corn syrup", "fructose", "glucose", "dextrose",
-            "maltose", "sucrose", "cane juice"
-        ]
-        
-        risky = []
-        
-        for ingredient in ingredients:
-            normalized = normalize_ingredient_name(ingredient)
-            
-            if normalized in already_detected:
-                continue
-            
-            # Check if ingredient is likely high in sugar
-            for indicator in high_sugar_indicators:
-                if indicator in normalized.lower():
-                    risky.append(RiskyIngredient(
-                        name=ingredient,
-                        reason=f"High sugar content ({indicator})",
-                        priority=0,
-                        category=categorize_ingredient(normalized),
-                        health_impact=self.risk_weights["high_sugar"],
-                        alternatives_available=True
-                    ))
-                    already_detected.add(normalized)
-                    break
-        
-        return risky
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for index, indicator in enumerate(indicators):
+            if indicator not in automaton:
+                automaton.add_word(indicator, index)
+        automaton.make_automaton()
+        return automaton
     
-    def _find_fat_sources(
-        self,
-        ingredients: List[str],
-        already_detected: set
-    ) -> List[RiskyIngredient]:
+    @staticmethod
+    def _first_indicator(
+        normalized: str,
+        indicators: Tuple[str, ...],
+        automaton
+    ) -> Optional[str]:
         """
-        Identify ingredients likely to be high in saturated fat.
+        Return the earliest-listed indicator contained in normalized, if any.
         
         Args:
-            ingredients: List of ingredient strings
-            already_detected: Set of ingredients already flagged
+            normalized: Normalized (lower-case) ingredient name
+            indicators: Substring indicators in priority order
+            automaton: Automaton from _build_indicator_automaton, or None
             
         Returns:
-            List[RiskyIngredient]: High saturated fat ingredients
+            Optional[str]: Matching indicator, or None
         """
-        high_fat_indicators = [
-            "butter", "cream", "lard", "shortening",
-            "coconut oil", "palm oil", "cheese", "bacon"
-        ]
-        
-        risky = []
-        
-        for ingredient in ingredients:
-            normalized = normalize_ingredient_name(ingredient)
-            
-            if normalized in already_detected:
-                continue
-            
-            # Check if ingredient is likely high in saturated fat
-            for indicator in high_fat_indicators:
-                if indicator in normalized.lower():
-                    risky.append(RiskyIngredient(
-                        name=ingredient,
-                        reason=f"High saturated fat content ({indicator})",
-                        priority=0,
-                        category=categorize_ingredient(normalized),
-                        health_impact=self.risk_weights["refined"],
-                        alternatives_available=True
-                    ))
-                    already_detected.add(normalized)
-                    break
+        if automaton is None:
+            return next((i for i in indicators if i in normalized), None)
         
-        return risky
+        index = min((index for _, index in automaton.iter(normalized)), default=None)
+        return None if index is None else indicators[index]
     
-    def _calculate_health_impact(
-        self,
-        ingredient: str,
-        risk_reason: str,
-        nutrition_data: Dict
-    ) -> float:
+    def _calculate_health_impact(self, risk_category: str) -> float:
         """
-        Calculate estimated health impact score for a risky ingredient.
+        Calculate estimated health impact score for a keyword-detected ingredient.
         
         Higher scores indicate greater negative health impact.
         
         Args:
-            ingredient: Ingredient name
-            risk_reason: The risk reason string
-            nutrition_data: Overall nutrition data
+            risk_category: Category returned by check_for_unhealthy_keywords
             
         Returns:
-            float: Health impact score (0-10)
-        """
-        # Extract risk category from reason
-        impact = 5.0  # Default medium impact
-        
-        if "trans fat" in risk_reason.lower():
-            impact = self.risk_weights["trans_fat"]
-        elif "saturated fat" in risk_reason.lower():
-            impact = self.risk_weights["high_fat"]
-        elif "artificial" in risk_reason.lower():
-            impact = self.risk_weights["artificial"]
-        elif "refined" in risk_reason.lower():
-            impact = self.risk_weights["refined"]
-        elif "sodium" in risk_reason.lower():
-            impact = self.risk_weights["high_sodium"]
-        elif "sugar" in risk_reason.lower():
-            impact = self.risk_weights["high_sugar"]
-        elif "processed" in risk_reason.lower():
-            impact = self.risk_weights["processed"]
-        
-        return impact
+            float: Health impact score (0-10); 5.0 (medium) for categories
+                   without a keyword impact
+        """
+        return self._keyword_impacts.get(risk_category, 5.0)
     
     def prioritize_swaps(
         self,
-        risky_ingredients: List[RiskyIngredient]
+        risky_ingredients: List[RiskyIngredient],
+        top_k: Optional[int] = None
     ) -> List[RiskyIngredient]:
         """
         Sort ingredients by swap priority to maximize health improvements.
@@ -511,22 +673,42 @@ class IngredientAnalyzer:
         
         Args:
             risky_ingredients: Unsorted list of RiskyIngredient objects
+            top_k: Only return the top_k highest-priority ingredients
+                (default: all of them)
             
         Returns:
             List[RiskyIngredient]: Sorted list (highest priority first)
         """
         logger.info(f"Prioritizing {len(risky_ingredients)} risky ingredients")
         
-        # Assign priority levels based on health impact
-        for ingredient in risky_ingredients:
-            ingredient.priority = self._assign_priority_level(ingredient)
-        
-        # Sort by priority (descending), then by health impact (descending)
-        sorted_ingredients = sorted(
-            risky_ingredients,
-            key=lambda x: (x.priority, x.health_impact),
-            reverse=True
-        )
+        impacts = None
+        if len(risky_ingredients) < _VECTORIZE_MIN_INGREDIENTS:
+            # Assign priority levels based on health impact
+            for ingredient in risky_ingredients:
+                ingredient.priority = self._assign_priority_level(ingredient)
+        else:
+            impacts = np.fromiter(
+                (ingredient.health_impact for ingredient in risky_ingredients),
+                dtype=np.float64,
+                count=len(risky_ingredients)
+            )
+            priorities = np.searchsorted(_PRIORITY_IMPACT_CUTS, impacts, side="right") + 1
+            for ingredient, priority in zip(risky_ingredients, priorities.tolist()):
+                ingredient.priority = priority
+        
+        # Priority is a non-decreasing step function of health impact, so
+        # (priority, health_impact) orders exactly like health_impact alone:
+        # a single float key, read by a C-level attrgetter
+        if top_k is not None:
+            # Partial selection, O(N log k): same order as sorted(...)[:top_k]
+            sorted_ingredients = heapq.nlargest(top_k, risky_ingredients, key=_HEALTH_IMPACT_KEY)
+        elif impacts is None:
+            # Sort by priority (descending), then by health impact (descending)
+            sorted_ingredients = sorted(risky_ingredients, key=_HEALTH_IMPACT_KEY, reverse=True)
+        else:
+            # Stable sort on the negated key: same order as sorted(..., reverse=True)
+            order = np.argsort(-impacts, kind="stable")
+            sorted_ingredients = [risky_ingredients[i] for i in order.tolist()]
         
         # Log priority distribution
         priority_counts = {}
@@ -547,27 +729,9 @@ class IngredientAnalyzer:
         Returns:
             int: Priority level (1-5)
         """
-        impact = ingredient.health_impact
-        
-        # Critical priority (5)
-        if impact >= 9.0:
-            return 5
-        
-        # High priority (4)
-        elif impact >= 7.0:
-            return 4
-        
-        # Medium priority (3)
-        elif impact >= 5.0:
-            return 3
-        
-        # Low priority (2)
-        elif impact >= 3.0:
-            return 2
-        
-        # Optional priority (1)
-        else:
-            return 1
+        # 1 (optional) below 3.0, 2 (low) from 3.0, 3 (medium) from 5.0,
+        # 4 (high) from 7.0, 5 (critical) from 9.0
+        return bisect_right(_PRIORITY_IMPACT_CUTS_TUPLE, ingredient.health_impact) + 1
     
     def _check_alternatives_available(self, category: str) -> bool:
         """
@@ -579,13 +743,7 @@ class IngredientAnalyzer:
         Returns:
             bool: True if alternatives available
         """
-        # Most categories have alternatives
-        categories_with_alternatives = [
-            "oil", "sweetener", "dairy", "grain", "protein",
-            "spice", "vegetable", "fruit"
-        ]
-        
-        return category in categories_with_alternatives
+        return category in _CATEGORIES_WITH_ALTERNATIVES
     
     def create_risky_from_list(
         self,
@@ -610,15 +768,32 @@ class IngredientAnalyzer:
         
         risky = []
         
-        for name in ingredient_names:
-            normalized_name = normalize_ingredient_name(name)
-            
+        # Normalize the recipe's ingredients once, not once per selected name
+        normalized_full = [
+            (ingredient, normalize_ingredient_name(ingredient))
+            for ingredient in full_ingredients
+        ]
+        
+        normalized_names = [normalize_ingredient_name(name) for name in ingredient_names]
+        
+        # Many selections: find every name's first containing ingredient in one
+        # automaton pass over the recipe instead of a scan per name
+        first_matches = None
+        if AHOCORASICK_AVAILABLE and len(ingredient_names) >= _VECTORIZE_MIN_INGREDIENTS:
+            first_matches = self._first_containing_ingredients(
+                set(normalized_names), normalized_full
+            )
+        
+        for name, normalized_name in zip(ingredient_names, normalized_names):
             # Find matching ingredient in full list
-            matched_ingredient = None
-            for ingredient in full_ingredients:
-                if normalized_name in normalize_ingredient_name(ingredient):
-                    matched_ingredient = ingredient
-                    break
+            if first_matches is not None:
+                matched_ingredient = first_matches.get(normalized_name)
+            else:
+                matched_ingredient = next(
+                    (ingredient for ingredient, normalized in normalized_full
+                     if normalized_name in normalized),
+                    None
+                )
             
             if not matched_ingredient:
                 matched_ingredient = name
@@ -639,6 +814,45 @@ class IngredientAnalyzer:
         
         return risky
     
+    @staticmethod
+    def _first_containing_ingredients(
+        normalized_names: set,
+        normalized_full: List[Tuple[str, str]]
+    ) -> Dict[str, str]:
+        """
+        Map each normalized name to the first ingredient whose normalized form contains it.
+        
+        Args:
+            normalized_names: Normalized names to look up
+            normalized_full: (ingredient, normalized ingredient) pairs in recipe order
+            
+        Returns:
+            Dict[str, str]: Name -> original ingredient string; names with no
+            containing ingredient are absent
+        """
+        first_matches: Dict[str, str] = {}
+        
+        # The empty name is contained in every ingredient
+        if "" in normalized_names and normalized_full:
+            first_matches[""] = normalized_full[0][0]
+        
+        words = [name for name in normalized_names if name]
+        if not words:
+            return first_matches
+        
+        automaton = ahocorasick.Automaton()
+        for name in words:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        
+        for ingredient, normalized in normalized_full:
+            for _, name in automaton.iter(normalized):
+                first_matches.setdefault(name, ingredient)
+            if len(first_matches) == len(normalized_names):
+                break
+        
+        return first_matches
+    
     def get_statistics(self) -> Dict:
         """
         Get statistics about the ingredient analyzer.
@@ -11,14 +11,78 @@ Template-based generation is fast, free, and provides consistent,
 understandable explanations without external dependencies.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import re
+import string
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 from app.models.health_score import HealthScore
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Nutrient highlight/concern rules: (nutrient, bucket, ((threshold, label), ...))
+# with thresholds in descending order so the strongest label wins. Highlights
+# apply from the threshold up, concerns only above it.
+_NUTRIENT_RULES = (
+    ("protein", "highlight", ((20, "excellent protein content"), (10, "good protein content"))),
+    ("fiber", "highlight", ((5, "high fiber"),)),
+    ("sodium", "concern", ((600, "high sodium"), (400, "moderately high sodium"))),
+    ("sugar", "concern", ((25, "high sugar content"),)),
+    ("saturated_fat", "concern", ((10, "high saturated fat"),)),
+)
+
+# Static instructions for the Gemini craving prompts. They go first, and
+# byte-identical on every call, so provider-side prefix caching can reuse
+# them; only the per-request fields follow.
+_CRAVING_SYSTEM_PROMPT = (
+    "You are a nutrition psychologist. In 2 sentences, explain the "
+    "psychological or physiological reason why someone would crave the "
+    "following. Be specific and evidence-based. No bullet points.\n\n"
+)
+_CRAVING_PATTERN_SYSTEM_PROMPT = (
+    "You are a nutrition psychologist analysing a user's craving log "
+    "summary. Identify up to 3 actionable behavioural patterns from the "
+    "summary below. Return each pattern as a single sentence. No intro text.\n\n"
+)
+
+# Leading list markers Gemini puts on pattern lines ("1. ", "2) ", "- ", "• ", "* ")
+_BULLET_RE = re.compile(r"^[\s•*\-\d.)]+")
+
+# Craving prompts are cache-keyed on a normalized form so trivially different
+# text ("Stressed at work!" vs "stressed  at work") shares an entry
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_prompt(text: str) -> str:
+    """Lower-case, strip punctuation and collapse whitespace for cache keys."""
+    text = unicodedata.normalize("NFKD", text).lower().translate(_PUNCT_TABLE)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+# Closing recommendation by health rating (unknown ratings get the Poor one)
+_RATING_CLOSERS: Dict[str, str] = {
+    "Excellent": "This is a very healthy recipe with minimal improvements needed.",
+    "Good": "This is a healthy recipe overall with some room for improvement.",
+    "Decent": "This recipe is acceptable but could benefit from healthier ingredients.",
+    "Bad": "This recipe needs significant improvements to be considered healthy.",
+    "Poor": "This recipe requires major reformulation to improve its nutritional value.",
+}
+
+# Closing sentence of the analysis summary by workflow
+_WORKFLOW_SENTENCES: Dict[str, str] = {
+    "healthy_recommendation": "We've found similar healthy recipes you might enjoy.",
+    "ingredient_swap": "We suggest healthier ingredient substitutions to improve this recipe.",
+}
+
 
 class LLMExplainer:
     """
@@ -32,6 +96,9 @@ class LLMExplainer:
         api_key: Optional API key for external LLM service
     """
     
+    # Placeholder _api_* methods already warned about, process-wide
+    _API_WARNED: Dict[str, bool] = {"health": False, "swap": False, "summary": False}
+    
     def __init__(self, use_templates: bool = True, api_key: Optional[str] = None):
         """
         Initialize LLM explainer.
@@ -42,11 +109,25 @@ class LLMExplainer:
         """
         self.use_templates = use_templates
         self.api_key = api_key
+        # Gemini client, created on first LLM call and reused afterwards so its
+        # HTTP connections are pooled across requests
+        self._genai_client = None
+        self._genai_client_lock = threading.Lock()
+        # Craving insight responses: prompt hash -> (stored epoch, result),
+        # least recently used first
+        self.insight_cache_ttl = 3600  # seconds
+        self.insight_cache_max_size = 512
+        self._insight_cache: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+        self._insight_cache_lock = threading.Lock()
+        # Cap on concurrent Gemini calls from the async methods (rate limits);
+        # the semaphore is created in the running loop (see _get_llm_semaphore)
+        self.max_concurrent_llm_calls = 8
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._llm_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
         
         logger.info(
-            f"LLMExplainer initialized with "
-            f"use_templates={use_templates}, "
-            f"api_available={bool(api_key)}"
+            "LLMExplainer initialized with use_templates=%s, api_available=%s",
+            use_templates, bool(api_key)
         )
     
     def generate_health_explanation(
@@ -79,7 +160,7 @@ class LLMExplainer:
             #           It provides excellent protein content but has 
             #           moderately high sodium levels..."
         """
-        logger.debug(f"Generating health explanation for score={score}, rating={rating}")
+        logger.debug("Generating health explanation for score=%s, rating=%s", score, rating)
         
         if self.use_templates:
             return self._template_health_explanation(score, rating, nutrition_data)
@@ -94,60 +175,44 @@ class LLMExplainer:
         nutrition_data: Dict
     ) -> str:
         """Generate health explanation using templates."""
-        # Start with score and rating
-        explanation = f"This recipe has a {rating} health rating ({score:.1f}/100). "
+        # Start with score and rating; parts are joined once at the end
+        parts = [f"This recipe has a {rating} health rating ({score:.1f}/100). "]
+        closer = _RATING_CLOSERS.get(rating, _RATING_CLOSERS["Poor"])
+        
+        # No nutrition data (e.g. unknown recipe): nothing to highlight
+        if not isinstance(nutrition_data, dict):
+            logger.warning(
+                "Expected nutrition data dict, got %s; explaining rating only",
+                type(nutrition_data).__name__
+            )
+            nutrition_data = None
+        if not nutrition_data:
+            parts.append(closer)
+            return "".join(parts)
         
-        # Analyze nutritional highlights
+        # Analyze nutritional highlights and concerns
         highlights = []
         concerns = []
         
-        # Check protein
-        protein = nutrition_data.get("protein", 0)
-        if protein >= 20:
-            highlights.append("excellent protein content")
-        elif protein >= 10:
-            highlights.append("good protein content")
-        
-        # Check fiber
-        fiber = nutrition_data.get("fiber", 0)
-        if fiber >= 5:
-            highlights.append("high fiber")
-        
-        # Check concerns
-        sodium = nutrition_data.get("sodium", 0)
-        if sodium > 400:
-            concerns.append("moderately high sodium")
-        elif sodium > 600:
-            concerns.append("high sodium")
-        
-        sugar = nutrition_data.get("sugar", 0)
-        if sugar > 25:
-            concerns.append("high sugar content")
-        
-        saturated_fat = nutrition_data.get("saturated_fat", 0)
-        if saturated_fat > 10:
-            concerns.append("high saturated fat")
+        for nutrient, bucket, thresholds in _NUTRIENT_RULES:
+            value = nutrition_data.get(nutrient, 0)
+            is_highlight = bucket == "highlight"
+            for threshold, label in thresholds:
+                if value >= threshold if is_highlight else value > threshold:
+                    (highlights if is_highlight else concerns).append(label)
+                    break
         
         # Build explanation
         if highlights:
-            explanation += "It provides " + " and ".join(highlights) + ". "
+            parts.append(f"It provides {' and '.join(highlights)}. ")
         
         if concerns:
-            explanation += "However, it has " + " and ".join(concerns) + ". "
+            parts.append(f"However, it has {' and '.join(concerns)}. ")
         
         # Add recommendation based on rating
-        if rating == "Excellent":
-            explanation += "This is a very healthy recipe with minimal improvements needed."
-        elif rating == "Good":
-            explanation += "This is a healthy recipe overall with some room for improvement."
-        elif rating == "Decent":
-            explanation += "This recipe is acceptable but could benefit from healthier ingredients."
-        elif rating == "Bad":
-            explanation += "This recipe needs significant improvements to be considered healthy."
-        else:  # Poor
-            explanation += "This recipe requires major reformulation to improve its nutritional value."
+        parts.append(closer)
         
-        return explanation
+        return "".join(parts)
     
     def generate_swap_explanation(
         self,
@@ -187,38 +252,34 @@ class LLMExplainer:
         """Generate swap explanation using templates."""
         score_improvement = projected_score.score - original_score.score
         
-        explanation = (
+        parts = [
             f"We suggest {len(swaps)} ingredient swap(s) to improve this recipe's "
             f"health score from {original_score.score:.1f} ({original_score.rating}) "
             f"to {projected_score.score:.1f} ({projected_score.rating}). "
-        )
+        ]
         
         # Highlight key swaps
-        if swaps:
-            swap_details = []
-            for swap in swaps[:3]:  # Show top 3 swaps
-                original = swap.get("original", "")
-                substitute_obj = swap.get("substitute", {})
-                substitute = substitute_obj.get("name", "")
-                
-                if original and substitute:
-                    swap_details.append(f"{original} with {substitute}")
+        swap_details = []
+        for swap in islice(swaps, 3):  # Show top 3 swaps
+            original = swap.get("original", "")
+            substitute_obj = swap.get("substitute", {})
+            substitute = substitute_obj.get("name", "")
             
-            if swap_details:
-                explanation += (
-                    "Key substitutions include replacing " +
-                    ", ".join(swap_details) + ". "
-                )
+            if original and substitute:
+                swap_details.append(f"{original} with {substitute}")
+        
+        if swap_details:
+            parts.append(f"Key substitutions include replacing {', '.join(swap_details)}. ")
         
         # Add improvement context
         if score_improvement >= 15:
-            explanation += "These changes will significantly improve the nutritional profile."
+            parts.append("These changes will significantly improve the nutritional profile.")
         elif score_improvement >= 8:
-            explanation += "These changes will notably improve the recipe's healthiness."
+            parts.append("These changes will notably improve the recipe's healthiness.")
         else:
-            explanation += "These changes will provide modest health improvements."
+            parts.append("These changes will provide modest health improvements.")
         
-        return explanation
+        return "".join(parts)
     
     def summarize_analysis(self, full_analysis: Dict) -> str:
         """
@@ -250,20 +311,29 @@ class LLMExplainer:
         allergens = full_analysis.get("allergens", [])
         workflow = full_analysis.get("workflow", "")
         
-        summary = f"{recipe_name} has a {rating} health rating ({score:.1f}/100). "
+        parts = [f"{recipe_name} has a {rating} health rating ({score:.1f}/100). "]
         
-        if allergens:
-            allergen_names = [a.get("name", "") for a in allergens]
-            summary += f"Contains allergens: {', '.join(allergen_names)}. "
+        if not allergens:
+            parts.append("No common allergens detected. ")
+        elif len(allergens) == 1:
+            # Most flagged recipes have a single allergen: no list or join needed
+            parts.append(f"Contains allergens: {allergens[0].get('name', '')}. ")
         else:
-            summary += "No common allergens detected. "
+            parts.append(f"Contains allergens: {', '.join(a.get('name', '') for a in allergens)}. ")
         
-        if workflow == "healthy_recommendation":
-            summary += "We've found similar healthy recipes you might enjoy."
-        elif workflow == "ingredient_swap":
-            summary += "We suggest healthier ingredient substitutions to improve this recipe."
+        parts.append(_WORKFLOW_SENTENCES.get(workflow, ""))
         
-        return summary
+        return "".join(parts)
+    
+    @classmethod
+    def _warn_api_fallback(cls, key: str, description: str) -> None:
+        """Log the not-implemented fallback for an _api_* method once per process."""
+        if not cls._API_WARNED[key]:
+            cls._API_WARNED[key] = True
+            logger.warning(
+                "[LLM FALLBACK] LLM API not implemented for %s - falling back to template",
+                description
+            )
     
     def _api_health_explanation(
         self,
@@ -277,7 +347,7 @@ class LLMExplainer:
         NOTE: Not implemented in MVP. This is a placeholder for future
         integration with Claude, GPT, or other LLM services.
         """
-        logger.warning("[LLM FALLBACK] LLM API not implemented for health explanation - falling back to template")
+        self._warn_api_fallback("health", "health explanation")
         return self._template_health_explanation(score, rating, nutrition_data)
     
     def _api_swap_explanation(
@@ -291,7 +361,7 @@ class LLMExplainer:
         
         NOTE: Not implemented in MVP. Placeholder for future LLM integration.
         """
-        logger.warning("[LLM FALLBACK] LLM API not implemented for swap explanation - falling back to template")
+        self._warn_api_fallback("swap", "swap explanation")
         return self._template_swap_explanation(swaps, original_score, projected_score)
 
     def generate_llm_swap_explanation(
@@ -320,8 +390,6 @@ class LLMExplainer:
             return self._template_swap_explanation(swaps, original_score, projected_score)
 
         try:
-            from google import genai
-
             # Build a structured prompt with molecule evidence
             swap_lines = []
             for s in swaps[:5]:
@@ -345,7 +413,7 @@ class LLMExplainer:
                 "Mention specific molecules when available. No bullet points or headings."
             )
 
-            client = genai.Client(api_key=self.api_key)
+            client = self._get_genai_client()
             response = client.models.generate_content(
                 model="gemini-2.0-flash",
                 contents=prompt,
@@ -355,7 +423,7 @@ class LLMExplainer:
                 logger.info("🚨 [LLM] Swap explanation generated via Gemini")
                 return text
         except Exception as e:
-            logger.warning(f"LLM swap explanation failed: {e}")
+            logger.warning("LLM swap explanation failed: %s", e)
             logger.warning("[LLM FALLBACK] Gemini failed for swap explanation. Using template.")
 
         return self._template_swap_explanation(swaps, original_score, projected_score)
@@ -366,13 +434,129 @@ class LLMExplainer:
         
         NOTE: Not implemented in MVP. Placeholder for future LLM integration.
         """
-        logger.warning("[LLM FALLBACK] LLM API not implemented for analysis summary - falling back to template")
+        self._warn_api_fallback("summary", "analysis summary")
         return self._template_analysis_summary(full_analysis)
 
+    def _get_genai_client(self):
+        """
+        Return the shared Gemini client, creating it on first use.
+
+        Raises ImportError when google-genai is not installed; callers
+        treat that like any other LLM failure and fall back.
+        """
+        if self._genai_client is None:
+            with self._genai_client_lock:
+                if self._genai_client is None:
+                    from google import genai
+
+                    self._genai_client = genai.Client(api_key=self.api_key)
+        return self._genai_client
+
     # ==================================================================
     # Craving Replacement System — LLM-backed insight generation
     # ==================================================================
 
+    @staticmethod
+    def _insight_cache_key(kind: str, text: str) -> str:
+        """Hash an insight kind and its deterministic request text into a cache key."""
+        return hashlib.sha256(f"{kind}\n{text}".encode("utf-8")).hexdigest()
+
+    def _get_cached_insight(self, key: str):
+        """Return a cached insight that hasn't expired, or None."""
+        with self._insight_cache_lock:
+            entry = self._insight_cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.insight_cache_ttl:
+                del self._insight_cache[key]
+                return None
+            self._insight_cache.move_to_end(key)
+            return entry[1]
+
+    def _remember_insight(self, key: str, value) -> None:
+        """
+        Cache a successful insight, evicting the least recently used entry
+        once the cache holds insight_cache_max_size results.
+        """
+        with self._insight_cache_lock:
+            self._insight_cache[key] = (time.time(), value)
+            self._insight_cache.move_to_end(key)
+            while len(self._insight_cache) > self.insight_cache_max_size:
+                self._insight_cache.popitem(last=False)
+
+    @staticmethod
+    def _craving_insight_prompt(craving_request) -> str:
+        """Build the Gemini prompt for a single craving."""
+        prompt_lines = [
+            f"craving: {craving_request.craving_text}",
+            f"flavor: {craving_request.flavor_type.value}",
+            f"time: {craving_request.time_of_day.value}",
+        ]
+        if craving_request.mood:
+            prompt_lines.append(f"mood: {craving_request.mood.value}")
+        if craving_request.context:
+            prompt_lines.append(f"context: {craving_request.context}")
+        return _CRAVING_SYSTEM_PROMPT + "\n".join(prompt_lines) + "\n"
+
+    def _craving_insight_request(self, craving_request) -> Tuple[str, str]:
+        """Prompt and cache key for a craving insight."""
+        prompt = self._craving_insight_prompt(craving_request)
+        # Gemini still gets the original prompt; only the key is normalized
+        return prompt, self._insight_cache_key("craving", _normalize_prompt(prompt))
+
+    def _finish_craving_insight(self, cache_key: str, response) -> Optional[str]:
+        """Extract and cache the insight text from a Gemini response."""
+        text = response.text.strip() if response and response.text else None
+        if text:
+            logger.info("🚨 [LLM] Craving insight generated via Gemini")
+            self._remember_insight(cache_key, text)
+        return text
+
+    @staticmethod
+    def _craving_insight_failed(error: Exception) -> None:
+        logger.warning("LLM craving insight failed: %s", error)
+        logger.warning("[LLM FALLBACK] Gemini LLM failed to generate craving insight. Caller will use template fallback.")
+
+    def _pattern_insights_request(self, history_summary: Dict) -> Tuple[str, str]:
+        """Prompt and cache key for craving pattern insights."""
+        # Sorted so the summary's key order doesn't matter
+        cache_key = self._insight_cache_key("patterns", repr(sorted(history_summary.items())))
+        return f"{_CRAVING_PATTERN_SYSTEM_PROMPT}{history_summary}\n", cache_key
+
+    def _finish_pattern_insights(self, cache_key: str, response) -> Optional[List[str]]:
+        """Parse and cache the pattern lines (at most 3) from a Gemini response."""
+        if not (response and response.text):
+            return None
+        logger.info("🚨 [LLM] Craving pattern insights generated via Gemini")
+        lines = [
+            _BULLET_RE.sub("", line.strip(), count=1)
+            for line in response.text.splitlines()
+            if line.strip()
+        ][:3]
+        if not lines:
+            return None
+        self._remember_insight(cache_key, tuple(lines))
+        return lines
+
+    @staticmethod
+    def _pattern_insights_failed(error: Exception) -> None:
+        logger.warning("LLM pattern insight failed: %s", error)
+        logger.warning("[LLM FALLBACK] Gemini LLM failed to generate craving pattern insights. Returning None.")
+
+    def _get_llm_semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the semaphore capping concurrent async Gemini calls.
+
+        Created inside the running event loop (and recreated if the explainer
+        is used from another loop): before Python 3.10 an asyncio.Semaphore
+        binds to the loop current at construction.
+        """
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
+
     def generate_craving_insight(self, craving_request) -> Optional[str]:
         """
         Generate a 1-2 sentence psychological insight for a craving using Gemini.
@@ -383,33 +567,47 @@ class LLMExplainer:
             return None
 
         try:
-            from google import genai
-
-            client = genai.Client(api_key=self.api_key)
-            prompt = (
-                "You are a nutrition psychologist. In 2 sentences, explain the "
-                "psychological or physiological reason why someone would crave "
-                f"'{craving_request.craving_text}' "
-                f"(flavor: {craving_request.flavor_type.value}) "
-                f"at {craving_request.time_of_day.value}"
-            )
-            if craving_request.mood:
-                prompt += f" while feeling {craving_request.mood.value}"
-            if craving_request.context:
-                prompt += f" (context: {craving_request.context})"
-            prompt += ". Be specific and evidence-based. No bullet points."
+            prompt, cache_key = self._craving_insight_request(craving_request)
+            cached = self._get_cached_insight(cache_key)
+            if cached is not None:
+                return cached
 
+            client = self._get_genai_client()
             response = client.models.generate_content(
                 model="gemini-2.0-flash",
                 contents=prompt,
             )
-            text = response.text.strip() if response and response.text else None
-            if text:
-                logger.info("🚨 [LLM] Craving insight generated via Gemini")
-            return text
+            return self._finish_craving_insight(cache_key, response)
         except Exception as e:
-            logger.warning(f"LLM craving insight failed: {e}")
-            logger.warning("[LLM FALLBACK] Gemini LLM failed to generate craving insight. Caller will use template fallback.")
+            self._craving_insight_failed(e)
+            return None
+
+    async def agenerate_craving_insight(self, craving_request) -> Optional[str]:
+        """
+        Async version of generate_craving_insight.
+
+        Awaits Gemini's async API instead of blocking the event loop (used
+        by CravingService.aprocess_craving). At most max_concurrent_llm_calls
+        requests are in flight at once.
+        """
+        if not self.api_key:
+            return None
+
+        try:
+            prompt, cache_key = self._craving_insight_request(craving_request)
+            cached = self._get_cached_insight(cache_key)
+            if cached is not None:
+                return cached
+
+            client = self._get_genai_client()
+            async with self._get_llm_semaphore():
+                response = await client.aio.models.generate_content(
+                    model="gemini-2.0-flash",
+                    contents=prompt,
+                )
+            return self._finish_craving_insight(cache_key, response)
+        except Exception as e:
+            self._craving_insight_failed(e)
             return None
 
     def generate_craving_pattern_insights(
@@ -428,29 +626,49 @@ class LLMExplainer:
             return None
 
         try:
-            from google import genai
+            prompt, cache_key = self._pattern_insights_request(history_summary)
+            cached = self._get_cached_insight(cache_key)
+            if cached is not None:
+                return list(cached)
 
-            client = genai.Client(api_key=self.api_key)
-            prompt = (
-                "You are a nutrition psychologist analysing a user's craving log "
-                "summary. Identify up to 3 actionable behavioural patterns from:\n"
-                f"{history_summary}\n"
-                "Return each pattern as a single sentence. No intro text."
-            )
+            client = self._get_genai_client()
             response = client.models.generate_content(
                 model="gemini-2.0-flash",
                 contents=prompt,
             )
-            if response and response.text:
-                logger.info("🚨 [LLM] Craving pattern insights generated via Gemini")
-                lines = [
-                    line.strip().lstrip("•-0123456789. ")
-                    for line in response.text.strip().split("\n")
-                    if line.strip()
-                ]
-                return lines[:3] if lines else None
+            return self._finish_pattern_insights(cache_key, response)
+        except Exception as e:
+            self._pattern_insights_failed(e)
+            return None
+
+    async def agenerate_craving_pattern_insights(
+        self, history_summary: Dict
+    ) -> Optional[List[str]]:
+        """
+        Async version of generate_craving_pattern_insights.
+
+        Args:
+            history_summary: Aggregated stats dict (top_flavor, top_mood, etc.)
+
+        Returns:
+            List of human-readable pattern strings, or None on failure.
+        """
+        if not self.api_key:
             return None
+
+        try:
+            prompt, cache_key = self._pattern_insights_request(history_summary)
+            cached = self._get_cached_insight(cache_key)
+            if cached is not None:
+                return list(cached)
+
+            client = self._get_genai_client()
+            async with self._get_llm_semaphore():
+                response = await client.aio.models.generate_content(
+                    model="gemini-2.0-flash",
+                    contents=prompt,
+                )
+            return self._finish_pattern_insights(cache_key, response)
         except Exception as e:
-            logger.warning(f"LLM pattern insight failed: {e}")
-            logger.warning("[LLM FALLBACK] Gemini LLM failed to generate craving pattern insights. Returning None.")
-            return None
\ No newline at end of file
+            self._pattern_insights_failed(e)
+            return None
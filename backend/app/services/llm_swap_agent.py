@@ -6,10 +6,24 @@ that actively queries FlavorDB and RecipeDB via function calling to find
 scientifically-grounded, context-aware ingredient substitutions.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
-from typing import Dict, List, Optional
+import sqlite3
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 try:
     from google import genai
@@ -20,14 +34,42 @@ except ImportError:
     types = None
     GENAI_AVAILABLE = False
 
+from pydantic import ValidationError
+
 from app.config import settings
 from app.services.flavordb_extended import FlavorDBExtendedService
 from app.services.recipedb_service import RecipeDBService
 from app.services.tool_definitions import ALL_TOOLS
-from app.models.agent_response import AgentSubstitution, AgentSwapResult
+from app.services.tool_result_store import ToolResultStore
+from app.models.agent_response import AgentAnswer, AgentSubstitution, AgentSwapResult
 
 logger = logging.getLogger(__name__)
 
+# One Gemini client (and its connection pool) for every agent (see _get_client)
+_gemini_client: Optional["genai.Client"] = None
+_gemini_client_lock = threading.Lock()
+
+
+def _get_client() -> "genai.Client":
+    """Return the process-wide Gemini client, creating it on first use."""
+    global _gemini_client
+    if _gemini_client is None:
+        with _gemini_client_lock:
+            if _gemini_client is None:
+                _gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    return _gemini_client
+
+# JSON object inside a markdown code fence (see _extract_json)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+# JSON array inside a markdown code fence (batch answers, see run_batch)
+_JSON_ARRAY_FENCE_RE = re.compile(r"```(?:json)?\s*(\[.*\])\s*```", re.DOTALL)
+
+# Fields of the agent's answer object that map onto AgentSwapResult
+_ANSWER_KEYS = ("substitutions", "overall_confidence", "data_completeness", "no_substitute_ingredients")
+
+# Follow-up turn when the final answer is not valid JSON (see _restate_as_json)
+_RESTATE_AS_JSON_PROMPT = "Restate your final answer as the JSON object only."
+
 # ─── System Prompt ─────────────────────────────────────────────────────────────
 
 AGENT_SYSTEM_PROMPT = """You are a scientific food-substitution agent. Your mission is to find the healthiest possible ingredient swaps for a recipe while preserving its flavor profile as closely as possible.
@@ -41,9 +83,11 @@ You have access to FlavorDB and RecipeDB APIs via function calling. You MUST use
 Before calling any tool, state your plan:
 - Which ingredients are risky and why (high sat fat, high sugar, high sodium, trans fats, etc.)
 - What categories of substitutes you will explore for each
-- Which tools you will call first
+- Which tools you will call first (all of them in your first tool-calling turn)
 
 ### Phase 2: Investigate (Tool Calls)
+Batch your tool calls: request every call whose arguments you already know as parallel function calls in ONE turn (e.g. `flavordb_get_entity_by_name` for each original ingredient and all of its candidates at once), instead of one call per turn. They run concurrently and all results come back together.
+
 For each risky ingredient:
 
 1. **Flavor profile analysis**: Call `flavordb_get_entity_by_name` for the original ingredient to get its molecule set.
@@ -106,6 +150,29 @@ Return your final answer as a JSON object with this EXACT structure:
 """
 
 
+# Tool result fields that only echo the request or describe the payload;
+# a result with nothing else filled in is an empty or outage answer
+_RESULT_ECHO_KEYS = frozenset({"ingredient", "molecule", "unit", "category", "truncated", "total", "note"})
+
+
+def _has_payload(result) -> bool:
+    """
+    True when a tool result carries real data and may be persisted.
+
+    Service outages don't raise: FlavorDB/RecipeDB lookups fall back to empty
+    lists or profiles with every data field None/empty, so those are treated
+    like errors and never written to the tool result store.
+    """
+    if not isinstance(result, dict) or "error" in result:
+        return False
+    return any(value for key, value in result.items() if key not in _RESULT_ECHO_KEYS)
+
+
+def _call_stats(tools_called: Counter) -> Dict:
+    """AgentSwapResult fields describing a run's tool calls."""
+    return {"apis_called": list(tools_called), "apis_called_counts": dict(tools_called)}
+
+
 class LLMSwapAgent:
     """Gemini-powered agentic swap engine using function calling."""
 
@@ -116,9 +183,52 @@ class LLMSwapAgent:
     ):
         self.flavordb = flavordb_service
         self.recipedb = recipedb_service
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        self.client = _get_client()
         self.model = settings.LLM_MODEL
         self.max_iterations = settings.LLM_MAX_ITERATIONS
+        # Tool schemas and system prompt never change: build the request
+        # config once instead of on every loop iteration
+        self._tool = types.Tool(function_declarations=ALL_TOOLS)
+        self._generate_config = types.GenerateContentConfig(
+            system_instruction=AGENT_SYSTEM_PROMPT,
+            tools=[self._tool],
+            temperature=0.3,
+            max_output_tokens=settings.LLM_MAX_TOKENS,
+        )
+        # Server-side context cache holding the system prompt and tools, so
+        # each request references it instead of resending them (see
+        # _request_config). Created on first use and renewed before expiry.
+        self._context_cache_ttl = settings.LLM_CONTEXT_CACHE_TTL
+        self._cached_config: Optional[types.GenerateContentConfig] = None
+        self._cached_config_renew_at = 0.0
+        self._cached_config_lock = threading.Lock()
+        # Gemini can't combine function calling with JSON mode, so structured
+        # output is only requested for a tool-free restatement of the answer
+        self._answer_config = types.GenerateContentConfig(
+            system_instruction=AGENT_SYSTEM_PROMPT,
+            temperature=0.3,
+            max_output_tokens=settings.LLM_MAX_TOKENS,
+            response_mime_type="application/json",
+            response_schema=AgentAnswer,
+        )
+        # Tool calls from one model turn are independent I/O-bound lookups
+        self.max_tool_workers = 8
+        # Longest list a tool result may feed back into the conversation
+        self.max_tool_items = 25
+        # Tool turns kept verbatim in the conversation; older responses
+        # longer than max_stale_response_chars are stubbed
+        self.full_tool_turns = 2
+        self.max_stale_response_chars = 2000
+        # Tool results with real data persisted across runs and processes
+        # (opt-in via LLM_TOOL_CACHE_PATH)
+        self._tool_store: Optional[ToolResultStore] = None
+        if settings.LLM_TOOL_CACHE_PATH:
+            try:
+                self._tool_store = ToolResultStore(
+                    settings.LLM_TOOL_CACHE_PATH, settings.LLM_TOOL_CACHE_DAYS
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("Tool result cache disabled: %s", e)
 
         # Map function names → handler methods
         self._tool_handlers = {
@@ -146,7 +256,7 @@ class LLMSwapAgent:
         self,
         recipe_name: str,
         ingredients: List[str],
-        nutrition_data: Dict,
+        nutrition_data: Union[Dict, str],
         original_health_score: float,
         allergens: Optional[List[str]] = None,
         avoid_ingredients: Optional[List[str]] = None,
@@ -154,101 +264,423 @@ class LLMSwapAgent:
         """
         Run the agentic loop: send context → let Gemini call tools → parse final JSON.
 
+        nutrition_data may be passed pre-serialized as a JSON string, e.g. by
+        callers analyzing several variants of one recipe.
+
         Returns an AgentSwapResult with substitutions, confidence, and metadata.
         """
-        logger.info(f"🚨 [LLM] Swap agent starting for recipe: {recipe_name}")
+        logger.info("🚨 [LLM] Swap agent starting for recipe: %s", recipe_name)
 
         user_message = self._build_user_message(
             recipe_name, ingredients, nutrition_data,
             original_health_score, allergens, avoid_ingredients,
         )
 
+        final_text, failure, tools_called, iterations = self._agent_loop(user_message)
+        if failure is not None:
+            return failure
+        return self._parse_agent_response(final_text, tools_called, iterations)
+
+    async def arun(
+        self,
+        recipe_name: str,
+        ingredients: List[str],
+        nutrition_data: Union[Dict, str],
+        original_health_score: float,
+        allergens: Optional[List[str]] = None,
+        avoid_ingredients: Optional[List[str]] = None,
+    ) -> AgentSwapResult:
+        """
+        Async version of run() for event-loop callers.
+
+        Gemini is awaited through the client's aio API and each turn's tool
+        calls run in worker threads via asyncio.to_thread, so many agents can
+        be driven concurrently with asyncio.gather.
+        """
+        logger.info("🚨 [LLM] Swap agent starting for recipe: %s", recipe_name)
+
+        user_message = self._build_user_message(
+            recipe_name, ingredients, nutrition_data,
+            original_health_score, allergens, avoid_ingredients,
+        )
+
+        final_text, failure, tools_called, iterations = await self._aagent_loop(user_message)
+        if failure is not None:
+            return failure
+        return self._parse_agent_response(final_text, tools_called, iterations)
+
+    def run_batch(self, recipes: List[Dict], batch_size: int = 4) -> List[AgentSwapResult]:
+        """
+        Run the agent for several recipes, up to batch_size per conversation.
+
+        Each batch shares one system prompt, one copy of the tool schemas and
+        one request-rate budget; Gemini is asked for a JSON array with one
+        result per recipe. All results of a batch report the batch's tool
+        calls and iteration count.
+
+        Args:
+            recipes: Dicts with run()'s keyword arguments (recipe_name,
+                ingredients, nutrition_data, original_health_score and
+                optionally allergens, avoid_ingredients)
+            batch_size: Recipes per agent conversation
+
+        Returns:
+            One AgentSwapResult per recipe, in input order.
+        """
+        results: List[AgentSwapResult] = []
+        for start in range(0, len(recipes), batch_size):
+            batch = recipes[start:start + batch_size]
+            if len(batch) == 1:
+                results.append(self.run(**batch[0]))
+                continue
+
+            logger.info("🚨 [LLM] Swap agent starting for batch of %s recipes", len(batch))
+            # The answer is a JSON array, which the restatement schema doesn't fit
+            final_text, failure, tools_called, iterations = self._agent_loop(
+                self._build_batch_message(batch), restate_json=False
+            )
+            if failure is not None:
+                results.extend(failure.model_copy(deep=True) for _ in batch)
+            else:
+                results.extend(
+                    self._parse_batch_response(final_text, len(batch), tools_called, iterations)
+                )
+        return results
+
+    def _agent_loop(
+        self, user_message: str, restate_json: bool = True
+    ) -> Tuple[Optional[str], Optional[AgentSwapResult], Counter, int]:
+        """
+        Converse with Gemini, executing its tool calls, until it answers in text.
+
+        An answer that is not a valid JSON object gets one structured-output
+        follow-up (see _restate_as_json) unless restate_json is False.
+
+        Returns:
+            (final_text, None, tools_called, iterations) when the model
+            answered, or (None, failure_result, tools_called, iterations)
+            after an API error, an empty response or the iteration limit.
+            tools_called is a Counter of calls per tool name, in first-call
+            order (see _call_stats).
+        """
         # Build initial conversation
         contents: List[types.Content] = [
             types.Content(role="user", parts=[types.Part.from_text(text=user_message)])
         ]
 
-        tools_called: List[str] = []
+        # Calls per tool name, in first-call order
+        tools_called: Counter = Counter()
+        # Successful tool results of this run, keyed by _tool_cache_key, and
+        # how often each call was made (see _execute_tools)
+        tool_cache: Dict[tuple, Dict] = {}
+        call_counts: Dict[tuple, int] = {}
+        # Call sets of the last few turns, to catch the model re-issuing the same calls
+        recent_calls: deque = deque(maxlen=3)
         iteration = 0
+        config = self._request_config()
 
         while iteration < self.max_iterations:
             iteration += 1
-            logger.info(f"🚨 [LLM] Agent iteration {iteration}/{self.max_iterations}")
+            logger.info("🚨 [LLM] Agent iteration %s/%s", iteration, self.max_iterations)
 
             try:
                 response = self.client.models.generate_content(
                     model=self.model,
                     contents=contents,
-                    config=types.GenerateContentConfig(
-                        system_instruction=AGENT_SYSTEM_PROMPT,
-                        tools=[types.Tool(function_declarations=ALL_TOOLS)],
-                        temperature=0.3,
-                        max_output_tokens=settings.LLM_MAX_TOKENS,
-                    ),
+                    config=config,
                 )
             except Exception as e:
-                logger.error(f"Gemini API call failed: {e}")
-                return AgentSwapResult(
-                    data_completeness="parse_error",
-                    raw_reasoning=f"Gemini API error: {e}",
-                    iterations=iteration,
-                    apis_called=tools_called,
-                )
+                return None, self._api_error_result(e, tools_called, iteration), tools_called, iteration
 
-            candidate = response.candidates[0] if response.candidates else None
-            if not candidate or not candidate.content or not candidate.content.parts:
-                logger.warning("Empty response from Gemini")
+            turn = self._read_turn(response, contents, tools_called, iteration)
+            if turn is None:
                 break
+            final_text, calls = turn
+            if final_text is not None:
+                if restate_json and self._decode_answer(final_text) is None:
+                    final_text = self._restate_as_json(contents, final_text)
+                return final_text, None, tools_called, iteration
+            if self._is_looping(calls, recent_calls):
+                return None, self._loop_result(calls[-1][0], tools_called, iteration), tools_called, iteration
+
+            results = self._execute_tools(calls, tool_cache, call_counts)
+            self._append_tool_responses(contents, calls, results)
+
+        return None, self._max_iterations_result(tools_called, iteration), tools_called, iteration
+
+    async def _aagent_loop(
+        self, user_message: str, restate_json: bool = True
+    ) -> Tuple[Optional[str], Optional[AgentSwapResult], Counter, int]:
+        """Async version of _agent_loop (see arun)."""
+        contents: List[types.Content] = [
+            types.Content(role="user", parts=[types.Part.from_text(text=user_message)])
+        ]
 
-            parts = candidate.content.parts
+        # Calls per tool name, in first-call order
+        tools_called: Counter = Counter()
+        tool_cache: Dict[tuple, Dict] = {}
+        call_counts: Dict[tuple, int] = {}
+        # Call sets of the last few turns, to catch the model re-issuing the same calls
+        recent_calls: deque = deque(maxlen=3)
+        iteration = 0
+        # May create the context cache: a blocking call
+        config = await asyncio.to_thread(self._request_config)
 
-            # Check if there are function calls in this response
-            function_calls = [p for p in parts if p.function_call]
+        while iteration < self.max_iterations:
+            iteration += 1
+            logger.info("🚨 [LLM] Agent iteration %s/%s", iteration, self.max_iterations)
 
-            if not function_calls:
-                # No tool calls — this is the final text response
-                final_text = "".join(
-                    p.text for p in parts if p.text
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=contents,
+                    config=config,
                 )
-                logger.info(f"🚨 [LLM] Agent finished after {iteration} iterations")
-                # Add assistant response to history for completeness
-                contents.append(candidate.content)
-                return self._parse_agent_response(final_text, tools_called, iteration)
-
-            # There are function calls — execute them and continue the loop
-            # First, add the model's response (with function_call parts) to history
-            contents.append(candidate.content)
-
-            # Execute each function call and build response parts
-            function_response_parts: List[types.Part] = []
-            for part in function_calls:
-                fc = part.function_call
-                fname = fc.name
-                fargs = dict(fc.args) if fc.args else {}
-                tools_called.append(fname)
-
-                logger.info(f"🚨 [LLM]   Tool call: {fname}({fargs})")
-                result = self._execute_tool(fname, fargs)
-
-                function_response_parts.append(
-                    types.Part.from_function_response(
-                        name=fname,
-                        response=result,
-                    )
+            except Exception as e:
+                return None, self._api_error_result(e, tools_called, iteration), tools_called, iteration
+
+            turn = self._read_turn(response, contents, tools_called, iteration)
+            if turn is None:
+                break
+            final_text, calls = turn
+            if final_text is not None:
+                if restate_json and self._decode_answer(final_text) is None:
+                    final_text = await self._arestate_as_json(contents, final_text)
+                return final_text, None, tools_called, iteration
+            if self._is_looping(calls, recent_calls):
+                return None, self._loop_result(calls[-1][0], tools_called, iteration), tools_called, iteration
+
+            results = await self._aexecute_tools(calls, tool_cache, call_counts)
+            self._append_tool_responses(contents, calls, results)
+
+        return None, self._max_iterations_result(tools_called, iteration), tools_called, iteration
+
+    def _request_config(self) -> types.GenerateContentConfig:
+        """
+        Config for tool-loop requests: one referencing the context cache when
+        caching is enabled and works, else the full self._generate_config.
+        """
+        if self._context_cache_ttl <= 0:
+            return self._generate_config
+        with self._cached_config_lock:
+            now = time.time()
+            if now >= self._cached_config_renew_at:
+                self._cached_config = self._create_cached_config()
+                # Renew with a tenth of the TTL to spare, so a run that starts
+                # just before renewal doesn't outlive its cache. After a
+                # failure this is also when creation is retried.
+                self._cached_config_renew_at = now + self._context_cache_ttl * 0.9
+            return self._cached_config or self._generate_config
+
+    def _create_cached_config(self) -> Optional[types.GenerateContentConfig]:
+        """
+        Find or create the context cache for this model, prompt and tool set;
+        returns a config referencing it, or None if caching is unavailable
+        (e.g. the prompt is below the model's minimum cacheable size).
+        """
+        fingerprint = hashlib.sha256(
+            f"{self.model}\n{AGENT_SYSTEM_PROMPT}\n{self._tool.model_dump_json()}".encode("utf-8")
+        ).hexdigest()[:16]
+        display_name = f"swap-agent-{fingerprint}"
+        try:
+            # Reuse a live cache created by another worker process
+            min_expiry = time.time() + self._context_cache_ttl * 0.9
+            cache = next(
+                (
+                    c for c in self.client.caches.list()
+                    if c.display_name == display_name
+                    and c.expire_time is not None
+                    and c.expire_time.timestamp() > min_expiry
+                ),
+                None,
+            )
+            if cache is None:
+                cache = self.client.caches.create(
+                    model=self.model,
+                    config=types.CreateCachedContentConfig(
+                        display_name=display_name,
+                        system_instruction=AGENT_SYSTEM_PROMPT,
+                        tools=[self._tool],
+                        ttl=f"{self._context_cache_ttl}s",
+                    ),
                 )
+                logger.info("🚨 [LLM] Created Gemini context cache %s", cache.name)
+        except Exception as e:
+            logger.warning("Gemini context cache unavailable, sending the full prompt: %s", e)
+            return None
+
+        return types.GenerateContentConfig(
+            cached_content=cache.name,
+            temperature=0.3,
+            max_output_tokens=settings.LLM_MAX_TOKENS,
+        )
 
-            # Add all function responses as a single user turn
-            contents.append(
-                types.Content(role="user", parts=function_response_parts)
+    def _read_turn(
+        self,
+        response,
+        contents: List[types.Content],
+        tools_called: Counter,
+        iteration: int,
+    ) -> Optional[Tuple[Optional[str], List[tuple]]]:
+        """
+        Record one model response in the conversation.
+
+        Returns:
+            None for an empty response; (final_text, []) when the model
+            answered in text; (None, [(function_name, args), ...]) when it
+            asked for tool calls.
+        """
+        candidate = response.candidates[0] if response.candidates else None
+        if not candidate or not candidate.content or not candidate.content.parts:
+            logger.warning("Empty response from Gemini")
+            return None
+
+        parts = candidate.content.parts
+        # Add the model's response (text or function_call parts) to history
+        contents.append(candidate.content)
+
+        # Check if there are function calls in this response
+        function_calls = [p for p in parts if p.function_call]
+
+        if not function_calls:
+            # No tool calls — this is the final text response
+            logger.info("🚨 [LLM] Agent finished after %s iterations", iteration)
+            if len(parts) == 1:
+                # The usual shape: one text part
+                return parts[0].text or "", []
+            return "".join(p.text for p in parts if p.text), []
+
+        calls = []
+        for part in function_calls:
+            fc = part.function_call
+            fname = fc.name
+            # Already a plain dict in google-genai; handlers only read from it
+            fargs = fc.args or {}
+            tools_called[fname] += 1
+            logger.info("🚨 [LLM]   Tool call: %s(%s)", fname, fargs)
+            calls.append((fname, fargs))
+        return None, calls
+
+    def _restate_as_json(self, contents: List[types.Content], final_text: str) -> str:
+        """
+        Ask Gemini, in JSON mode with the AgentAnswer schema, to restate its
+        final answer. Returns final_text unchanged if the call fails.
+        """
+        logger.info("🚨 [LLM] Final answer is not valid JSON, requesting structured restatement")
+        try:
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=self._restate_contents(contents),
+                config=self._answer_config,
             )
+        except Exception as e:
+            logger.error("Gemini API call failed: %s", e)
+            return final_text
+        return response.text or final_text
 
-        # Hit max iterations
-        logger.warning(f"Agent hit max iterations ({self.max_iterations})")
+    async def _arestate_as_json(self, contents: List[types.Content], final_text: str) -> str:
+        """Async version of _restate_as_json."""
+        logger.info("🚨 [LLM] Final answer is not valid JSON, requesting structured restatement")
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=self._restate_contents(contents),
+                config=self._answer_config,
+            )
+        except Exception as e:
+            logger.error("Gemini API call failed: %s", e)
+            return final_text
+        return response.text or final_text
+
+    @staticmethod
+    def _restate_contents(contents: List[types.Content]) -> List[types.Content]:
+        return contents + [types.Content(
+            role="user", parts=[types.Part.from_text(text=_RESTATE_AS_JSON_PROMPT)]
+        )]
+
+    def _append_tool_responses(
+        self, contents: List[types.Content], calls: List[tuple], results: List[Dict]
+    ) -> None:
+        """
+        Add a turn's function responses, in call order, as one user turn.
+
+        Every request resends the whole history, so once a tool turn is
+        older than the last full_tool_turns, its large responses are
+        replaced with short stubs (see _stub_tool_turn).
+        """
+        contents.append(types.Content(role="user", parts=[
+            types.Part.from_function_response(name=fname, response=result)
+            for (fname, _), result in zip(calls, results)
+        ]))
+
+        # Earlier turns were stubbed when they left the window: only the
+        # turn that just left it needs work
+        seen = 0
+        for index in range(len(contents) - 1, -1, -1):
+            parts = contents[index].parts
+            if contents[index].role == "user" and parts and parts[0].function_response:
+                seen += 1
+                if seen > self.full_tool_turns:
+                    contents[index] = self._stub_tool_turn(contents[index], index)
+                    break
+
+    def _stub_tool_turn(self, turn: types.Content, ref_id: int) -> types.Content:
+        """Copy of a function-response turn with large responses summarized."""
+        parts = []
+        for part in turn.parts:
+            fr = part.function_response
+            response = fr.response or {}
+            if len(self._dumps(response)) > self.max_stale_response_chars:
+                items = next((v for v in response.values() if isinstance(v, list)), response)
+                response = {
+                    "ref_id": ref_id,
+                    "summary": f"{fr.name} returned {response.get('total', len(items))} items; "
+                               f"full result dropped from history, rely on your earlier analysis",
+                }
+                part = types.Part.from_function_response(name=fr.name, response=response)
+            parts.append(part)
+        return types.Content(role=turn.role, parts=parts)
+
+    def _is_looping(self, calls: List[tuple], recent_calls: deque) -> bool:
+        """
+        Record this turn's set of (function_name, args) calls in
+        recent_calls; True once the last three turns made the same calls.
+
+        Compared per turn, not per call: one turn batching identical calls
+        in parallel (deduplicated by _execute_tools) isn't a loop.
+        """
+        recent_calls.append(frozenset(self._tool_cache_key(fname, fargs) for fname, fargs in calls))
+        return len(recent_calls) == recent_calls.maxlen and len(set(recent_calls)) == 1
+
+    @staticmethod
+    def _loop_result(repeated_tool: str, tools_called: Counter, iteration: int) -> AgentSwapResult:
+        logger.warning(
+            "Agent stuck repeating %s, stopping after %s iterations", repeated_tool, iteration
+        )
+        return AgentSwapResult(
+            data_completeness="partial",
+            raw_reasoning="Agent loop detected: the same tool call was repeated",
+            iterations=iteration,
+            **_call_stats(tools_called),
+        )
+
+    @staticmethod
+    def _api_error_result(error: Exception, tools_called: Counter, iteration: int) -> AgentSwapResult:
+        logger.error("Gemini API call failed: %s", error)
+        return AgentSwapResult(
+            data_completeness="parse_error",
+            raw_reasoning=f"Gemini API error: {error}",
+            iterations=iteration,
+            **_call_stats(tools_called),
+        )
+
+    def _max_iterations_result(self, tools_called: Counter, iteration: int) -> AgentSwapResult:
+        logger.warning("Agent hit max iterations (%s)", self.max_iterations)
         return AgentSwapResult(
             data_completeness="partial",
             raw_reasoning="Agent reached maximum iteration limit",
             iterations=iteration,
-            apis_called=tools_called,
+            **_call_stats(tools_called),
         )
 
     # ─── Message building ──────────────────────────────────────────────────
@@ -257,7 +689,7 @@ class LLMSwapAgent:
         self,
         recipe_name: str,
         ingredients: List[str],
-        nutrition_data: Dict,
+        nutrition_data: Union[Dict, str],
         original_health_score: float,
         allergens: Optional[List[str]],
         avoid_ingredients: Optional[List[str]],
@@ -266,7 +698,7 @@ class LLMSwapAgent:
             f"Analyze this recipe and find healthier ingredient substitutions.\n\n"
             f"Recipe: {recipe_name}\n"
             f"Ingredients: {', '.join(ingredients)}\n"
-            f"Current nutrition per serving: {json.dumps(nutrition_data)}\n"
+            f"Current nutrition per serving: {self._dumps(nutrition_data)}\n"
             f"Current health score: {original_health_score}/100\n"
             f"Allergens to avoid: {', '.join(allergens) if allergens else 'none'}\n"
             f"Ingredients to definitely avoid: {', '.join(avoid_ingredients) if avoid_ingredients else 'none'}\n\n"
@@ -274,21 +706,164 @@ class LLMSwapAgent:
             f"Follow the workflow in your system instructions strictly."
         )
 
+    def _build_batch_message(self, recipes: List[Dict]) -> str:
+        sections = []
+        for number, recipe in enumerate(recipes, 1):
+            allergens = recipe.get("allergens")
+            avoid_ingredients = recipe.get("avoid_ingredients")
+            sections.append(
+                f"### Recipe {number}: {recipe['recipe_name']}\n"
+                f"Ingredients: {', '.join(recipe['ingredients'])}\n"
+                f"Current nutrition per serving: {self._dumps(recipe['nutrition_data'])}\n"
+                f"Current health score: {recipe['original_health_score']}/100\n"
+                f"Allergens to avoid: {', '.join(allergens) if allergens else 'none'}\n"
+                f"Ingredients to definitely avoid: {', '.join(avoid_ingredients) if avoid_ingredients else 'none'}\n"
+            )
+        return (
+            f"Analyze the {len(recipes)} recipes below and find healthier ingredient "
+            f"substitutions for each.\n\n"
+            + "\n".join(sections)
+            + f"\nUse the available FlavorDB and RecipeDB tools to ground your analysis. "
+            f"Follow the workflow in your system instructions strictly, but return a "
+            f"JSON array of {len(recipes)} objects — one per recipe, in the order above, "
+            f"each with the exact structure from your instructions."
+        )
+
+    @staticmethod
+    def _dumps(data) -> str:
+        """
+        JSON-encode data for the prompt, with orjson when installed; strings
+        are taken as already-encoded JSON.
+        """
+        if isinstance(data, str):
+            return data
+        if ORJSON_AVAILABLE:
+            # default=float covers NumPy scalars, which orjson doesn't take natively
+            return orjson.dumps(data, default=float).decode()
+        return json.dumps(data)
+
     # ─── Tool execution dispatch ───────────────────────────────────────────
 
-    def _execute_tool(self, function_name: str, args: Dict) -> Dict:
-        """Dispatch a tool call to the appropriate service method."""
+    def _execute_tools(
+        self,
+        calls: List[tuple],
+        tool_cache: Dict[tuple, Dict],
+        call_counts: Dict[tuple, int],
+    ) -> List[Dict]:
+        """
+        Run several (function_name, args) tool calls, concurrently when there
+        is more than one. Results come back in call order.
+
+        Calls already answered earlier in the run are served from tool_cache
+        (only successful results are cached). From the third identical call
+        on, the result carries a note asking the model to stop repeating it.
+        """
+        keys, misses = self._plan_tool_calls(calls, tool_cache)
+
+        if len(misses) <= 1:
+            fetched = [self._execute_tool(fname, fargs) for fname, fargs in misses.values()]
+        else:
+            workers = min(self.max_tool_workers, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(lambda call: self._execute_tool(*call), misses.values()))
+
+        return self._collect_tool_results(keys, misses, fetched, tool_cache, call_counts)
+
+    async def _aexecute_tools(
+        self,
+        calls: List[tuple],
+        tool_cache: Dict[tuple, Dict],
+        call_counts: Dict[tuple, int],
+    ) -> List[Dict]:
+        """Async version of _execute_tools; the blocking handlers run in threads."""
+        keys, misses = self._plan_tool_calls(calls, tool_cache)
+        fetched = await asyncio.gather(*(
+            asyncio.to_thread(self._execute_tool, fname, fargs)
+            for fname, fargs in misses.values()
+        ))
+        return self._collect_tool_results(keys, misses, fetched, tool_cache, call_counts)
+
+    def _plan_tool_calls(
+        self, calls: List[tuple], tool_cache: Dict[tuple, Dict]
+    ) -> Tuple[List[tuple], Dict[tuple, tuple]]:
+        """Cache keys for calls, plus the distinct uncached calls by key."""
+        keys = [self._tool_cache_key(fname, fargs) for fname, fargs in calls]
+        misses = {
+            key: call for key, call in zip(keys, calls) if key not in tool_cache
+        }
+        return keys, misses
+
+    @staticmethod
+    def _collect_tool_results(
+        keys: List[tuple],
+        misses: Dict[tuple, tuple],
+        fetched: List[Dict],
+        tool_cache: Dict[tuple, Dict],
+        call_counts: Dict[tuple, int],
+    ) -> List[Dict]:
+        """Cache fresh results and assemble one result per call, in order."""
+        fresh = dict(zip(misses, fetched))
+        for key, result in fresh.items():
+            if isinstance(result, dict) and "error" not in result:
+                tool_cache[key] = result
+
+        results = []
+        for key in keys:
+            result = fresh[key] if key in fresh else tool_cache[key]
+            call_counts[key] = call_counts.get(key, 0) + 1
+            if call_counts[key] >= 3 and isinstance(result, dict):
+                result = {
+                    **result,
+                    "note": "Same result as your earlier identical calls. "
+                            "Do not call this tool with these arguments again.",
+                }
+            results.append(result)
+        return results
+
+    @classmethod
+    def _tool_cache_key(cls, function_name: str, args: Mapping) -> tuple:
+        """Hashable key for a tool call; nested lists/dicts become tuples."""
+        return (function_name, cls._freeze(args))
+
+    @classmethod
+    def _freeze(cls, value):
+        if isinstance(value, Mapping):
+            return tuple(sorted((k, cls._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(v) for v in value)
+        return value
+
+    def _execute_tool(self, function_name: str, args: Mapping) -> Dict:
+        """
+        Dispatch a tool call to the appropriate service method, answering
+        from the persistent tool result store when it has the call.
+        """
         handler = self._tool_handlers.get(function_name)
         if not handler:
             return {"error": f"Unknown tool: {function_name}"}
+        if self._tool_store is not None:
+            cached = self._tool_store.get(function_name, args)
+            if cached is not None:
+                return cached
         try:
-            return handler(args)
+            result = handler(args)
         except Exception as e:
-            logger.error(f"Tool {function_name} failed: {e}")
+            logger.error("Tool %s failed: %s", function_name, e)
             return {
                 "error": str(e),
                 "note": "API call failed. Proceed with available data and lower confidence.",
             }
+        if self._tool_store is not None and _has_payload(result):
+            self._tool_store.put(function_name, args, result)
+        return result
+
+    def _truncate(self, key: str, items: List, cap: Optional[int] = None) -> Dict:
+        """
+        Wrap a list tool result as {key: items}, cut to cap entries
+        (max_tool_items by default) to bound the next turn's input tokens.
+        """
+        cap = self.max_tool_items if cap is None else cap
+        return {key: items[:cap], "truncated": len(items) > cap, "total": len(items)}
 
     # ─── FlavorDB tool handlers ────────────────────────────────────────────
 
@@ -300,29 +875,29 @@ class LLMSwapAgent:
 
     def _handle_flavordb_flavor(self, args: Dict) -> Dict:
         molecules = self.flavordb.get_molecules_by_flavor(args["flavor"])
-        return {"molecules": molecules}
+        return self._truncate("molecules", molecules)
 
     def _handle_flavordb_func_group(self, args: Dict) -> Dict:
         molecules = self.flavordb.get_molecules_by_functional_group(args["group"])
-        return {"molecules": molecules}
+        return self._truncate("molecules", molecules)
 
     def _handle_flavordb_weight(self, args: Dict) -> Dict:
         molecules = self.flavordb.get_molecules_by_weight_range(
             args["min_weight"], args["max_weight"]
         )
-        return {"molecules": molecules}
+        return self._truncate("molecules", molecules)
 
     def _handle_flavordb_psa(self, args: Dict) -> Dict:
         molecules = self.flavordb.get_molecules_by_polar_surface_area(
             args["min_psa"], args["max_psa"]
         )
-        return {"molecules": molecules}
+        return self._truncate("molecules", molecules)
 
     def _handle_flavordb_hbd_hba(self, args: Dict) -> Dict:
         molecules = self.flavordb.get_molecules_by_hbd_hba(
             args["min_hbd"], args["max_hbd"], args["min_hba"], args["max_hba"]
         )
-        return {"molecules": molecules}
+        return self._truncate("molecules", molecules)
 
     def _handle_flavordb_aroma(self, args: Dict) -> Dict:
         return self.flavordb.get_aroma_threshold(args["molecule_name"])
@@ -341,7 +916,7 @@ class LLMSwapAgent:
 
     def _handle_flavordb_pairings(self, args: Dict) -> Dict:
         pairings = self.flavordb.get_flavor_pairings(args["ingredient_name"])
-        return {"pairings": pairings}
+        return self._truncate("pairings", pairings)
 
     # ─── RecipeDB tool handlers ────────────────────────────────────────────
 
@@ -357,38 +932,70 @@ class LLMSwapAgent:
 
     def _handle_recipedb_cuisine(self, args: Dict) -> Dict:
         recipes = self.recipedb.search_by_cuisine(args["cuisine"])
-        return {"recipes": recipes[:10]}  # Cap at 10 to control token usage
+        # Full recipes are large: keep fewer than the default cap
+        return self._truncate("recipes", recipes, cap=10)
 
     # ─── Response parsing ──────────────────────────────────────────────────
 
     def _parse_agent_response(
-        self, text: str, tools_called: List[str], iterations: int
+        self, text: str, tools_called: Counter, iterations: int
     ) -> AgentSwapResult:
         """Parse the agent's final JSON text into an AgentSwapResult."""
-        # Try to extract JSON from the text
-        json_str = self._extract_json(text)
-
-        if not json_str:
-            logger.warning("Could not extract JSON from agent response")
+        data = self._decode_answer(text)
+        if data is None:
             return AgentSwapResult(
                 data_completeness="parse_error",
                 raw_reasoning=text,
-                apis_called=tools_called,
+                **_call_stats(tools_called),
                 iterations=iterations,
             )
+        return self._result_from_data(data, tools_called, iterations)
+
+    def _decode_answer(self, text: str) -> Optional[Dict]:
+        """
+        Decode the agent's final answer object, or None if there isn't one.
+
+        The prompt asks for bare JSON (and structured restatements are bare
+        JSON), so the text is decoded directly first; _extract_json handles
+        fences and surrounding prose.
+        """
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        try:
+            data = loads(text)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            return data
 
+        json_str = self._extract_json(text)
+        if not json_str:
+            logger.warning("Could not extract JSON from agent response")
+            return None
         try:
-            data = json.loads(json_str)
+            data = loads(json_str)
         except json.JSONDecodeError as e:
-            logger.error(f"JSON parse error: {e}")
-            return AgentSwapResult(
-                data_completeness="parse_error",
-                raw_reasoning=text,
-                apis_called=tools_called,
-                iterations=iterations,
-            )
+            logger.error("JSON parse error: %s", e)
+            return None
+        return data if isinstance(data, dict) else None
 
-        # Parse substitutions
+    def _result_from_data(
+        self, data: Dict, tools_called: Counter, iterations: int
+    ) -> AgentSwapResult:
+        """Build an AgentSwapResult from one decoded agent answer object."""
+        # Fast path: validate the whole answer in one pydantic-core call
+        try:
+            return AgentSwapResult.model_validate({
+                "data_completeness": "partial",
+                **{key: data[key] for key in _ANSWER_KEYS if key in data},
+                **_call_stats(tools_called),
+                "iterations": iterations,
+            })
+        except ValidationError:
+            pass
+
+        # Some substitution is malformed: build them one by one, filling in
+        # defaults and skipping the ones that still don't validate
         substitutions = []
         for sub_data in data.get("substitutions", []):
             try:
@@ -405,34 +1012,99 @@ class LLMSwapAgent:
                     caveats=sub_data.get("caveats"),
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse substitution: {e}")
+                logger.warning("Failed to parse substitution: %s", e)
 
         return AgentSwapResult(
             substitutions=substitutions,
             overall_confidence=float(data.get("overall_confidence", 0.5)),
             data_completeness=data.get("data_completeness", "partial"),
             no_substitute_ingredients=data.get("no_substitute_ingredients", []),
-            apis_called=tools_called,
+            **_call_stats(tools_called),
             iterations=iterations,
         )
 
+    def _parse_batch_response(
+        self, text: str, count: int, tools_called: Counter, iterations: int
+    ) -> List[AgentSwapResult]:
+        """
+        Parse a batch answer (JSON array, or a single object for one recipe)
+        into count AgentSwapResults; missing entries become parse errors.
+        """
+        items = None
+        json_str = self._extract_json_array(text) or self._extract_json(text)
+        if json_str:
+            try:
+                data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
+            except json.JSONDecodeError as e:
+                logger.error("JSON parse error: %s", e)
+            else:
+                if isinstance(data, dict):
+                    data = data.get("results", [data])
+                if isinstance(data, list):
+                    items = [item for item in data if isinstance(item, dict)]
+
+        if items is None:
+            logger.warning("Could not extract JSON array from batch agent response")
+            items = []
+        elif len(items) != count:
+            logger.warning("Batch agent returned %s results for %s recipes", len(items), count)
+
+        results = [
+            self._result_from_data(item, tools_called, iterations)
+            for item in items[:count]
+        ]
+        results.extend(
+            AgentSwapResult(
+                data_completeness="parse_error",
+                raw_reasoning=text,
+                **_call_stats(tools_called),
+                iterations=iterations,
+            )
+            for _ in range(count - len(results))
+        )
+        return results
+
+    @staticmethod
+    def _extract_json_array(text: str) -> Optional[str]:
+        """Extract a JSON array from text: fenced, or from the first [ to the last ]."""
+        match = _JSON_ARRAY_FENCE_RE.search(text)
+        if match:
+            return match.group(1)
+        first_bracket = text.find("[")
+        last_bracket = text.rfind("]")
+        if first_bracket != -1 and last_bracket > first_bracket:
+            candidate = text[first_bracket: last_bracket + 1]
+            # Only when the array encloses any top-level object
+            brace = text.find("{")
+            if brace == -1 or brace > first_bracket:
+                return candidate
+        return None
+
     def _extract_json(self, text: str) -> Optional[str]:
         """Extract JSON object from text, handling markdown fences and surrounding text."""
         # Try: raw text is valid JSON
         stripped = text.strip()
         if stripped.startswith("{"):
-            # Find the matching closing brace
+            # Find the matching closing brace, jumping brace to brace with
+            # str.find instead of visiting every character
             depth = 0
-            for i, ch in enumerate(stripped):
-                if ch == "{":
+            i = 0
+            next_open = stripped.find("{")
+            next_close = stripped.find("}")
+            while next_close != -1:
+                if next_open != -1 and next_open < next_close:
                     depth += 1
-                elif ch == "}":
+                    i = next_open
+                    next_open = stripped.find("{", i + 1)
+                else:
                     depth -= 1
+                    i = next_close
                     if depth == 0:
                         return stripped[: i + 1]
+                    next_close = stripped.find("}", i + 1)
 
         # Try: JSON inside markdown code fence
-        match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+        match = _JSON_FENCE_RE.search(text)
         if match:
             return match.group(1)
 
@@ -16,23 +16,160 @@ Carbohydrate, by difference (g), Total lipid (fat) (g)) are mapped to the
 standard keys expected by the health scorer and swap pipeline.
 """
 
+import asyncio
+import functools
+import json
+import random
 import re
 import threading
 import time
 import requests
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple, Union
-from functools import lru_cache
+from urllib.parse import urlencode
 
 from app.config import settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _loads_json(content: bytes):
+    """Parse a response body, with orjson when installed (both raise ValueError)."""
+    return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_url(base_url: str, endpoint: str, params_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Full request URL with its query string encoded once per distinct lookup."""
+    url = f"{base_url}/{endpoint}"
+    return f"{url}?{urlencode(params_items)}" if params_items else url
+
+
+def _params_items(params: Optional[Dict]) -> Tuple[Tuple[str, str], ...]:
+    """Hashable, sorted query params for _build_url; None values are dropped like requests does."""
+    if not params:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in params.items() if v is not None))
+
+
 # Stopwords to ignore when matching recipe name by words (order doesn't matter)
 _RECIPE_NAME_STOPWORDS = frozenset({"a", "an", "and", "the", "with", "for", "or", "in", "on", "to"})
 
+# Standard nutrition key -> lowercased response fields to read it from, in
+# order (see _parse_nutrition_response). RecipeDB org API uses: Calories,
+# Protein (g), Carbohydrate, by difference (g), Total lipid (fat) (g),
+# Energy (kcal); all are mapped to the standard keys for health_scorer.
+_NUTRITION_FIELDS = (
+    ("calories", ("calories", "energy (kcal)")),
+    ("protein", ("protein", "protein (g)")),
+    ("carbs", ("carbohydrates", "carbs", "carbohydrate, by difference (g)")),
+    ("fat", ("fat", "total_fat", "total lipid (fat) (g)")),
+    ("saturated_fat", ("saturated_fat",)),
+    ("trans_fat", ("trans_fat",)),
+    ("sodium", ("sodium",)),
+    ("sugar", ("sugar", "sugars")),
+    ("cholesterol", ("cholesterol",)),
+    ("fiber", ("fiber", "dietary_fiber")),
+)
+
+# Standard micronutrient key -> response fields, first present wins
+# (see _parse_micro_nutrition_response)
+_VITAMIN_FIELDS = (
+    ("vitamin_a", ("vitamin_a",)),
+    ("vitamin_c", ("vitamin_c",)),
+    ("vitamin_d", ("vitamin_d",)),
+    ("vitamin_e", ("vitamin_e",)),
+    ("vitamin_k", ("vitamin_k",)),
+    ("thiamin", ("thiamin", "vitamin_b1")),
+    ("riboflavin", ("riboflavin", "vitamin_b2")),
+    ("niacin", ("niacin", "vitamin_b3")),
+    ("vitamin_b6", ("vitamin_b6",)),
+    ("folate", ("folate", "vitamin_b9")),
+    ("vitamin_b12", ("vitamin_b12",)),
+)
+_MINERAL_FIELDS = (
+    ("calcium", ("calcium",)),
+    ("iron", ("iron",)),
+    ("magnesium", ("magnesium",)),
+    ("phosphorus", ("phosphorus",)),
+    ("potassium", ("potassium",)),
+    ("zinc", ("zinc",)),
+    ("selenium", ("selenium",)),
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple):
+        """Return the cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Tuple, value) -> None:
+        """Cache value, evicting the least recently used entries past maxsize."""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Responses of deterministic lookups (recipe by ID, nutrition, cuisine/diet
+# searches), shared by every RecipeDBService instance
+_response_cache = _TTLCache(maxsize=500, ttl=3600)
+
+
+def _ttl_cached(kind: str, copy: bool = False):
+    """
+    Cache a single-argument lookup method in _response_cache, keyed on
+    (kind, argument). Empty results (None, [], {}) are not cached, so a
+    failed request is retried next time. With copy=True each caller gets
+    its own shallow copy (for dicts that callers modify).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, arg):
+            key = (kind, str(arg))
+            value = _response_cache.get(key)
+            if value is None:
+                value = method(self, arg)
+                if not value:
+                    return value
+                _response_cache.put(key, dict(value) if copy else value)
+            return dict(value) if copy else value
+        return wrapper
+    return decorator
+
+
 class RecipeDBService:
     """
     Service class for interacting with RecipeDB API.
@@ -58,7 +195,8 @@ class RecipeDBService:
         fallback = getattr(settings, "RECIPEDB_FALLBACK_BASE_URL", None)
         self.fallback_base_url = (fallback or "").strip().rstrip("/") or None
         self.max_retries = 3
-        self.retry_delay = 1  # seconds
+        self.retry_delay = 1  # seconds: backoff base
+        self.max_backoff = 30  # seconds: cap on a single retry wait
         # Cache: inline nutrition extracted from recipe2-api responses (keyed by recipe_id)
         self._inline_nutrition_cache: Dict[str, Dict] = {}
         # Rate limiting to avoid IP blocking
@@ -66,6 +204,45 @@ class RecipeDBService:
         self._max_search_pages = max(1, min(20, getattr(settings, "RECIPEDB_MAX_SEARCH_PAGES", 5)))
         self._rate_limit_lock = threading.Lock()
         self._last_request_time = 0.0
+        # Circuit breaker per endpoint: after breaker_threshold consecutive
+        # requests that exhausted their retries, skip the endpoint for
+        # breaker_cooldown seconds, then let one request probe it
+        self.breaker_threshold = 5
+        self.breaker_cooldown = 30.0  # seconds
+        self._breaker: Dict[str, Dict] = {}
+        self._breaker_lock = threading.Lock()
+        # Negative cache: (endpoint, params) -> monotonic expiry for lookups
+        # that came back 404 (e.g. an unknown title), so retrying
+        # the same miss doesn't re-issue the request; oldest entries first
+        self.negative_cache_ttl = 60  # seconds
+        self.negative_cache_max_size = 10_000
+        self._negative_cache: "OrderedDict[Tuple, float]" = OrderedDict()
+        self._negative_cache_lock = threading.Lock()
+        # Persistent session: keep-alive connections to the CosyLab hosts
+        # instead of a new TCP + TLS handshake per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        if self.api_key:
+            if self.use_bearer:
+                self.session.headers["Authorization"] = f"Bearer {self.api_key}"
+            else:
+                self.session.headers["x-api-key"] = self.api_key
+        # check_availability: probe timeout and how long its answer is reused
+        self.availability_timeout = 2  # seconds
+        self.availability_cache_ttl = 5.0  # seconds
+        self._available = False
+        self._availability_checked_at = float("-inf")
+        # Worker threads for fetch_full_recipe fan-out (within pool_maxsize)
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="recipedb")
+        # Recipe2 API always authenticates with x-api-key (None drops the
+        # session's Bearer header from those requests)
+        self._recipe2_headers = (
+            {"x-api-key": self.api_key, "Authorization": None}
+            if self.api_key and self.use_bearer else None
+        )
 
         logger.info(
             f"RecipeDB service initialized with base URL: {self.base_url} "
@@ -79,6 +256,11 @@ class RecipeDBService:
             logger.warning("CosyLab API key is NOT configured! Set COSYLAB_API_KEY in .env file")
             logger.warning("API requests may fail without authentication")
     
+    def close(self) -> None:
+        """Shut down the fan-out workers and close the HTTP session's pooled connections."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
     def _wait_rate_limit(self) -> None:
         """Enforce minimum delay between requests to avoid IP blocking. Thread-safe."""
         if self._rate_limit_delay <= 0:
@@ -91,6 +273,64 @@ class RecipeDBService:
             time.sleep(wait)
             logger.debug(f"Rate limit: waited {wait:.2f}s before RecipeDB request")
 
+    def _breaker_allows(self, endpoint: str) -> bool:
+        """False while the endpoint's circuit is open. Thread-safe."""
+        with self._breaker_lock:
+            state = self._breaker.get(endpoint)
+            if not state or state["opened_at"] is None:
+                return True
+            now = time.monotonic()
+            if now - state["opened_at"] < self.breaker_cooldown:
+                return False
+            # Half-open: this request probes the endpoint; others keep
+            # short-circuiting until it succeeds or another cooldown passes
+            state["opened_at"] = now
+            return True
+
+    def _breaker_record(self, endpoint: str, success: bool) -> None:
+        """Reset the endpoint's breaker on success; count a failure otherwise."""
+        with self._breaker_lock:
+            if success:
+                self._breaker.pop(endpoint, None)
+                return
+            state = self._breaker.setdefault(endpoint, {"fail_count": 0, "opened_at": None})
+            state["fail_count"] += 1
+            if state["fail_count"] >= self.breaker_threshold:
+                if state["opened_at"] is None:
+                    logger.warning(
+                        f"[COSYLAB API FALLBACK] RecipeDB endpoint '{endpoint}' failed "
+                        f"{state['fail_count']} times in a row; skipping it for "
+                        f"{self.breaker_cooldown}s"
+                    )
+                state["opened_at"] = time.monotonic()
+
+    @staticmethod
+    def _negative_cache_key(endpoint: str, params: Optional[Dict]) -> Tuple:
+        """Build a hashable negative-cache key from endpoint and query params."""
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+
+    def _is_negative_cached(self, key: Tuple) -> bool:
+        """Return True if this request recently came back 404 and hasn't expired."""
+        return self._negative_cache.get(key, 0) > time.monotonic()
+
+    def _remember_negative(self, key: Tuple) -> None:
+        """
+        Record a 404 result so identical requests are skipped for a while.
+
+        Entries are kept in insertion order, which (with one TTL) is expiry
+        order: expired entries are dropped from the front, then the oldest
+        live ones too while the cache exceeds negative_cache_max_size.
+        """
+        now = time.monotonic()
+        with self._negative_cache_lock:
+            self._negative_cache.pop(key, None)
+            self._negative_cache[key] = now + self.negative_cache_ttl
+            cache = self._negative_cache
+            while cache and (
+                len(cache) > self.negative_cache_max_size or next(iter(cache.values())) <= now
+            ):
+                cache.popitem(last=False)
+
     def _make_request(
         self,
         endpoint: str,
@@ -102,7 +342,9 @@ class RecipeDBService:
         
         Handles connection errors, timeouts, and HTTP errors with automatic
         retry mechanism. Implements exponential backoff for retries.
-        Respects RECIPEDB_RATE_LIMIT_DELAY between requests.
+        Respects RECIPEDB_RATE_LIMIT_DELAY between requests, and returns
+        None without a request while the endpoint's circuit breaker is open
+        or the same lookup came back 404 within negative_cache_ttl.
         
         Args:
             endpoint: API endpoint path (e.g., "recipe_by_title")
@@ -115,59 +357,59 @@ class RecipeDBService:
         Raises:
             No exceptions raised - errors are logged and None is returned
         """
+        negative_key = self._negative_cache_key(endpoint, params)
+        if self._is_negative_cached(negative_key):
+            logger.debug(f"Skipping {endpoint} with params {params}: recent 404 (negative cache)")
+            return None
+        if retry_count == 0 and not self._breaker_allows(endpoint):
+            logger.warning(f"RecipeDB endpoint '{endpoint}' circuit open, skipping request")
+            return None
         self._wait_rate_limit()
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            logger.info(f"Making API request to {url} with params: {params}")
-            logger.info(f"API Key present: {'Yes' if self.api_key else 'No'}")
-            
-            headers = {"Accept": "application/json"}
-            if self.api_key:
-                if self.use_bearer:
-                    headers["Authorization"] = f"Bearer {self.api_key}"
-                else:
-                    headers["x-api-key"] = self.api_key
-            else:
+            # Lazy %-formatting: the hot path pays nothing when INFO is off
+            logger.info("Making API request to %s with params: %s", url, params)
+            if not self.api_key:
                 logger.warning("No API key configured! Request may fail if API requires authentication.")
 
-            response = requests.get(
-                url,
-                params=params,
-                timeout=self.timeout,
-                headers=headers,
-            )
+            # Pre-encoded URL: requests skips its own per-call param encoding
+            request_url = _build_url(self.base_url, endpoint, _params_items(params))
+            response = self.session.get(request_url, timeout=self.timeout)
             
-            logger.info(f"API Response Status: {response.status_code}")
+            logger.info("API Response Status: %s", response.status_code)
             
             # Check for HTTP errors
             response.raise_for_status()
             
             # Parse JSON response
-            data = response.json()
-            logger.info(f"Request successful. Response size: {len(str(data))} bytes")
-            logger.debug(f"Response data preview: {str(data)[:200]}...")
+            data = _loads_json(response.content)
+            logger.info("Request successful. Response size: %d bytes", len(response.content))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response data preview: {response.content[:200]!r}...")
             
+            if endpoint in self._breaker:
+                self._breaker_record(endpoint, success=True)
             return data
             
         except requests.exceptions.Timeout:
             logger.warning(f"Request timeout for {url}")
-            out = self._try_fallback(url, endpoint, params, headers)
+            out = self._try_fallback(url, endpoint, params)
             if out is not None:
                 return out
             return self._handle_retry(endpoint, params, retry_count, "timeout")
             
         except requests.exceptions.ConnectionError:
             logger.warning(f"Connection error for {url}")
-            out = self._try_fallback(url, endpoint, params, headers)
+            out = self._try_fallback(url, endpoint, params)
             if out is not None:
                 return out
             return self._handle_retry(endpoint, params, retry_count, "connection_error")
             
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else None
+            status_code = e.response.status_code if e.response is not None else None
             logger.error(f"HTTP error for {url}: Status {status_code if status_code else 'unknown'}")
-            if e.response:
+            if e.response is not None:
                 try:
                     error_body = e.response.text[:500]
                     logger.error(f"Error response body: {error_body}")
@@ -176,7 +418,7 @@ class RecipeDBService:
             # 429 Rate Limit: retry with longer delay (respect Retry-After if present)
             if status_code == 429:
                 retry_after = None
-                if e.response and "Retry-After" in e.response.headers:
+                if e.response is not None and "Retry-After" in e.response.headers:
                     try:
                         retry_after = int(e.response.headers["Retry-After"])
                     except (ValueError, TypeError):
@@ -192,6 +434,10 @@ class RecipeDBService:
                         f"[COSYLAB API FALLBACK] RecipeDB endpoint '{endpoint}' returned 404 at {url}. "
                         "Endpoint may be unavailable."
                     )
+                    # A genuine miss: skip identical lookups for a while.
+                    # Other 4xx (401/403, bad params) are config errors and
+                    # must not outlive the fix
+                    self._remember_negative(negative_key)
                 else:
                     logger.error(
                         f"RecipeDB request failed with {status_code} at {url}. "
@@ -345,18 +591,18 @@ class RecipeDBService:
         _original_url: str,
         endpoint: str,
         params: Optional[Dict],
-        headers: Dict[str, str],
     ) -> Optional[Dict]:
         """If RECIPEDB_FALLBACK_BASE_URL is set, try one request with it. Return data or None."""
         if not self.fallback_base_url:
             return None
         url = f"{self.fallback_base_url}/{endpoint}"
         try:
-            logger.info(f"Trying fallback URL: {url}")
-            response = requests.get(url, params=params, timeout=self.timeout, headers=headers)
+            logger.info("Trying fallback URL: %s", url)
+            request_url = _build_url(self.fallback_base_url, endpoint, _params_items(params))
+            response = self.session.get(request_url, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
-            logger.info(f"Fallback request succeeded (response size: {len(str(data))} bytes)")
+            data = _loads_json(response.content)
+            logger.info("Fallback request succeeded (response size: %d bytes)", len(response.content))
             return data
         except Exception as e:
             logger.warning(f"Fallback request failed: {e}")
@@ -372,7 +618,9 @@ class RecipeDBService:
         """
         Handle retry logic for failed requests.
         
-        Implements exponential backoff strategy for retries.
+        Implements exponential backoff with "full jitter": the wait is drawn
+        uniformly from [0, min(retry_delay * 2**retry_count, max_backoff)], so
+        workers that failed together don't all retry at the same instant.
         
         Args:
             endpoint: API endpoint path
@@ -384,15 +632,17 @@ class RecipeDBService:
             Dict: Result of retry attempt, or None if max retries exceeded
         """
         if retry_count < self.max_retries:
-            wait_time = self.retry_delay * (2 ** retry_count)  # Exponential backoff
+            backoff_cap = min(self.retry_delay * (2 ** retry_count), self.max_backoff)
+            wait_time = random.uniform(0, backoff_cap)
             logger.info(
                 f"Retrying request (attempt {retry_count + 1}/{self.max_retries}) "
-                f"after {wait_time}s due to {error_type}"
+                f"after {wait_time:.2f}s (backoff cap {backoff_cap}s) due to {error_type}"
             )
             time.sleep(wait_time)
             return self._make_request(endpoint, params, retry_count + 1)
         else:
             logger.error(f"Max retries ({self.max_retries}) exceeded for {endpoint}")
+            self._breaker_record(endpoint, success=False)
             logger.warning(f"[COSYLAB API FALLBACK] RecipeDB endpoint '{endpoint}' failed after {self.max_retries} retries ({error_type}). Returning empty result.")
             return None
     
@@ -411,11 +661,10 @@ class RecipeDBService:
         params = {"title": title_query.strip(), "page": page, "limit": min(limit, 10)}
         self._wait_rate_limit()
         try:
-            headers = {"Accept": "application/json"}
-            if self.api_key:
-                headers["x-api-key"] = self.api_key
             logger.info(f"Recipe2 API search: {url} title={title_query}")
-            resp = requests.get(url, params=params, timeout=self.timeout, headers=headers)
+            resp = self.session.get(
+                url, params=params, timeout=self.timeout, headers=self._recipe2_headers
+            )
             # 404 means no recipe matched the query (not an error)
             if resp.status_code == 404:
                 logger.info(f"Recipe2 API: no results for '{title_query}' (404)")
@@ -678,6 +927,7 @@ class RecipeDBService:
                 f"{nutrition.get('calories', 0)} cal, {nutrition.get('protein', 0)}g protein"
             )
     
+    @_ttl_cached("nutrition", copy=True)
     def fetch_nutrition_info(self, recipe_id: str) -> Dict:
         """
         Get macronutrient data for a recipe.
@@ -763,46 +1013,26 @@ class RecipeDBService:
         Returns:
             Dict: Standardized nutrition data (calories, protein, carbs, fat, etc.)
         """
-        def _get(d: Dict, *keys, default=0):
-            """Get value by any of the keys (case-insensitive)."""
-            d_lower = {str(k).lower(): v for k, v in d.items()} if isinstance(d, dict) else {}
-            for key in keys:
-                k = str(key).lower()
-                if k in d_lower:
-                    try:
-                        v = d_lower[k]
-                        if v is None:
-                            continue
-                        return float(str(v).replace(",", ""))
-                    except (TypeError, ValueError):
-                        pass
-            return default
-
         # Handle nested response structure if present (e.g. response.nutrition vs flat recipe)
         data = response.get("nutrition", response)
         if not isinstance(data, dict):
             data = {}
+        # Lowercased view of the fields, built once for all lookups below
+        data_lower = {str(k).lower(): v for k, v in data.items()}
 
-        # RecipeDB org API uses: Calories, Protein (g), Carbohydrate, by difference (g),
-        # Total lipid (fat) (g), Energy (kcal). Map all to standard keys for health_scorer.
-        return {
-            "calories": _get(data, "calories", "energy (kcal)", default=0),
-            "protein": _get(data, "protein", "protein (g)", default=0),
-            "carbs": _get(
-                data,
-                "carbohydrates",
-                "carbs",
-                "carbohydrate, by difference (g)",
-                default=0,
-            ),
-            "fat": _get(data, "fat", "total_fat", "total lipid (fat) (g)", default=0),
-            "saturated_fat": _get(data, "saturated_fat", default=0),
-            "trans_fat": _get(data, "trans_fat", default=0),
-            "sodium": _get(data, "sodium", default=0),
-            "sugar": _get(data, "sugar", "sugars", default=0),
-            "cholesterol": _get(data, "cholesterol", default=0),
-            "fiber": _get(data, "fiber", "dietary_fiber", default=0),
-        }
+        def _get(*keys, default=0):
+            """Get value by any of the (lowercase) keys, case-insensitively."""
+            for key in keys:
+                v = data_lower.get(key)
+                if v is None:
+                    continue
+                try:
+                    return float(str(v).replace(",", ""))
+                except (TypeError, ValueError):
+                    pass
+            return default
+
+        return {name: _get(*keys) for name, keys in _NUTRITION_FIELDS}
     
     def fetch_micro_nutrition_info(self, recipe_id: str) -> Dict:
         """
@@ -878,27 +1108,13 @@ class RecipeDBService:
         
         return {
             "vitamins": {
-                "vitamin_a": float(vitamins.get("vitamin_a", 0)),
-                "vitamin_c": float(vitamins.get("vitamin_c", 0)),
-                "vitamin_d": float(vitamins.get("vitamin_d", 0)),
-                "vitamin_e": float(vitamins.get("vitamin_e", 0)),
-                "vitamin_k": float(vitamins.get("vitamin_k", 0)),
-                "thiamin": float(vitamins.get("thiamin", vitamins.get("vitamin_b1", 0))),
-                "riboflavin": float(vitamins.get("riboflavin", vitamins.get("vitamin_b2", 0))),
-                "niacin": float(vitamins.get("niacin", vitamins.get("vitamin_b3", 0))),
-                "vitamin_b6": float(vitamins.get("vitamin_b6", 0)),
-                "folate": float(vitamins.get("folate", vitamins.get("vitamin_b9", 0))),
-                "vitamin_b12": float(vitamins.get("vitamin_b12", 0))
+                name: float(next((vitamins[k] for k in keys if k in vitamins), 0))
+                for name, keys in _VITAMIN_FIELDS
             },
             "minerals": {
-                "calcium": float(minerals.get("calcium", 0)),
-                "iron": float(minerals.get("iron", 0)),
-                "magnesium": float(minerals.get("magnesium", 0)),
-                "phosphorus": float(minerals.get("phosphorus", 0)),
-                "potassium": float(minerals.get("potassium", 0)),
-                "zinc": float(minerals.get("zinc", 0)),
-                "selenium": float(minerals.get("selenium", 0))
-            }
+                name: float(next((minerals[k] for k in keys if k in minerals), 0))
+                for name, keys in _MINERAL_FIELDS
+            },
         }
     
     def search_by_calories(
@@ -998,6 +1214,7 @@ class RecipeDBService:
         logger.info(f"Found {len(recipes)} recipes in protein range")
         return recipes
     
+    @_ttl_cached("cuisine")
     def search_by_cuisine(self, cuisine: str) -> List[Dict]:
         """
         Find recipes by cuisine type using "Recipe By Cuisine" endpoint.
@@ -1034,6 +1251,7 @@ class RecipeDBService:
         logger.info(f"Found {len(recipes)} recipes for cuisine: {cuisine}")
         return recipes
     
+    @_ttl_cached("diet")
     def search_by_diet(self, diet_type: str) -> List[Dict]:
         """
         Find recipes by diet type using "Recipe By Recipe Diet" endpoint.
@@ -1071,13 +1289,13 @@ class RecipeDBService:
         logger.info(f"Found {len(recipes)} recipes for diet type: {diet_type}")
         return recipes
     
-    @lru_cache(maxsize=100)
+    @_ttl_cached("recipe")
     def get_recipe_by_id(self, recipe_id: str) -> Optional[Dict]:
         """
         Fetch complete recipe data by ID using "Recipe By Id" endpoint.
         
-        This method is cached to avoid redundant API calls for frequently
-        accessed recipes. Cache size is limited to 100 recipes.
+        Found recipes are cached for an hour, shared across service
+        instances (up to 500 cached lookups, see _response_cache).
         
         Args:
             recipe_id: Unique identifier for the recipe
@@ -1140,21 +1358,28 @@ class RecipeDBService:
         """
         Check if RecipeDB API is available and responding.
         
-        Used for health checks and monitoring. Makes a simple request
-        to verify API connectivity.
+        Used for health checks and monitoring. Sends a HEAD request to the
+        base URL (reachability plus headers, no recipe query) with its own
+        short timeout; the answer is reused for availability_cache_ttl
+        seconds to absorb bursts of health probes.
         
         Returns:
             bool: True if API is available, False otherwise
         """
+        now = time.monotonic()
+        if now - self._availability_checked_at < self.availability_cache_ttl:
+            return self._available
         try:
-            if self.use_bearer:
-                data = self._recipesinfo_request({"page": 1, "limit": 1})
-                return data is not None
-            response = self._make_request("recipe_by_id", {"id": "1"})
-            return response is not None
+            response = self.session.head(
+                self.base_url, timeout=self.availability_timeout, allow_redirects=False
+            )
+            available = response.status_code < 500
         except Exception as e:
             logger.error(f"RecipeDB availability check failed: {str(e)}")
-            return False
+            available = False
+        self._available = available
+        self._availability_checked_at = time.monotonic()
+        return available
     
     def search_by_utensils(self, utensils: str) -> List[Dict]:
         """
@@ -1329,11 +1554,96 @@ class RecipeDBService:
         logger.info(f"Found {len(recipes)} recipes in carbs range")
         return recipes
     
+    def fetch_full_recipe(self, recipe_id: str) -> Dict:
+        """
+        Fetch a recipe with its macro and micro nutrition, the three lookups
+        running in parallel over the pooled session.
+
+        Args:
+            recipe_id: Unique identifier for the recipe
+
+        Returns:
+            Dict: {"recipe": get_recipe_by_id result (None if not found),
+                   "macro": fetch_nutrition_info result (None if unavailable),
+                   "micro": fetch_micro_nutrition_info result}
+        """
+        recipe = self._executor.submit(self.get_recipe_by_id, recipe_id)
+        macro = self._executor.submit(self.fetch_nutrition_info, recipe_id)
+        micro = self._executor.submit(self.fetch_micro_nutrition_info, recipe_id)
+        try:
+            macro_data = macro.result()
+        except ValueError as e:
+            logger.warning(f"Nutrition unavailable for recipe {recipe_id}: {e}")
+            macro_data = None
+        return {"recipe": recipe.result(), "macro": macro_data, "micro": micro.result()}
+
+    # ─── Async variants ────────────────────────────────────────────────────
+    #
+    # For FastAPI handlers: each runs its sync counterpart in a worker thread
+    # (so the event loop isn't blocked on the network), and independent
+    # lookups can be overlapped with asyncio.gather over the pooled session.
+
+    async def afetch_recipe_by_name(self, recipe_name: str) -> Optional[Dict]:
+        """Async version of fetch_recipe_by_name."""
+        return await asyncio.to_thread(self.fetch_recipe_by_name, recipe_name)
+
+    async def afetch_nutrition_info(self, recipe_id: str) -> Dict:
+        """Async version of fetch_nutrition_info."""
+        return await asyncio.to_thread(self.fetch_nutrition_info, recipe_id)
+
+    async def afetch_micro_nutrition_info(self, recipe_id: str) -> Dict:
+        """Async version of fetch_micro_nutrition_info."""
+        return await asyncio.to_thread(self.fetch_micro_nutrition_info, recipe_id)
+
+    async def afetch_all_nutrition(self, recipe_id: str) -> Tuple[Dict, Dict]:
+        """
+        Macro and micro nutrition for a recipe, fetched concurrently.
+
+        Returns:
+            Tuple[Dict, Dict]: (fetch_nutrition_info, fetch_micro_nutrition_info)
+            results; raises like fetch_nutrition_info does
+        """
+        nutrition, micro_nutrition = await asyncio.gather(
+            self.afetch_nutrition_info(recipe_id),
+            self.afetch_micro_nutrition_info(recipe_id),
+        )
+        return nutrition, micro_nutrition
+
+    async def afetch_full_recipe(self, recipe_id: str) -> Dict:
+        """Async version of fetch_full_recipe."""
+        return await asyncio.to_thread(self.fetch_full_recipe, recipe_id)
+
+    async def aget_recipe_by_id(self, recipe_id: str) -> Optional[Dict]:
+        """Async version of get_recipe_by_id."""
+        return await asyncio.to_thread(self.get_recipe_by_id, recipe_id)
+
+    async def asearch_by_calories(self, min_cal: int, max_cal: int, limit: int = 10) -> List[Dict]:
+        """Async version of search_by_calories."""
+        return await asyncio.to_thread(self.search_by_calories, min_cal, max_cal, limit)
+
+    async def asearch_by_protein(self, min_protein: float, max_protein: float) -> List[Dict]:
+        """Async version of search_by_protein."""
+        return await asyncio.to_thread(self.search_by_protein, min_protein, max_protein)
+
+    async def asearch_by_cuisine(self, cuisine: str) -> List[Dict]:
+        """Async version of search_by_cuisine."""
+        return await asyncio.to_thread(self.search_by_cuisine, cuisine)
+
+    async def asearch_by_diet(self, diet_type: str) -> List[Dict]:
+        """Async version of search_by_diet."""
+        return await asyncio.to_thread(self.search_by_diet, diet_type)
+
+    async def asearch_by_carbs(self, min_carbs: float, max_carbs: float) -> List[Dict]:
+        """Async version of search_by_carbs."""
+        return await asyncio.to_thread(self.search_by_carbs, min_carbs, max_carbs)
+
     def clear_cache(self):
         """
-        Clear the LRU cache for get_recipe_by_id method.
+        Clear the cached recipe, nutrition, cuisine and diet lookups.
         
         Call this method if you need to force refresh of cached recipe data.
         """
-        self.get_recipe_by_id.cache_clear()
+        _response_cache.clear()
+        with self._negative_cache_lock:
+            self._negative_cache.clear()
         logger.info("RecipeDB cache cleared")
\ No newline at end of file
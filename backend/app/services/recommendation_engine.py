@@ -19,7 +19,7 @@ from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 
 from app.services.recipedb_service import RecipeDBService
-from app.services.health_scorer import HealthScorer
+from app.services.health_scorer import HealthScorer, micro_to_array, nutrition_to_array
 from app.utils.helpers import normalize_ingredient_name
 
 # Configure logging
@@ -399,41 +399,16 @@ class RecommendationEngine:
             f"Filtering {len(recipes)} recipes by min_health_score={min_score}"
         )
         
-        healthy_recipes = []
+        # Fetch nutrition for every candidate first, then score them in one batch
+        fetched = []
         
         for recipe in recipes:
             recipe_id = recipe.get("id")
             
             try:
-                # Fetch nutrition data
                 nutrition = self.recipedb_service.fetch_nutrition_info(recipe_id)
                 micro_nutrition = self.recipedb_service.fetch_micro_nutrition_info(recipe_id)
-                
-                # Calculate health score
-                health_score_obj = self.health_scorer.calculate_health_score(
-                    nutrition,
-                    micro_nutrition
-                )
-                
-                # Check if meets threshold
-                if health_score_obj.score >= min_score:
-                    # Add health score to recipe data
-                    recipe_with_score = recipe.copy()
-                    recipe_with_score["health_score"] = health_score_obj.score
-                    recipe_with_score["health_rating"] = health_score_obj.rating
-                    recipe_with_score["nutrition"] = nutrition
-                    
-                    healthy_recipes.append(recipe_with_score)
-                    
-                    logger.debug(
-                        f"Recipe {recipe.get('name', 'Unknown')} passed filter: "
-                        f"score={health_score_obj.score:.1f}"
-                    )
-                else:
-                    logger.debug(
-                        f"Recipe {recipe.get('name', 'Unknown')} filtered out: "
-                        f"score={health_score_obj.score:.1f} < {min_score}"
-                    )
+                fetched.append((recipe, nutrition, micro_nutrition))
             
             except Exception as e:
                 logger.warning(
@@ -442,6 +417,35 @@ class RecommendationEngine:
                 logger.warning(f"[COSYLAB API FALLBACK] RecipeDB nutrition fetch failed while scoring recipe '{recipe_id}' in health filter. Skipping this recipe.")
                 continue
         
+        healthy_recipes = []
+        scores, ratings = self.health_scorer.calculate_health_scores_batch(
+            nutrition_to_array(nutrition for _, nutrition, _ in fetched),
+            micro_to_array(micro for _, _, micro in fetched)
+        )
+        
+        for (recipe, nutrition, _), score, rating in zip(fetched, scores, ratings):
+            score = float(score)
+            
+            # Check if meets threshold
+            if score >= min_score:
+                # Add health score to recipe data
+                recipe_with_score = recipe.copy()
+                recipe_with_score["health_score"] = score
+                recipe_with_score["health_rating"] = str(rating)
+                recipe_with_score["nutrition"] = nutrition
+                
+                healthy_recipes.append(recipe_with_score)
+                
+                logger.debug(
+                    f"Recipe {recipe.get('name', 'Unknown')} passed filter: "
+                    f"score={score:.1f}"
+                )
+            else:
+                logger.debug(
+                    f"Recipe {recipe.get('name', 'Unknown')} filtered out: "
+                    f"score={score:.1f} < {min_score}"
+                )
+        
         logger.info(
             f"{len(healthy_recipes)} out of {len(recipes)} recipes passed filter"
         )
@@ -284,12 +284,11 @@ class SwapEngine:
         )
 
         original_name = target_flavor.get("ingredient", "")
-        original_molecules = [
-            m.get("common_name") or m.get("name", "")
-            for m in target_flavor.get("molecules", [])
-        ]
         substitute_options = []
 
+        # Warm the profile cache concurrently before the per-candidate loop
+        self.flavordb_service.prefetch_profiles([original_name] + list(candidates))
+
         for candidate in candidates:
             if normalize_ingredient_name(candidate) == \
                normalize_ingredient_name(original_name):
@@ -302,14 +301,8 @@ class SwapEngine:
                 )
 
                 # 2. Find shared molecules for explainability
-                cand_profile = self.flavordb_service.get_flavor_profile_by_ingredient(candidate)
-                cand_molecules = [
-                    m.get("common_name") or m.get("name", "")
-                    for m in cand_profile.get("molecules", [])
-                ]
-                shared_molecules = sorted(
-                    set(m.lower() for m in original_molecules if m)
-                    & set(m.lower() for m in cand_molecules if m)
+                shared_molecules = self.flavordb_service.get_shared_molecules(
+                    original_name, candidate
                 )
 
                 # 3. Health improvement estimate
@@ -0,0 +1,105 @@
+"""
+Persistent cache of LLM agent tool results.
+
+FlavorDB and RecipeDB lookups are effectively static (the molecules in
+butter don't change), so when LLM_TOOL_CACHE_PATH is set LLMSwapAgent
+keeps tool results that carry real data in a small SQLite database shared
+by all worker processes and kept across restarts. Empty or outage answers
+are never stored (see llm_swap_agent._has_payload). Entries older than
+max_age_days are ignored and purged on open.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value) -> bytes:
+    """Canonical JSON bytes (sorted keys), with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        # default=float covers NumPy scalars, which orjson doesn't take natively
+        return orjson.dumps(value, default=float, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(data: bytes):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+class ToolResultStore:
+    """SQLite-backed (WAL mode) tool-result cache, safe to share between threads."""
+
+    def __init__(self, path: str, max_age_days: float = 7):
+        """
+        Open (creating if needed) the cache database at path.
+
+        Raises:
+            sqlite3.Error, OSError: If the database can't be opened
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = int(max_age_days * 86400)
+        # One connection guarded by a lock: lookups are tiny and the agent
+        # calls from several tool-worker threads
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache(k TEXT PRIMARY KEY, v BLOB, ts INTEGER)"
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE ts < ?", (int(time.time()) - self.max_age,)
+            )
+
+    @staticmethod
+    def key(function_name: str, args: Mapping) -> str:
+        """Cache key for a tool call: a hash of its name and canonical args."""
+        return hashlib.blake2b(
+            function_name.encode("utf-8") + b"\0" + _encode(dict(args)), digest_size=16
+        ).hexdigest()
+
+    def get(self, function_name: str, args: Mapping) -> Optional[Dict]:
+        """Return the stored result for a tool call, or None if absent or expired."""
+        try:
+            key = self.key(function_name, args)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT v FROM cache WHERE k = ? AND ts >= ?",
+                    (key, int(time.time()) - self.max_age),
+                ).fetchone()
+            return _decode(row[0]) if row else None
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug("Tool cache read failed for %s: %s", function_name, e)
+            return None
+
+    def put(self, function_name: str, args: Mapping, result: Dict) -> None:
+        """Store a tool result; failures are logged and otherwise ignored."""
+        try:
+            key = self.key(function_name, args)
+            value = _encode(result)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache(k, v, ts) VALUES (?, ?, ?)",
+                    (key, value, int(time.time())),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug("Tool cache write failed for %s: %s", function_name, e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
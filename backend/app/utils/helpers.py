@@ -7,6 +7,7 @@ formatting, and data manipulation used throughout the application.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from app.utils.constants import INGREDIENT_CATEGORY_KEYWORDS
@@ -71,12 +72,14 @@ def calculate_percentage_of_calories(
     return round(percentage, 2)
 
 
+@lru_cache(maxsize=4096)
 def categorize_ingredient(ingredient: str) -> str:
     """
     Determine ingredient category based on name.
     
     Uses keyword matching to classify ingredients into predefined categories.
-    Returns "other" if no category match is found.
+    Returns "other" if no category match is found. Results are memoized,
+    since the analyzer categorizes the same names across detection passes.
     
     Args:
         ingredient: Ingredient name (normalized or raw)
@@ -108,10 +111,14 @@ def categorize_ingredient(ingredient: str) -> str:
     return "other"
 
 
+@lru_cache(maxsize=4096)
 def normalize_ingredient_name(ingredient: str) -> str:
     """
     Standardize ingredient names for consistent matching.
     
+    Results are memoized: recipes repeat the same ingredient strings, and
+    the regex passes below dominate the cost of every lookup.
+    
     Performs the following normalization:
     1. Convert to lowercase
     2. Remove leading/trailing whitespace
@@ -124,7 +131,8 @@ def normalize_ingredient_name(ingredient: str) -> str:
         ingredient: Raw ingredient string
         
     Returns:
-        str: Normalized ingredient name
+        str: Normalized ingredient name (always lower-case; callers rely on
+        this and do not lower-case again)
         
     Example:
         >>> normalize_ingredient_name("2 cups Fresh Chopped Tomatoes")